@@ -0,0 +1,119 @@
+"""
+Cold-start benchmark: import-time profile of the app's startup modules
+
+Usage:
+    python benchmarks/bench_cold_start.py [--runs N] [--budget-ms MS]
+
+The startup modules are the project modules app.py imports at the top
+level, read from its source so the list can't go stale. They are
+imported in app.py's order in a fresh interpreter with `-X importtime`;
+each module is charged what it newly imports, so shared dependencies are
+counted once. Reports the median per module and in total, and fails if
+any heavy dependency (pandas, textblob, nltk, groq) is imported eagerly
+or the total exceeds the budget.
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+
+def startup_modules(entry_point="app.py"):
+    """Project modules imported at the top level of the entry point, in order"""
+    with open(os.path.join(ROOT, entry_point), 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    modules = []
+    for name in names:
+        path = os.path.join(ROOT, *name.split('.'))
+        if (os.path.exists(path + '.py') or os.path.isdir(path)) and name not in modules:
+            modules.append(name)
+    return modules
+
+
+STARTUP_MODULES = startup_modules()
+
+# Must only be imported on first use, never at startup
+HEAVY_MODULES = ["pandas", "textblob", "nltk", "groq"]
+
+
+def import_times_us(modules):
+    """
+    Import modules in order in a fresh interpreter
+
+    Returns:
+        dict: module -> cumulative microseconds of what it newly imported
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "".join(f"import {m}\n" for m in modules)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"startup imports failed:\n{result.stderr[-2000:]}")
+
+    times = dict.fromkeys(modules, 0)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        # Top-level entries only: nested imports are indented, and a module
+        # already imported by an earlier one has no entry of its own
+        if len(parts) == 3 and parts[2][1:] in times:
+            times[parts[2][1:]] = int(parts[1])
+    return times
+
+
+def eagerly_imported_heavy_modules():
+    """Heavy modules present in sys.modules after importing the startup path"""
+    code = (
+        "import sys\n"
+        + "".join(f"import {m}\n" for m in STARTUP_MODULES)
+        + f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help="Fail if the summed median import time exceeds this")
+    args = parser.parse_args()
+
+    runs = [import_times_us(STARTUP_MODULES) for _ in range(args.runs)]
+    for module in STARTUP_MODULES:
+        median_ms = statistics.median(run[module] for run in runs) / 1000
+        print(f"{module:28s} {median_ms:8.1f} ms")
+    total_ms = statistics.median(sum(run.values()) for run in runs) / 1000
+    print(f"{'total':28s} {total_ms:8.1f} ms")
+
+    failed = False
+    heavy = eagerly_imported_heavy_modules()
+    if heavy:
+        print(f"FAIL: imported at startup: {', '.join(heavy)}")
+        failed = True
+    else:
+        print("heavy modules deferred: " + ", ".join(HEAVY_MODULES))
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"FAIL: startup imports exceed budget of {args.budget_ms:.0f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
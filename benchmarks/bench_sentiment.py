@@ -0,0 +1,119 @@
+"""
+Sentiment benchmark: built-in lexicon engine vs TextBlob
+
+Usage:
+    python benchmarks/bench_sentiment.py [--rounds N]
+
+Reports per-message latency for both engines, the speedup and how often
+the two agree on the sentiment label. TextBlob is only needed for the
+comparison; without it the built-in engine is timed alone.
+
+Both engines are timed without the sentiment memo and with the shared
+message-analysis cache cleared before every call, so every message is
+tokenized and scored; memo hits are timed separately and don't count
+toward the speedup.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.preprocessing import analyze_message  # noqa: E402
+from utils.sentiment_analyzer import SentimentAnalyzer  # noqa: E402
+from utils.sentiment_memo import SentimentMemo  # noqa: E402
+
+REQUIRED_SPEEDUP = 10.0
+
+MESSAGES = [
+    "Prateek Ray",
+    "prateekray534@gmail.com",
+    "5",
+    "I have about 3 years of experience",
+    "Noida, Uttar Pradesh, India",
+    "Python, Django, PostgreSQL, Docker, AWS",
+    "I'm really excited about this opportunity!",
+    "Thanks, I appreciate the clear questions",
+    "This is quite difficult, I'm not sure how to answer",
+    "I don't know, maybe I would use a dictionary?",
+    "Honestly I'm a bit nervous about the technical part",
+    "That question was confusing and I'm frustrated",
+    "I love working with React and TypeScript, it's a great stack",
+    "The project was a terrible mess at first but we fixed it",
+    "I handle errors using try except blocks and structured logging in production",
+    "I would use an LRU cache with a size limit and time based expiry",
+    "Not a bad question, but I think the answer depends on the workload",
+    "It was hard, but the team was wonderful and we shipped on time",
+    "I guess I'd profile it first and then optimize the slow queries",
+    "Perfect, let's continue",
+]
+
+
+class TextBlobScorer:
+    """Scores messages the way SentimentAnalyzer did before the built-in engine"""
+
+    def __init__(self):
+        from textblob import TextBlob
+        self.TextBlob = TextBlob
+        self.analyzer = SentimentAnalyzer()
+
+    def label(self, text):
+        analyze_message.cache_clear()
+        blob = self.TextBlob(text.lower())
+        emotions = self.analyzer.engine.detect_emotions(text)
+        return self.analyzer._classify_sentiment(blob.sentiment.polarity, emotions)
+
+
+def time_per_message(fn, messages, rounds):
+    """Average seconds per message"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for message in messages:
+            fn(message)
+    return (time.perf_counter() - start) / (rounds * len(messages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    # A private memo, so the shared one's contents don't affect the memo timing
+    analyzer = SentimentAnalyzer(memo=SentimentMemo())
+
+    def native(text):
+        # Scores without the memo or the analysis cache: every call tokenizes and scores
+        analyze_message.cache_clear()
+        return analyzer._score(text)['sentiment']
+
+    def memoized(text):
+        analyzer.sentiment_history.clear()
+        return analyzer.analyze_sentiment(text)['sentiment']
+
+    native_time = time_per_message(native, MESSAGES, args.rounds)
+    print(f"built-in engine: {native_time * 1e6:8.1f} us/message")
+    for message in MESSAGES:
+        memoized(message)
+    memo_time = time_per_message(memoized, MESSAGES, args.rounds)
+    print(f"memo hit:        {memo_time * 1e6:8.1f} us/message (not part of the comparison)")
+
+    try:
+        textblob = TextBlobScorer()
+    except ImportError:
+        print("textblob not installed; skipping comparison")
+        return 0
+
+    textblob_time = time_per_message(textblob.label, MESSAGES, max(1, args.rounds // 10))
+    print(f"textblob:        {textblob_time * 1e6:8.1f} us/message")
+
+    speedup = textblob_time / native_time
+    agreement = sum(native(m) == textblob.label(m) for m in MESSAGES) / len(MESSAGES)
+    print(f"speedup:         {speedup:8.1f}x (required {REQUIRED_SPEEDUP:.0f}x)")
+    print(f"label agreement: {agreement:8.0%}")
+
+    return 0 if speedup >= REQUIRED_SPEEDUP else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
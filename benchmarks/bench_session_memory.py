@@ -0,0 +1,128 @@
+"""
+Session memory benchmark: per-session footprint at many concurrent interviews
+
+Usage:
+    python benchmarks/bench_session_memory.py [--sessions N]
+
+Runs N complete interviews on the fallback templates, then measures the
+memory each session holds with the turn log against the layout it
+replaced: the transcript and the LLM context as separate lists of dicts
+and a copy of the context in the candidate data.
+
+The session store's cache of each last snapshot is reported on its own
+line: a decoded dict tree against the encoded bytes it keeps now.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from utils.interview_engine import InterviewEngine  # noqa: E402
+from utils.session_store import encode_snapshot  # noqa: E402
+
+ANSWERS = [
+    "I would start by profiling the slow path and then cache the hot queries.",
+    "Generators are lazy, so they keep memory flat for large inputs.",
+    "I use fixtures for the database and mock only the external services.",
+    "Honestly I'm not sure, maybe an index on the foreign key would help?",
+    "We shipped it behind a feature flag and rolled it out gradually.",
+]
+
+
+def run_interview(engine, rng, number):
+    """Run one complete interview and return its state"""
+    state = engine.new_state()
+    engine.start(state)
+    name = ''.join(rng.choice('aeioulmnrst') for _ in range(rng.randint(4, 9))).title()
+    for message in [f"{name} Sharma", f"candidate{number}@example.com",
+                    "+1 555 010 2030", str(rng.randint(1, 15)), "Backend Engineer",
+                    "Bengaluru, India", "Python, Django, PostgreSQL"]:
+        engine.handle_message(state, message)
+    for _ in range(20):
+        if state.complete:
+            break
+        engine.handle_message(state, rng.choice(ANSWERS) + f" ({number})")
+    return state
+
+
+def deep_size(obj, seen=None):
+    """Bytes held by an object graph (shared objects counted once)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += deep_size(vars(obj), seen)
+    if hasattr(type(obj), '__slots__'):
+        for cls in type(obj).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if hasattr(obj, slot):
+                    size += deep_size(getattr(obj, slot), seen)
+    return size
+
+
+def legacy_session(state):
+    """The same session in the previous layout (message strings shared, as before)"""
+    messages = [{'role': turn.role, 'content': turn.content} for turn in state.turns]
+    context = [{'role': turn.role, 'content': turn.content}
+               for turn in state.turns if turn.in_context][-Config.MAX_CONTEXT_LENGTH:]
+    candidate_data = dict(state.candidate_data, conversation_history=list(context))
+    return {'messages': messages, 'context': context, 'candidate_data': candidate_data,
+            'sentiment_history': state.sentiment_history}
+
+
+def current_session(state):
+    """The same parts of the session now"""
+    return {'turns': state.turns, 'candidate_data': state.candidate_data,
+            'sentiment_history': state.sentiment_history}
+
+
+def store_cache(state):
+    """The store's cached last snapshot: as a dict tree, and as encoded bytes"""
+    snapshot = state.to_dict()
+    return json.loads(json.dumps(snapshot)), encode_snapshot(snapshot)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=1000)
+    args = parser.parse_args()
+
+    engine = InterviewEngine()
+    # Post-interview tasks don't stay in session memory; skip their file writes
+    engine.submit_post_interview = lambda state: None
+    rng = random.Random(7)
+    states = [run_interview(engine, rng, i) for i in range(args.sessions)]
+
+    state_before = state_after = cache_tree = cache_encoded = 0
+    for state in states:
+        seen = {id(turn.content) for turn in state.turns}
+        # Message strings are the same objects in both layouts; count them in neither
+        state_before += deep_size(legacy_session(state), set(seen))
+        state_after += deep_size(current_session(state), set(seen))
+        tree, encoded = store_cache(state)
+        cache_tree += deep_size(tree)
+        cache_encoded += deep_size(encoded)
+
+    turns = sum(len(state.turns) for state in states) / len(states)
+    print(f"{args.sessions} sessions, {turns:.0f} messages each (message text excluded from state)")
+    print(f"{'':22} {'before':>10} {'after':>10} {'reduction':>10}")
+    for label, before, after in (('session state', state_before, state_after),
+                                 ('store cache', cache_tree, cache_encoded)):
+        print(f"{label:22} {before / args.sessions:8.0f} B {after / args.sessions:8.0f} B "
+              f"{1 - after / before:10.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Tech suggestion benchmark: matching index latency on a large taxonomy
+
+Usage:
+    python benchmarks/bench_tech_index.py [--size N]
+
+Builds the matching index over the real taxonomy padded with synthetic
+technology names up to --size entries and times typo-tolerant lookups.
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.tech_index import TechMatchIndex  # noqa: E402
+from utils.taxonomy import TechTaxonomy  # noqa: E402
+
+QUERIES = ["Pyhton", "Kubernets", "reactjs", "Postgre", "djnago", "TypeScirpt",
+           "kube", "Terraform", "mongo", "Elasticsearh", "Rust", "xyzzy"]
+
+
+def synthetic_entries(count, seed=7):
+    """Random pronounceable technology names"""
+    rng = random.Random(seed)
+    for i in range(count):
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12)))
+        yield f"{name}{i}", name.title()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    entries = list(TechTaxonomy.default().match_entries())
+    entries += list(synthetic_entries(max(0, args.size - len(entries))))
+
+    start = time.perf_counter()
+    index = TechMatchIndex(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"entries: {len(index.terms)}  build: {build_ms:.1f} ms")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            suggestion = index.suggest(query)
+        per_call_us = (time.perf_counter() - start) / args.rounds * 1e6
+        print(f"{query:14s} -> {str(suggestion):14s} {per_call_us:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
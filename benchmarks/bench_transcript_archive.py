@@ -0,0 +1,132 @@
+"""
+Transcript archive benchmark: compression ratio and read latency against plain .txt files
+
+Usage:
+    python benchmarks/bench_transcript_archive.py [--transcripts N] [--reads N] [--source DIR]
+
+Writes N transcripts the way the app exports them (complete interviews on
+the fallback templates, across all languages) to a temporary directory,
+or uses the transcript_*.txt files in --source. Then it compares the bytes
+stored and the latency of reading one transcript at random for: the
+plain files, each file zlib-compressed on its own, and the archive
+(migration included) with every available codec.
+"""
+import argparse
+import glob
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from utils.data_handler import ConversationExporter  # noqa: E402
+from utils.interview_engine import InterviewEngine  # noqa: E402
+from utils.transcript_archive import TranscriptArchive, migrate, _zstandard  # noqa: E402
+
+ANSWERS = [
+    "I would start by profiling the slow path and then cache the hot queries.",
+    "Generators are lazy, so they keep memory flat for large inputs.",
+    "I use fixtures for the database and mock only the external services.",
+    "Honestly I'm not sure, maybe an index on the foreign key would help?",
+    "We shipped it behind a feature flag and rolled it out gradually.",
+]
+STACKS = ["Python, Django, PostgreSQL", "JavaScript, React, Node.js", "Java, Spring, Docker",
+          "Go, Kubernetes, AWS", "TypeScript, Angular, MongoDB"]
+
+
+def write_transcripts(directory, count, rng):
+    """Run count interviews and export their transcripts"""
+    engine = InterviewEngine()
+    engine.submit_post_interview = lambda state: None
+    for number in range(count):
+        state = engine.new_state(language=rng.choice(Config.SUPPORTED_LANGUAGES))
+        engine.start(state)
+        name = ' '.join(''.join(rng.choice('aeioulmnrst') for _ in range(rng.randint(4, 8))).title()
+                        for _ in range(2))
+        for message in [name, f"candidate{number}@example.com", "+1 555 010 2030",
+                        str(rng.randint(1, 15)), "Backend Engineer", "Bengaluru, India", rng.choice(STACKS)]:
+            engine.handle_message(state, message)
+        for _ in range(20):
+            if state.complete:
+                break
+            engine.handle_message(state, rng.choice(ANSWERS))
+        candidate = dict(state.candidate_data, technical_responses=state.technical_answers,
+                         sentiment_summary="Neutral conversation tone")
+        filename = os.path.join(directory, "transcript_{}_{}.txt".format(
+            name.replace(' ', '_'), time.strftime("%Y%m%d_%H%M%S", time.localtime(1760000000 + number))))
+        ConversationExporter.export_conversation(state.turns.messages(), candidate, filename)
+
+
+def read_latency(read, keys, rng, reads):
+    """Median and p95 microseconds to read one item chosen at random"""
+    samples = []
+    for _ in range(reads):
+        key = rng.choice(keys)
+        start = time.perf_counter()
+        read(key)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def read_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--transcripts', type=int, default=500)
+    parser.add_argument('--reads', type=int, default=500)
+    parser.add_argument('--source', help="directory with transcript_*.txt files to use instead")
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = args.source
+        if source is None:
+            source = os.path.join(workdir, 'txt')
+            os.makedirs(source)
+            write_transcripts(source, args.transcripts, rng)
+        paths = sorted(glob.glob(os.path.join(source, 'transcript_*.txt')))
+        if not paths:
+            print(f"No transcript_*.txt files in {source}")
+            return 1
+        texts = {path: read_file(path) for path in paths}
+        original = sum(os.path.getsize(path) for path in paths)
+        print(f"{len(paths)} transcripts, {original / 1024:.0f} KB, {original / len(paths):.0f} B average")
+
+        rows = [('plain .txt', original, 0.0, read_latency(read_file, paths, rng, args.reads))]
+
+        frames = {path: zlib.compress(text.encode('utf-8'), 9) for path, text in texts.items()}
+        rows.append(('zlib per file', sum(len(f) for f in frames.values()), 0.0,
+                     read_latency(lambda p: zlib.decompress(frames[p]).decode('utf-8'), paths, rng, args.reads)))
+
+        codecs = ['zlib'] + (['zstd'] if _zstandard() is not None else [])
+        for codec in codecs:
+            archive = TranscriptArchive(os.path.join(workdir, f'{codec}.archive'),
+                                        os.path.join(workdir, f'{codec}.db'))
+            start = time.perf_counter()
+            archive.train([texts[p] for p in paths[::max(1, len(paths) // Config.TRANSCRIPT_DICT_SAMPLES)]],
+                          codec=codec)
+            migrate(archive, source)
+            seconds = time.perf_counter() - start
+            ids = [row['id'] for row in archive.find()]
+            assert all(archive.get(row['id']) == texts[row['source']] for row in archive.find()), codec
+            rows.append((f'archive ({codec}+dict)', archive.stats()['stored_bytes'], seconds,
+                         read_latency(archive.get, ids, rng, args.reads)))
+
+    print(f"{'':22} {'stored':>10} {'ratio':>7} {'migrate':>9} {'read p50':>10} {'read p95':>10}")
+    for label, stored, seconds, (p50, p95) in rows:
+        print(f"{label:22} {stored / 1024:8.0f} KB {original / stored:6.1f}x {seconds:8.2f}s "
+              f"{p50:8.0f} us {p95:8.0f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
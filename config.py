@@ -23,8 +23,51 @@ class Config:
     MAX_CONTEXT_LENGTH = 10  # Number of previous messages to maintain
     TEMPERATURE = 0.7  # Balance between creativity and consistency
     MAX_TOKENS = 1024
-    
+
+    # Model Routing
+    # Each call site picks a route; a route maps to a model tier and a token budget.
+    # If the primary model's observed p95 latency exceeds the route's SLO (seconds),
+    # calls are sent to the faster fallback model until the primary recovers.
+    GROQ_FAST_MODEL = "llama-3.1-8b-instant"
+    MODEL_ROUTES = {
+        "default": {
+            "model": GROQ_MODEL, "max_tokens": MAX_TOKENS,
+            "fallback_model": GROQ_FAST_MODEL, "latency_slo": 5.0
+        },
+        "greeting": {
+            "model": GROQ_FAST_MODEL, "max_tokens": 200,
+            "fallback_model": None, "latency_slo": 2.0
+        },
+        "closing": {
+            "model": GROQ_FAST_MODEL, "max_tokens": 200,
+            "fallback_model": None, "latency_slo": 2.0
+        },
+        "tech_questions": {
+            "model": GROQ_MODEL, "max_tokens": 800,
+            "fallback_model": GROQ_FAST_MODEL, "latency_slo": 6.0
+        },
+        "answer_scoring": {
+            "model": GROQ_MODEL, "max_tokens": 600,
+            "fallback_model": GROQ_FAST_MODEL, "latency_slo": 8.0
+        },
+        "connection_test": {
+            "model": GROQ_FAST_MODEL, "max_tokens": 10,
+            "fallback_model": None, "latency_slo": 2.0
+        }
+    }
+    ROUTE_LATENCY_WINDOW = 50  # Latency samples kept per route/model for p95
+    ROUTE_MIN_SAMPLES = 5  # Samples needed before p95 is trusted
+    ROUTE_PROBE_INTERVAL = 10  # While degraded, every Nth call still probes the primary
+
+    # Circuit Breaker
+    # After repeated errors or slow calls the LLM path is skipped and local
+    # templates are served instantly until a half-open probe succeeds.
+    CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive failures before the circuit opens
+    CIRCUIT_LATENCY_THRESHOLD = 10.0  # Seconds; slower calls count as failures
+    CIRCUIT_RESET_TIMEOUT = 30.0  # Seconds the circuit stays open before probing
+
     # Tech Stack Categories (for validation and suggestions)
+    # Each technology is listed once, under its primary category
     TECH_CATEGORIES = {
         "languages": [
             "Python", "JavaScript", "Java", "C++", "C#", "Go", "Rust", 
@@ -40,7 +83,8 @@ class Config:
         ],
         "databases": [
             "PostgreSQL", "MySQL", "MongoDB", "Redis", "Cassandra",
-            "SQLite", "Oracle", "DynamoDB", "Elasticsearch"
+            "SQLite", "Oracle", "DynamoDB", "Elasticsearch",
+            "SQL"  # The language, listed so stacks naming it are recognised
         ],
         "cloud": [
             "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform",
@@ -51,22 +95,149 @@ class Config:
             "NumPy", "OpenCV", "Hugging Face", "LangChain"
         ],
         "mobile": [
-            "React Native", "Flutter", "Swift", "Kotlin", "Ionic"
+            "React Native", "Flutter", "Ionic"
         ],
         "tools": [
             "Git", "Jira", "Linux", "Postman", "VS Code", "IntelliJ"
         ]
     }
     
+    # Alternative spellings resolved to the canonical names above. Only
+    # unambiguous spellings belong here: "spring" or "tf" could mean other
+    # technologies, so those are left to the tech index's suggestions
+    TECH_ALIASES = {
+        "Python": ["python3", "py"],
+        "JavaScript": ["js", "java script", "ecmascript"],
+        "TypeScript": ["ts"],
+        "C++": ["cpp"],
+        "C#": ["csharp", "c sharp"],
+        "Go": ["golang"],
+        "React": ["reactjs", "react.js"],
+        "Vue.js": ["vue", "vuejs"],
+        "Angular": ["angularjs", "angular.js"],
+        "Next.js": ["nextjs"],
+        "Nuxt.js": ["nuxt", "nuxtjs"],
+        "HTML": ["html5"],
+        "CSS": ["css3"],
+        "Tailwind CSS": ["tailwind"],
+        "Material-UI": ["mui"],
+        "Node.js": ["node", "nodejs"],
+        "Express.js": ["express", "expressjs"],
+        ".NET": ["dotnet", ".net core", "asp.net"],
+        "Ruby on Rails": ["rails", "ror"],
+        "PostgreSQL": ["postgres", "postgre", "psql"],
+        "MongoDB": ["mongo"],
+        "Elasticsearch": ["elastic"],
+        "DynamoDB": ["dynamo"],
+        "AWS": ["amazon web services"],
+        "Azure": ["microsoft azure"],
+        "GCP": ["google cloud", "google cloud platform"],
+        "Kubernetes": ["k8s", "kube"],
+        "PyTorch": ["torch"],
+        "scikit-learn": ["sklearn"],
+        "OpenCV": ["cv2"],
+        "Hugging Face": ["huggingface"],
+        "React Native": ["rn"],
+        "VS Code": ["vscode", "visual studio code"],
+        "IntelliJ": ["intellij idea"]
+    }
+    
+    # Sentiment engine: "lexicon" (built-in, no downloads) or "textblob" (optional dependency)
+    SENTIMENT_ENGINE = os.getenv("SENTIMENT_ENGINE", "lexicon")
+    SENTIMENT_BATCH_CHUNK_SIZE = 500  # Messages per chunk in batch scoring
+    SENTIMENT_BATCH_WORKERS = os.cpu_count() or 1  # Processes for batch scoring
+    SENTIMENT_HISTORY_SIZE = 50  # Recent results kept per session (aggregates cover all)
+    SENTIMENT_MEMO_SIZE = 2048  # Cached results for repeated messages (shared by sessions)
+    PREPROCESS_CACHE_SIZE = 1024  # Cached message analyses shared by per-turn checks
+    
     # Exit keywords
     EXIT_KEYWORDS = [
         "exit", "quit", "bye", "goodbye", "end", "stop", 
         "terminate", "close", "leave", "done"
     ]
     
+    # Worker threads shared across sessions for work that overlaps a turn
+    TURN_WORKERS = 8
+    
+    # Technical questions: one LLM call per technology, issued concurrently
+    QUESTION_COUNT_MIN = 3
+    QUESTION_COUNT_MAX = 5
+    QUESTION_WORKERS = 16  # Concurrent question calls across sessions
+    PENDING_QUESTION_SESSIONS = 1024  # Sessions whose remaining questions are still being generated
+    
+    # Precomputed question bank (utils/question_bank.py)
+    QUESTION_BANK_PATH = "data/question_bank.db"
+    QUESTION_BANK_TARGET = 12  # Questions kept per (technology, difficulty band, language)
+    QUESTION_BANK_BUILD_WORKERS = 4  # Concurrent LLM calls during an offline build
+    
+    # Background answer scoring (utils/answer_scoring.py)
+    SCORING_BATCH_SIZE = 5  # Answers per LLM request
+    SCORING_BATCH_WAIT = 0.5  # Seconds an answer waits for others to share its request
+    SCORING_WORKERS = 4  # Concurrent scoring requests
+    PENDING_SCORE_SESSIONS = 1024  # Sessions whose answers are still being scored
+    SCORING_WAIT = 30  # Seconds the post-interview task waits for in-flight scores
+    
+    # Greeting/closing variants and warm-up (utils/response_cache.py)
+    RESPONSE_CACHE_PATH = "data/response_cache.db"
+    RESPONSE_CACHE_VARIANTS = 3  # Variants kept per kind and language
+    WARMUP_ON_BOOT = os.getenv("WARMUP_ON_BOOT", "false").lower() == "true"
+    WARMUP_WORKERS = 4  # Concurrent LLM calls during a warm-up
+    WARMUP_CALLS_PER_MINUTE = 30  # Keeps a warm-up inside the API rate limit
+    WARMUP_MAX_CALLS = 200  # Call budget per warm-up
+    WARMUP_TOP_STACKS = 10  # Most common stack/band combinations whose questions are warmed
+    
+    # Interview languages (templates in utils/resources/templates)
+    SUPPORTED_LANGUAGES = ["English", "Hindi", "Spanish", "French", "German"]
+    
+    # API server (server.py)
+    SERVER_WORKERS = 64  # Threads running interview turns (turns block on the LLM)
+    SESSION_IDLE_TIMEOUT = 1800  # Seconds before an idle interview is dropped
+    SERVER_MAX_MESSAGE_LENGTH = 4000
+    
+    # Interview session snapshots (utils/session_store.py)
+    SESSION_STORE = os.getenv("SESSION_STORE", "sqlite")  # "sqlite" or "file"
+    SESSION_STORE_PATH = "data/sessions.db"
+    SESSION_STORE_DIR = "data/sessions"
+    SESSION_COMPACT_EVERY = 20  # Deltas per session before a new base snapshot
+    SESSION_CACHE_SIZE = 1024  # Last snapshots kept in memory for diffing
+    
+    # Post-interview background tasks (utils/task_queue.py)
+    # Each process locks its own slot of the journal: tasks.journal, tasks.1.journal, ...
+    TASK_JOURNAL_PATH = os.getenv("TASK_JOURNAL_PATH", "data/tasks.journal")
+    TASK_JOURNAL_SLOTS = 64
+    TASK_WORKERS = 4
+    TASK_MAX_ATTEMPTS = 5
+    TASK_RETRY_BACKOFF = 2  # Seconds before the first retry, doubled after each
+    TASK_JOURNAL_COMPACT_EVERY = 200  # Finished tasks before the journal is rewritten
+    
+    # Transcript journals (utils/transcript_journal.py)
+    TRANSCRIPT_JOURNAL_DIR = "data/transcripts"
+    TRANSCRIPT_FLUSH_INTERVAL = 1.0  # Seconds buffered turns may wait before they are written
+    TRANSCRIPT_FLUSH_RECORDS = 20  # Buffered records per session that trigger an early flush
+    TRANSCRIPT_MERGE_INTERVAL = 60  # Seconds between merges of finished journals into segments
+    TRANSCRIPT_MERGE_IDLE = 3600  # Seconds before an unfinished (abandoned) journal is merged
+    TRANSCRIPT_SEGMENT_BYTES = 4 * 1024 * 1024  # Segment size before a new one is started
+    
+    # Compressed transcript archive (utils/transcript_archive.py)
+    TRANSCRIPT_ARCHIVE_PATH = "data/transcripts.archive"
+    TRANSCRIPT_ARCHIVE_INDEX = "data/transcripts_archive.db"
+    TRANSCRIPT_DICT_SIZE = 64 * 1024  # Trained dictionary size (zlib uses the last 32 KB)
+    TRANSCRIPT_DICT_SAMPLES = 500  # Transcripts sampled to train a dictionary
+    TRANSCRIPT_ARCHIVE_ZSTD_LEVEL = 19
+    TRANSCRIPT_ARCHIVE_ZLIB_LEVEL = 9
+    
+    # Chat UI
+    CHAT_PAGE_SIZE = 20  # Messages rendered before "Show earlier messages"
+    STATS_CACHE_TTL = 60  # Seconds store statistics are cached for the sidebar
+    RERUN_METER_WINDOW = 50  # Rerun durations kept per session
+    
     # Data storage
     DATA_FILE = "data/candidates.json"
     
+    # Bulk import
+    IMPORT_CHUNK_SIZE = 10000  # Rows validated together, column by column
+    IMPORT_BATCH_SIZE = 50000  # Valid rows per spool write (the store is written once per import)
+    
     # UI Colors
     PRIMARY_COLOR = "#2E86AB"
     SECONDARY_COLOR = "#A23B72"
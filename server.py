@@ -0,0 +1,293 @@
+"""
+TalentScout Hiring Assistant API server
+HTTP and WebSocket access to the same interview engine the Streamlit app uses
+
+Usage:
+    uvicorn server:app --host 0.0.0.0 --port 8000
+
+Endpoints:
+    POST   /interviews                  {"language": "English"} -> greeting
+    GET    /interviews/{id}             transcript and progress
+    GET    /interviews/{id}/transcript  readable transcript (text, also after the interview is gone)
+    POST   /interviews/{id}/messages    {"message": "..."} -> response
+    DELETE /interviews/{id}
+    WS     /interviews/{id}/ws          send {"message": "..."}, receive responses
+    GET    /health
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocketDisconnect
+
+from config import Config
+from utils.groq_client import GroqClient
+from utils.interview_engine import InterviewEngine, InterviewState
+from utils.data_handler import DataHandler
+from utils.session_store import get_session_store
+from utils.task_queue import TaskQueue
+from utils.question_bank import QuestionBank
+from utils.answer_scoring import AnswerScorer
+from utils.response_cache import ResponseCache, warm_in_background
+from utils.transcript_journal import TranscriptJournal
+
+
+class SessionRegistry:
+    """
+    Interviews in memory with a lock per interview and idle expiry
+
+    Every turn is also saved to the session store, so interviews dropped
+    from memory (idle, restart, another worker) are resumed by token.
+    """
+
+    def __init__(self, store, idle_timeout=None):
+        """
+        Initialize registry
+
+        Args:
+            store: SessionStore holding interview snapshots
+            idle_timeout: Seconds without a turn before an interview leaves memory
+        """
+        self.store = store
+        self.idle_timeout = idle_timeout or Config.SESSION_IDLE_TIMEOUT
+        self._sessions = {}  # session_id -> [state, lock, last_used]
+
+    def add(self, state):
+        """Register a new interview"""
+        self._sessions[state.session_id] = [state, asyncio.Lock(), time.monotonic()]
+
+    async def get(self, session_id):
+        """
+        Get an interview (resuming it from the store if needed) and mark it used
+
+        Returns:
+            tuple: (state, lock) or (None, None)
+        """
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            snapshot = await run_blocking(self.store.load, session_id)
+            if snapshot is None:
+                return None, None
+            # Another request may have resumed it while the store was read
+            if session_id not in self._sessions:
+                self.add(InterviewState.from_dict(snapshot))
+            entry = self._sessions[session_id]
+        entry[2] = time.monotonic()
+        return entry[0], entry[1]
+
+    def touch(self, session_id):
+        """Mark an interview as used"""
+        entry = self._sessions.get(session_id)
+        if entry is not None:
+            entry[2] = time.monotonic()
+
+    async def remove(self, session_id):
+        """Delete an interview; returns True if it existed"""
+        in_memory = self._sessions.pop(session_id, None) is not None
+        stored = await run_blocking(self.store.load, session_id) is not None
+        await run_blocking(self.store.delete, session_id)
+        return in_memory or stored
+
+    def evict_idle(self):
+        """Drop interviews idle for longer than the timeout; returns how many"""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [sid for sid, entry in self._sessions.items() if entry[2] < cutoff and not entry[1].locked()]
+        for session_id in idle:
+            del self._sessions[session_id]
+        return len(idle)
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+def create_engine():
+    """Build the engine; without an API key interviews run on fallback templates"""
+    try:
+        groq_client = GroqClient()
+    except Exception as e:
+        print(f"Groq client unavailable, using fallback templates: {str(e)}")
+        groq_client = None
+    return InterviewEngine(
+        groq_client=groq_client,
+        data_handler=DataHandler(Config.DATA_FILE),
+        task_queue=TaskQueue(Config.TASK_JOURNAL_PATH),
+        question_bank=QuestionBank.default(),
+        scorer=AnswerScorer(groq_client) if groq_client else None,
+        response_cache=ResponseCache.default(),
+        journal=TranscriptJournal.default()
+    )
+
+
+# Engine turns block on the LLM, so they run on a bounded thread pool
+# while the event loop keeps serving every other interview
+engine = create_engine()
+sessions = SessionRegistry(get_session_store())
+turn_pool = ThreadPoolExecutor(max_workers=Config.SERVER_WORKERS, thread_name_prefix="interview")
+
+
+async def run_blocking(fn, *args):
+    """Run a blocking call on the turn pool"""
+    return await asyncio.get_running_loop().run_in_executor(turn_pool, fn, *args)
+
+
+def save_state(state):
+    """Persist an interview snapshot"""
+    try:
+        sessions.store.save(state.session_id, state.to_dict())
+    except Exception as e:
+        print(f"Error saving session {state.session_id}: {str(e)}")
+
+
+async def take_turn(state, lock, message):
+    """
+    Run one candidate turn
+
+    Returns:
+        dict: Response payload
+    """
+    async with lock:
+        if state.complete:
+            return {'error': "Interview already complete", **engine.summary(state)}
+        response = await run_blocking(engine.handle_message, state, message)
+        await run_blocking(save_state, state)
+        return {'response': response, **engine.summary(state)}
+
+
+def parse_message(payload):
+    """
+    Validate a message payload
+
+    Returns:
+        tuple: (message, error)
+    """
+    message = payload.get('message') if isinstance(payload, dict) else None
+    if not isinstance(message, str) or not message.strip():
+        return None, "'message' must be a non-empty string"
+    if len(message) > Config.SERVER_MAX_MESSAGE_LENGTH:
+        return None, f"'message' is longer than {Config.SERVER_MAX_MESSAGE_LENGTH} characters"
+    return message, None
+
+
+async def read_json(request):
+    """Request body as JSON, or an empty dict"""
+    try:
+        return await request.json()
+    except Exception:
+        return {}
+
+
+async def health(request):
+    return JSONResponse({'status': 'ok', 'sessions': len(sessions)})
+
+
+async def create_interview(request):
+    payload = await read_json(request)
+    language = payload.get('language', "English")
+    if language not in Config.SUPPORTED_LANGUAGES:
+        return JSONResponse({'error': f"Unsupported language: {language}"}, status_code=400)
+
+    state = engine.new_state(language)
+    greeting = await run_blocking(engine.start, state)
+    await run_blocking(save_state, state)
+    sessions.add(state)
+    return JSONResponse({'response': greeting, **engine.summary(state)}, status_code=201)
+
+
+async def get_interview(request):
+    state, _ = await sessions.get(request.path_params['session_id'])
+    if state is None:
+        return JSONResponse({'error': "Interview not found"}, status_code=404)
+    return JSONResponse({'messages': state.turns.messages(), **engine.summary(state)})
+
+
+async def get_transcript(request):
+    text = await run_blocking(engine.journal.render, request.path_params['session_id'])
+    if text is None:
+        return JSONResponse({'error': "Interview not found"}, status_code=404)
+    return PlainTextResponse(text)
+
+
+async def post_message(request):
+    state, lock = await sessions.get(request.path_params['session_id'])
+    if state is None:
+        return JSONResponse({'error': "Interview not found"}, status_code=404)
+
+    message, error = parse_message(await read_json(request))
+    if error:
+        return JSONResponse({'error': error}, status_code=400)
+
+    result = await take_turn(state, lock, message)
+    return JSONResponse(result, status_code=409 if 'error' in result else 200)
+
+
+async def delete_interview(request):
+    if not await sessions.remove(request.path_params['session_id']):
+        return JSONResponse({'error': "Interview not found"}, status_code=404)
+    return JSONResponse({'deleted': True})
+
+
+async def interview_socket(websocket):
+    state, lock = await sessions.get(websocket.path_params['session_id'])
+    await websocket.accept()
+    if state is None:
+        await websocket.close(code=4404)
+        return
+
+    await websocket.send_json({'messages': state.turns.messages(), **engine.summary(state)})
+    try:
+        while not state.complete:
+            try:
+                payload = await websocket.receive_json()
+            except ValueError:
+                await websocket.send_json({'error': "Expected a JSON object"})
+                continue
+            message, error = parse_message(payload)
+            if error:
+                await websocket.send_json({'error': error})
+                continue
+            await websocket.send_json(await take_turn(state, lock, message))
+            sessions.touch(state.session_id)
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
+
+async def evict_idle_sessions():
+    """Periodically drop idle interviews"""
+    while True:
+        await asyncio.sleep(60)
+        evicted = sessions.evict_idle()
+        if evicted:
+            print(f"Evicted {evicted} idle interviews")
+
+
+@asynccontextmanager
+async def lifespan(app):
+    sweeper = asyncio.create_task(evict_idle_sessions())
+    if Config.WARMUP_ON_BOOT and engine.groq_client is not None:
+        warm_in_background(engine.groq_client, engine.response_cache, engine.question_bank, engine.data_handler)
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        turn_pool.shutdown(wait=False)
+        # Unfinished post-interview tasks stay in the journal for the next start
+        engine.tasks.stop(timeout=5)
+        engine.journal.stop(timeout=5)
+
+
+app = Starlette(
+    routes=[
+        Route('/health', health),
+        Route('/interviews', create_interview, methods=['POST']),
+        Route('/interviews/{session_id}', get_interview, methods=['GET']),
+        Route('/interviews/{session_id}', delete_interview, methods=['DELETE']),
+        Route('/interviews/{session_id}/transcript', get_transcript, methods=['GET']),
+        Route('/interviews/{session_id}/messages', post_message, methods=['POST']),
+        WebSocketRoute('/interviews/{session_id}/ws', interview_socket),
+    ],
+    lifespan=lifespan
+)
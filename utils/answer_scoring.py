@@ -0,0 +1,208 @@
+"""
+Answer scoring for TalentScout Hiring Assistant
+Rubric-based LLM evaluation of technical answers, batched in the background
+
+Answers are submitted as they arrive and scored while the candidate reads
+the next question. Answers of the same interview submitted close together
+share one LLM request; answers of different interviews never do, so one
+candidate's free text can't steer another candidate's scores.
+"""
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from config import Config
+from utils.prompt_templates import PromptTemplates
+
+RUBRIC = ('correctness', 'depth', 'clarity')
+
+_decoder = json.JSONDecoder()
+
+
+def _clamp_score(value):
+    """Score as a float in 0-10, or None"""
+    try:
+        return max(0.0, min(10.0, float(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_scores(text):
+    """
+    Read scoring objects from a completion (JSON lines, tolerating extra text)
+
+    Returns:
+        dict: item id -> score dict
+    """
+    scores = {}
+    position = text.find('{') if text else -1
+    while position != -1:
+        try:
+            obj, end = _decoder.raw_decode(text, position)
+        except ValueError:
+            position = text.find('{', position + 1)
+            continue
+        position = text.find('{', end)
+        if not isinstance(obj, dict):
+            continue
+        try:
+            item_id = int(obj.get('id'))
+        except (TypeError, ValueError):
+            continue
+
+        score = {criterion: _clamp_score(obj.get(criterion)) for criterion in RUBRIC}
+        overall = _clamp_score(obj.get('score'))
+        if overall is None:
+            rubric = [value for value in score.values() if value is not None]
+            overall = round(sum(rubric) / len(rubric), 1) if rubric else None
+        if overall is None:
+            continue
+        score['score'] = overall
+        score['feedback'] = str(obj.get('feedback', '')).strip()[:300]
+        scores[item_id] = score
+    return scores
+
+
+class AnswerScorer:
+    """Background scorer that batches answers into few LLM requests"""
+
+    def __init__(self, groq_client, batch_size=None, batch_wait=None, workers=None):
+        """
+        Initialize scorer
+
+        Args:
+            groq_client: GroqClient
+            batch_size: Most answers per LLM request
+            batch_wait: Seconds to wait for more answers before sending a batch
+            workers: Concurrent scoring requests
+        """
+        self.groq_client = groq_client
+        self.batch_size = batch_size or Config.SCORING_BATCH_SIZE
+        self.batch_wait = Config.SCORING_BATCH_WAIT if batch_wait is None else batch_wait
+        self._queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers or Config.SCORING_WORKERS, thread_name_prefix="scoring"
+        )
+        self._dispatcher = threading.Thread(target=self._dispatch, name="scoring-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, question, answer, interview_id=None):
+        """
+        Queue an answer for scoring
+
+        Args:
+            question: Question asked
+            answer: Candidate answer
+            interview_id: Interview the answer belongs to; only answers of
+                the same interview share a request (scored alone if None)
+
+        Returns:
+            Future: Resolves to a score dict, or None if it could not be scored
+        """
+        future = Future()
+        if not answer or not answer.strip():
+            future.set_result(self.empty_score())
+        else:
+            group = object() if interview_id is None else interview_id
+            self._queue.put((group, question, answer, future))
+        return future
+
+    def score_batch(self, items):
+        """
+        Score answers with one LLM request (blocking)
+
+        Answers missing from the batch reply are retried one at a time.
+
+        Args:
+            items: (question, answer) pairs
+
+        Returns:
+            list: Score dict or None per item
+        """
+        results = [self.empty_score() if not answer.strip() else None for _, answer in items]
+        todo = [i for i, result in enumerate(results) if result is None]
+        if not todo:
+            return results
+
+        scores = self._request([items[i] for i in todo])
+        for position, i in enumerate(todo, start=1):
+            results[i] = scores.get(position)
+
+        if len(todo) > 1:
+            for i in todo:
+                if results[i] is None:
+                    results[i] = self._request([items[i]]).get(1)
+        return results
+
+    @staticmethod
+    def empty_score():
+        """Score of a blank answer"""
+        return {**{criterion: 0.0 for criterion in RUBRIC}, 'score': 0.0, 'feedback': "No answer given."}
+
+    def _request(self, items):
+        """One rubric request; returns item id (1-based) -> score dict"""
+        if not self.groq_client.is_available():
+            return {}
+        messages = [
+            {'role': 'system', 'content': PromptTemplates.ANSWER_SCORING_SYSTEM_PROMPT},
+            {'role': 'user', 'content': PromptTemplates.get_answer_scoring_prompt(items)}
+        ]
+        text = self.groq_client.generate_response(messages, temperature=0.1, route='answer_scoring', fallback="")
+        return parse_scores(text)
+
+    def _dispatch(self):
+        """Group queued answers into per-interview batches and hand them to the pool"""
+        batches = OrderedDict()  # interview -> (deadline, items), oldest first
+        while True:
+            timeout = None
+            if batches:
+                timeout = max(0.0, next(iter(batches.values()))[0] - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is not None:
+                group = item[0]
+                if group not in batches:
+                    batches[group] = (time.monotonic() + self.batch_wait, [])
+                items = batches[group][1]
+                items.append(item[1:])
+                if len(items) >= self.batch_size:
+                    del batches[group]
+                    self._pool.submit(self._run_batch, items)
+
+            now = time.monotonic()
+            while batches and next(iter(batches.values()))[0] <= now:
+                _, (_, items) = batches.popitem(last=False)
+                self._pool.submit(self._run_batch, items)
+
+    def _run_batch(self, batch):
+        """Score a batch and resolve its futures"""
+        try:
+            results = self.score_batch([(question, answer) for question, answer, _ in batch])
+        except Exception as e:
+            print(f"Answer scoring failed: {str(e)}")
+            results = [None] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+def summarize_scores(responses):
+    """
+    Overall score of an interview
+
+    Args:
+        responses: Technical responses with optional 'score' dicts
+
+    Returns:
+        dict: average score and how many answers were scored
+    """
+    scores = [r['score']['score'] for r in responses if isinstance(r.get('score'), dict)]
+    return {
+        'average': round(sum(scores) / len(scores), 1) if scores else None,
+        'scored': len(scores),
+        'answers': len(responses)
+    }
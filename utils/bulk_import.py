@@ -0,0 +1,355 @@
+"""
+Bulk candidate import for TalentScout Hiring Assistant
+Validates ATS exports column by column and loads valid rows into the candidate store
+
+Usage:
+    python -m utils.bulk_import candidates.csv
+    python -m utils.bulk_import candidates.csv --rejects data/rejects.csv --dry-run
+"""
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from config import Config
+from utils.data_handler import DataHandler
+from utils.preprocessing import NUMBER_PATTERN
+from utils.taxonomy import TechTaxonomy
+from utils.validators import (
+    InputValidator, EMAIL_PATTERN, PHONE_FORMATTING,
+    NAME_PATTERN, TECH_SEPARATORS, COMMON_GREETINGS
+)
+
+FIELDS = ('name', 'email', 'phone', 'experience', 'position', 'location', 'tech_stack')
+
+# Header spellings seen in ATS exports, after lower-casing and trimming
+COLUMN_ALIASES = {
+    'full name': 'name', 'full_name': 'name', 'candidate name': 'name',
+    'e-mail': 'email', 'email address': 'email', 'email_address': 'email',
+    'phone number': 'phone', 'phone_number': 'phone', 'mobile': 'phone',
+    'years of experience': 'experience', 'years_of_experience': 'experience',
+    'experience (years)': 'experience', 'desired position': 'position',
+    'desired_position': 'position', 'role': 'position', 'city': 'location',
+    'tech stack': 'tech_stack', 'skills': 'tech_stack', 'technologies': 'tech_stack'
+}
+
+
+def map_columns(header):
+    """
+    Map CSV header cells to candidate fields
+
+    Returns:
+        dict: field -> column position, for the fields present
+    """
+    positions = {}
+    for i, cell in enumerate(header):
+        key = cell.strip().lower()
+        field = key if key in FIELDS else COLUMN_ALIASES.get(key)
+        if field and field not in positions:
+            positions[field] = i
+    return positions
+
+
+def _validate_column(values, accept, validate):
+    """
+    Validate a column with a fast acceptance check
+
+    Values passing accept() are valid; the rest go through the chat
+    validator so rejects carry exactly the messages candidates see.
+
+    Args:
+        values: Stripped cell values
+        accept: Function returning the cleaned value, or None to fall back
+        validate: InputValidator function returning (is_valid, ..., error)
+
+    Returns:
+        tuple: (cleaned values, error messages or None)
+    """
+    cleaned = []
+    errors = []
+    for value in values:
+        result = accept(value)
+        if result is not None:
+            cleaned.append(result)
+            errors.append(None)
+            continue
+        outcome = validate(value)
+        cleaned.append(outcome[1] if len(outcome) == 3 else value)
+        errors.append(None if outcome[0] else outcome[-1])
+    return cleaned, errors
+
+
+def _accept_name(value):
+    if 2 <= len(value) <= 100 and NAME_PATTERN.match(value) and value.lower() not in COMMON_GREETINGS:
+        return value
+    return None
+
+
+def _accept_email(value):
+    # The pattern admits exactly one "@"
+    if len(value) <= 254 and EMAIL_PATTERN.match(value):
+        return value
+    return None
+
+
+def _accept_phone(value):
+    digits = PHONE_FORMATTING.sub('', value)
+    if 7 <= len(digits) <= 15 and digits.isdigit():
+        return value
+    return None
+
+
+def _accept_experience(value):
+    number = NUMBER_PATTERN.search(value)
+    if number:
+        years = float(number.group())
+        if years <= 50:
+            return years
+    return None
+
+
+def _accept_position(value):
+    return value if 3 <= len(value) <= 100 else None
+
+
+def _accept_location(value):
+    return value if 2 <= len(value) <= 100 else None
+
+
+def _validate_experience(value):
+    # Experience cells may be numeric; the chat validator expects text
+    return InputValidator.validate_experience(value or None)
+
+
+COLUMN_RULES = {
+    'name': (_accept_name, InputValidator.validate_name),
+    'email': (_accept_email, InputValidator.validate_email),
+    'phone': (_accept_phone, InputValidator.validate_phone),
+    'experience': (_accept_experience, _validate_experience),
+    'position': (_accept_position, InputValidator.validate_position),
+    'location': (_accept_location, InputValidator.validate_location),
+}
+
+
+def validate_tech_column(values, taxonomy, cache=None):
+    """
+    Canonicalize a tech stack column
+
+    Identical cells are resolved once, so repeated stacks cost a dict lookup.
+
+    Returns:
+        tuple: (comma-separated canonical stacks, error messages or None)
+    """
+    cache = {} if cache is None else cache
+    cleaned = []
+    errors = []
+    for value in values:
+        stack = cache.get(value)
+        if stack is None:
+            techs = [t.strip() for t in TECH_SEPARATORS.split(value)]
+            stack = ', '.join(taxonomy.canonicalize_list([t for t in techs if len(t) > 1]))
+            cache[value] = stack
+        cleaned.append(stack)
+        errors.append(None if stack else InputValidator.validate_tech_stack(value)[3])
+    return cleaned, errors
+
+
+def validate_rows(rows, positions, taxonomy, tech_cache=None):
+    """
+    Validate a chunk of CSV rows column by column
+
+    Args:
+        rows: List of CSV rows (lists of cells)
+        positions: field -> column position from map_columns (every field present)
+        taxonomy: TechTaxonomy used for tech stacks
+        tech_cache: Dict reused across chunks for repeated tech stacks
+
+    Returns:
+        tuple: (list of record dicts, list of reason lists; empty when valid)
+    """
+    size = len(rows)
+    columns = {}
+    reasons = [[] for _ in range(size)]
+
+    for field in FIELDS:
+        position = positions[field]
+        values = [row[position].strip() if position < len(row) else '' for row in rows]
+
+        if field == 'tech_stack':
+            cleaned, errors = validate_tech_column(values, taxonomy, tech_cache)
+        else:
+            accept, validate = COLUMN_RULES[field]
+            cleaned, errors = _validate_column(values, accept, validate)
+
+        columns[field] = cleaned
+        for i, error in enumerate(errors):
+            if error:
+                reasons[i].append(f"{field}: {error}")
+
+    records = [
+        {field: columns[field][i] for field in FIELDS}
+        for i in range(size)
+    ]
+    return records, reasons
+
+
+class RejectWriter:
+    """Writes rejected rows with their reasons, creating the file on first use"""
+
+    def __init__(self, path, header):
+        self.path = path
+        self.header = header
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, row_number, row, reasons):
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(['row', 'reasons'] + list(self.header))
+        self._writer.writerow([row_number, '; '.join(reasons)] + list(row))
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def import_candidates(source, data_handler, rejects_path=None, chunk_size=None,
+                      batch_size=None, dry_run=False):
+    """
+    Import candidates from a CSV file
+
+    Rows are read and validated in chunks and de-duplicated on email
+    (against the store and earlier rows; the first occurrence wins). Valid
+    rows are appended in batches to a JSON Lines spool file next to the
+    store; the store itself is read and rewritten once, after the last
+    row, and replaced atomically. An import that fails part-way leaves the
+    store unchanged.
+
+    Args:
+        source: Path to the CSV file (header row required)
+        data_handler: DataHandler to load into
+        rejects_path: CSV for rejected rows (defaults to data/import_rejects_<timestamp>.csv)
+        chunk_size: Rows validated together (defaults to Config.IMPORT_CHUNK_SIZE)
+        batch_size: Valid rows per spool write (defaults to Config.IMPORT_BATCH_SIZE)
+        dry_run: Validate and write rejects without saving candidates
+
+    Returns:
+        dict: Import report
+    """
+    chunk_size = chunk_size or Config.IMPORT_CHUNK_SIZE
+    batch_size = batch_size or Config.IMPORT_BATCH_SIZE
+    if rejects_path is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        rejects_path = os.path.join(os.path.dirname(data_handler.data_file), f"import_rejects_{timestamp}.csv")
+
+    started = time.perf_counter()
+    taxonomy = TechTaxonomy.default()
+    tech_cache = {}
+    seen_emails = {
+        c.get('email', '').lower(): 'store'
+        for c in data_handler.load_all_candidates() if c.get('email')
+    }
+    report = {'rows': 0, 'imported': 0, 'rejected': 0, 'duplicates': 0, 'rejects_file': None}
+    pending = []
+    spool = None
+
+    def flush():
+        nonlocal spool
+        if pending and not dry_run:
+            if spool is None:
+                spool = tempfile.NamedTemporaryFile(
+                    'w+', encoding='utf-8', suffix='.jsonl', prefix='import_',
+                    dir=os.path.dirname(data_handler.data_file) or '.', delete=False
+                )
+            spool.writelines(json.dumps(record) + '\n' for record in pending)
+        elif pending:
+            report['imported'] += len(pending)
+        pending.clear()
+
+    with open(source, 'r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"{source} is empty")
+        positions = map_columns(header)
+        missing = [field for field in FIELDS if field not in positions]
+        if missing:
+            raise ValueError(f"{source} has no column for: {', '.join(missing)}")
+
+        rejects = RejectWriter(rejects_path, header)
+        try:
+            row_number = 0
+            while True:
+                rows = [row for _, row in zip(range(chunk_size), reader)]
+                if not rows:
+                    break
+
+                records, reasons = validate_rows(rows, positions, taxonomy, tech_cache)
+                for row, record, row_reasons in zip(rows, records, reasons):
+                    row_number += 1
+                    email = record['email'].lower()
+                    if not row_reasons and email:
+                        first = seen_emails.get(email)
+                        if first == 'store':
+                            row_reasons = ["email: Candidate already in the store"]
+                        elif first:
+                            row_reasons = [f"email: Duplicate of row {first}"]
+                        if row_reasons:
+                            report['duplicates'] += 1
+
+                    if row_reasons:
+                        rejects.write(row_number, row, row_reasons)
+                        continue
+
+                    seen_emails[email] = row_number
+                    record['source'] = 'bulk_import'
+                    pending.append(record)
+                    if len(pending) >= batch_size:
+                        flush()
+
+                report['rows'] = row_number
+                if len(tech_cache) > chunk_size * 10:
+                    tech_cache.clear()
+            flush()
+            if spool is not None:
+                spool.seek(0)
+                report['imported'] = data_handler.save_candidates([json.loads(line) for line in spool])
+        finally:
+            rejects.close()
+            if spool is not None:
+                spool.close()
+                os.remove(spool.name)
+
+    report['rejected'] = rejects.count
+    report['rejects_file'] = rejects_path if rejects.count else None
+    report['elapsed_s'] = round(time.perf_counter() - started, 2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import candidates from a CSV export")
+    parser.add_argument('source', help="CSV file with a header row")
+    parser.add_argument('--rejects', default=None, help="CSV file for rejected rows")
+    parser.add_argument('--chunk-size', type=int, default=None)
+    parser.add_argument('--batch-size', type=int, default=None)
+    parser.add_argument('--dry-run', action='store_true', help="Validate only")
+    args = parser.parse_args()
+
+    report = import_candidates(
+        args.source, DataHandler(Config.DATA_FILE), rejects_path=args.rejects,
+        chunk_size=args.chunk_size, batch_size=args.batch_size, dry_run=args.dry_run
+    )
+    action = "Validated" if args.dry_run else "Imported"
+    print(f"{action} {report['imported']} of {report['rows']} rows in {report['elapsed_s']}s")
+    if report['rejected']:
+        print(f"Rejected {report['rejected']} rows ({report['duplicates']} duplicate emails): {report['rejects_file']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Circuit Breaker for TalentScout Hiring Assistant
+Stops waiting on the LLM when it is failing or too slow
+"""
+import threading
+import time
+from config import Config
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+class CircuitBreaker:
+    """Tracks LLM health and short-circuits calls while it is unhealthy"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, failure_threshold=None, latency_threshold=None, reset_timeout=None):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            latency_threshold: Calls slower than this (seconds) count as failures
+            reset_timeout: Seconds to stay open before allowing a probe
+        """
+        self.failure_threshold = failure_threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.latency_threshold = latency_threshold or Config.CIRCUIT_LATENCY_THRESHOLD
+        self.reset_timeout = reset_timeout or Config.CIRCUIT_RESET_TIMEOUT
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide breaker shared by all sessions"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @property
+    def state(self):
+        """Current state, moving from open to half-open once the timeout passes"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            return self._state
+
+    def is_open(self):
+        """Check if callers should skip the LLM without consuming a probe"""
+        state = self.state
+        if state == self.HALF_OPEN:
+            with self._lock:
+                return self._probe_in_flight
+        return state == self.OPEN
+
+    def allow_request(self):
+        """
+        Check if a call may go through
+
+        Returns:
+            bool: True if the call should be attempted
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN:
+            return False
+
+        # Half-open: let exactly one probe through
+        with self._lock:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self, latency=0.0):
+        """Record a completed call; slow calls are treated as failures"""
+        if latency > self.latency_threshold:
+            self.record_failure()
+            return
+
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Record a failed call and open the circuit if needed"""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def reset(self):
+        """Force the circuit closed"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
@@ -4,8 +4,17 @@ Manages candidate data storage and retrieval
 """
 import json
 import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
-import pandas as pd
+from utils.taxonomy import TechTaxonomy
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 class DataHandler:
     """Handles candidate data storage and management"""
@@ -23,37 +32,79 @@ class DataHandler:
             with open(self.data_file, 'w') as f:
                 json.dump([], f)
     
-    def save_candidate(self, candidate_data):
+    def save_candidate(self, candidate_data, unique_key=None):
         """
         Save candidate data to file
         
         Args:
             candidate_data: Dictionary containing candidate information
+            unique_key: Field that identifies the candidate (e.g. 'interview_id');
+                nothing is saved if a stored candidate has the same value
             
         Returns:
-            bool: Success status
+            bool: Success status (True if already stored)
         """
         try:
-            # Add timestamp and ID
-            candidate_data['timestamp'] = datetime.now().isoformat()
-            candidate_data['candidate_id'] = self._generate_candidate_id()
-            
-            # Load existing data
-            candidates = self.load_all_candidates()
-            
-            # Append new candidate
-            candidates.append(candidate_data)
-            
-            # Save back to file
-            with open(self.data_file, 'w') as f:
-                json.dump(candidates, f, indent=2)
-            
+            with self._write_lock():
+                # Load existing data
+                candidates = self.load_all_candidates()
+
+                if unique_key is not None:
+                    value = candidate_data.get(unique_key)
+                    if any(c.get(unique_key) == value for c in candidates):
+                        return True
+
+                # Add timestamp and ID
+                candidate_data['timestamp'] = datetime.now().isoformat()
+                candidate_data['candidate_id'] = self._generate_candidate_id(candidates)
+
+                # Append new candidate
+                candidates.append(candidate_data)
+
+                # Save back to file
+                self._write_all(candidates)
+
             return True
             
         except Exception as e:
             print(f"Error saving candidate: {str(e)}")
             return False
     
+    def save_candidates(self, candidates_data):
+        """
+        Append many candidates with a single read and write
+
+        Callers adding a large number of candidates should collect them
+        first and call this once: every call reads and rewrites the store.
+
+        Args:
+            candidates_data: List of candidate dictionaries
+
+        Returns:
+            int: Number of candidates saved
+        """
+        if not candidates_data:
+            return 0
+        try:
+            with self._write_lock():
+                candidates = self.load_all_candidates()
+                now = datetime.now()
+                timestamp = now.isoformat()
+                id_prefix = now.strftime("%Y%m%d%H%M%S")
+
+                for offset, candidate_data in enumerate(candidates_data, start=len(candidates) + 1):
+                    candidate_data['timestamp'] = timestamp
+                    candidate_data['candidate_id'] = f"TS{id_prefix}{offset:04d}"
+                    candidates.append(candidate_data)
+
+                self._write_all(candidates)
+
+            return len(candidates_data)
+
+        except Exception as e:
+            print(f"Error saving candidates: {str(e)}")
+            return 0
+
     def load_all_candidates(self):
         """Load all candidates from file"""
         try:
@@ -79,9 +130,104 @@ class DataHandler:
                 return candidate
         return None
     
-    def _generate_candidate_id(self):
+    def update_candidates(self, updates):
+        """
+        Merge fields into stored candidates with a single write
+
+        Args:
+            updates: Dictionary mapping candidate_id to a dict of fields
+
+        Returns:
+            int: Number of candidates updated
+        """
+        try:
+            with self._write_lock():
+                candidates = self.load_all_candidates()
+                updated = 0
+                for candidate in candidates:
+                    fields = updates.get(candidate.get('candidate_id'))
+                    if fields:
+                        candidate.update(fields)
+                        updated += 1
+
+                if updated:
+                    self._write_all(candidates)
+
+            return updated
+
+        except Exception as e:
+            print(f"Error updating candidates: {str(e)}")
+            return 0
+
+    def canonicalize_tech_stacks(self, taxonomy=None):
+        """
+        Rewrite stored tech stacks with canonical technology names
+
+        Args:
+            taxonomy: TechTaxonomy to use (defaults to the shared one)
+
+        Returns:
+            int: Number of candidates whose tech stack changed
+        """
+        taxonomy = taxonomy or TechTaxonomy.default()
+        updates = {}
+        for candidate in self.load_all_candidates():
+            tech_stack = candidate.get('tech_stack')
+            if not tech_stack or not candidate.get('candidate_id'):
+                continue
+            canonical = ', '.join(taxonomy.canonicalize_list(tech_stack))
+            if canonical != tech_stack:
+                updates[candidate['candidate_id']] = {'tech_stack': canonical}
+        return self.update_candidates(updates)
+
+    @contextmanager
+    def _write_lock(self):
+        """
+        Hold the store's writer lock (a lock file shared by all processes)
+
+        Every read-modify-write of the store runs under it, so concurrent
+        writers in the app, the server and their task workers don't lose
+        each other's changes.
+        """
+        with open(f"{self.data_file}.lock", 'a+b') as lock_file:
+            lock_file.seek(0)
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _write_all(self, candidates):
+        """
+        Replace the store's contents (call under _write_lock)
+
+        Written to a temporary file of its own that is then moved over the
+        store, so a crash mid-write leaves the previous contents intact.
+        """
+        directory = os.path.dirname(self.data_file) or '.'
+        fd, temp_file = tempfile.mkstemp(prefix='.candidates_', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(candidates, f, indent=2)
+            # mkstemp creates the file private; keep the store's permissions
+            if os.path.exists(self.data_file):
+                shutil.copymode(self.data_file, temp_file)
+            os.replace(temp_file, self.data_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+
+    def _generate_candidate_id(self, candidates=None):
         """Generate unique candidate ID"""
-        candidates = self.load_all_candidates()
+        if candidates is None:
+            candidates = self.load_all_candidates()
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         count = len(candidates) + 1
         return f"TS{timestamp}{count:04d}"
@@ -93,6 +239,9 @@ class DataHandler:
             if not candidates:
                 return False
             
+            # pandas is only needed here; importing it lazily keeps startup fast
+            import pandas as pd
+            
             df = pd.DataFrame(candidates)
             df.to_csv(output_file, index=False)
             return True
@@ -117,6 +266,7 @@ class DataHandler:
         positions = {}
         total_experience = 0
         all_tech = []
+        taxonomy = TechTaxonomy.default()
         
         for candidate in candidates:
             # Count positions
@@ -130,10 +280,10 @@ class DataHandler:
             except:
                 pass
             
-            # Collect tech stack
+            # Collect tech stack ("react", "React.js" and "ReactJS" count as one)
             tech_stack = candidate.get('tech_stack', '')
             if tech_stack:
-                all_tech.extend([t.strip() for t in tech_stack.split(',')])
+                all_tech.extend(taxonomy.canonicalize_list(tech_stack))
         
         # Count tech occurrences
         tech_counts = {}
@@ -153,8 +303,8 @@ class DataHandler:
     def clear_all_data(self):
         """Clear all candidate data (use with caution!)"""
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump([], f)
+            with self._write_lock():
+                self._write_all([])
             return True
         except Exception as e:
             print(f"Error clearing data: {str(e)}")
@@ -164,6 +314,42 @@ class DataHandler:
 class ConversationExporter:
     """Export conversation transcripts"""
     
+    @staticmethod
+    def render_transcript(conversation_history, candidate_data):
+        """
+        Format a transcript as readable text
+        
+        Args:
+            conversation_history: List of conversation messages
+            candidate_data: Dictionary of candidate information
+            
+        Returns:
+            str: Transcript text
+        """
+        # Header
+        lines = ["=" * 60, "TALENTSCOUT HIRING ASSISTANT - INTERVIEW TRANSCRIPT", "=" * 60, ""]
+        
+        # Candidate Information
+        lines.extend(["CANDIDATE INFORMATION:", "-" * 60])
+        for key, value in candidate_data.items():
+            if key not in ['timestamp', 'candidate_id', 'conversation_history']:
+                lines.append(f"{key.upper()}: {value}")
+        lines.append("")
+        
+        # Conversation
+        lines.extend(["CONVERSATION TRANSCRIPT:", "-" * 60, ""])
+        for msg in conversation_history:
+            role = "ASSISTANT" if msg['role'] == 'assistant' else "CANDIDATE"
+            lines.extend([f"{role}:", msg['content'], ""])
+        
+        # Footer
+        lines.extend([
+            "=" * 60,
+            f"Transcript generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "=" * 60
+        ])
+        return "\n".join(lines) + "\n"
+    
     @staticmethod
     def export_conversation(conversation_history, candidate_data, filename=None):
         """
@@ -186,31 +372,7 @@ class ConversationExporter:
             os.makedirs(os.path.dirname(filename), exist_ok=True)
             
             with open(filename, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("=" * 60 + "\n")
-                f.write("TALENTSCOUT HIRING ASSISTANT - INTERVIEW TRANSCRIPT\n")
-                f.write("=" * 60 + "\n\n")
-                
-                # Candidate Information
-                f.write("CANDIDATE INFORMATION:\n")
-                f.write("-" * 60 + "\n")
-                for key, value in candidate_data.items():
-                    if key not in ['timestamp', 'candidate_id', 'conversation_history']:
-                        f.write(f"{key.upper()}: {value}\n")
-                f.write("\n")
-                
-                # Conversation
-                f.write("CONVERSATION TRANSCRIPT:\n")
-                f.write("-" * 60 + "\n\n")
-                
-                for msg in conversation_history:
-                    role = "ASSISTANT" if msg['role'] == 'assistant' else "CANDIDATE"
-                    f.write(f"{role}:\n{msg['content']}\n\n")
-                
-                # Footer
-                f.write("=" * 60 + "\n")
-                f.write(f"Transcript generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 60 + "\n")
+                f.write(ConversationExporter.render_transcript(conversation_history, candidate_data))
             
             return filename
             
@@ -0,0 +1,121 @@
+"""
+Fallback templates for TalentScout Hiring Assistant
+Instant localized responses used when the LLM is unavailable
+"""
+import random
+from utils.template_registry import TemplateRegistry
+from utils.taxonomy import TechTaxonomy
+
+
+class FallbackTemplates:
+    """Static greetings, closings and a local technical question bank"""
+
+    # Localized greetings, closings and question patterns are served by the
+    # template registry (fallback.* keys in utils/resources/templates)
+
+    # Technology-specific questions (English), keyed by lower-case technology name
+    QUESTION_BANK = {
+        "python": [
+            "How do Python's generators differ from lists, and when would you choose one over the other?",
+            "Explain how you would structure error handling and logging in a production Python service.",
+            "What is the Global Interpreter Lock, and how does it affect CPU-bound versus I/O-bound code?"
+        ],
+        "javascript": [
+            "Explain the JavaScript event loop and how promises and async/await fit into it.",
+            "What is the difference between var, let and const, and how does hoisting affect each?",
+            "How would you debounce an expensive event handler, and why is it useful?"
+        ],
+        "java": [
+            "How does garbage collection work in the JVM, and how would you diagnose a memory leak?",
+            "Explain the difference between checked and unchecked exceptions with an example of each.",
+            "How would you make a shared data structure thread-safe in Java?"
+        ],
+        "react": [
+            "How does React decide when to re-render a component, and how would you avoid unnecessary renders?",
+            "Explain the rules of hooks and a situation where useEffect cleanup is required.",
+            "How would you manage state that is shared by many distant components?"
+        ],
+        "node.js": [
+            "How does Node.js handle many concurrent connections on a single thread?",
+            "How would you structure error handling in an Express-style Node.js API?",
+            "When would you use worker threads or child processes in Node.js?"
+        ],
+        "django": [
+            "How do you avoid N+1 query problems in the Django ORM?",
+            "Explain how Django middleware works and give an example of a custom middleware.",
+            "How would you manage database schema changes safely with Django migrations?"
+        ],
+        "sql": [
+            "How would you find and fix a slow SQL query?",
+            "Explain the difference between INNER, LEFT and FULL OUTER joins with an example.",
+            "What are database indexes, and when can they hurt performance?"
+        ],
+        "docker": [
+            "How would you reduce the size of a Docker image for a production service?",
+            "Explain the difference between an image, a container and a volume.",
+            "How do you pass configuration and secrets to a containerized application safely?"
+        ],
+        "aws": [
+            "How would you design a highly available web application on AWS?",
+            "Explain the difference between IAM users, roles and policies.",
+            "How would you control and monitor costs for an AWS workload?"
+        ],
+        "kubernetes": [
+            "Explain the roles of Pods, Deployments and Services in Kubernetes.",
+            "How do readiness and liveness probes differ, and why do both matter?",
+            "How would you roll out a new version of a service with zero downtime?"
+        ]
+    }
+
+    # Technologies that should use another entry of the question bank
+    # (spelling aliases are resolved by the taxonomy first)
+    QUESTION_BANK_ALIASES = {
+        "postgresql": "sql", "mysql": "sql", "sqlite": "sql", "oracle": "sql"
+    }
+
+    @staticmethod
+    def get_greeting(language="English"):
+        """Get static greeting in the selected language"""
+        return TemplateRegistry.default().render("fallback.greeting", language)
+
+    @staticmethod
+    def get_closing(candidate_name, language="English"):
+        """Get static closing message in the selected language"""
+        return TemplateRegistry.default().render("fallback.closing", language, name=candidate_name)
+
+    @staticmethod
+    def get_questions(tech_stack, language="English", count=5):
+        """
+        Build technical questions from the local question bank
+
+        Args:
+            tech_stack: Comma-separated technologies
+            language: Candidate language
+            count: Number of questions to return
+
+        Returns:
+            list: Question strings
+        """
+        techs = [t.strip() for t in tech_stack.split(',') if t.strip()] or ["your main technology"]
+        patterns = TemplateRegistry.default().get_group("fallback.question_pattern", language)
+        questions = []
+
+        # Technology-specific questions are only available in English
+        if language == "English":
+            taxonomy = TechTaxonomy.default()
+            for tech in techs:
+                key = taxonomy.canonicalize_or_keep(tech).lower()
+                key = FallbackTemplates.QUESTION_BANK_ALIASES.get(key, key)
+                bank = FallbackTemplates.QUESTION_BANK.get(key)
+                if bank:
+                    questions.append(random.choice(bank))
+
+        # Fill the rest by rotating technologies through the localized patterns
+        pattern_order = random.sample(patterns, len(patterns))
+        i = 0
+        while len(questions) < count and i < len(pattern_order):
+            tech = techs[i % len(techs)]
+            questions.append(pattern_order[i].render(tech=tech))
+            i += 1
+
+        return questions[:count]
@@ -3,78 +3,136 @@ Groq API Client for TalentScout Hiring Assistant
 Handles all AI interactions with error handling and retry logic
 """
 import time
-from groq import Groq
 from config import Config
+from utils.model_router import ModelRouter
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 class GroqClient:
     """Wrapper for Groq API with error handling"""
     
-    def __init__(self):
-        """Initialize Groq client"""
+    def __init__(self, router=None, breaker=None):
+        """
+        Initialize Groq client
+        
+        Args:
+            router: ModelRouter to use (defaults to the shared process-wide router)
+            breaker: CircuitBreaker to use (defaults to the shared process-wide breaker)
+        """
         try:
             Config.validate()
+            # Deferred import: the SDK pulls in httpx/pydantic, which slows cold start
+            from groq import Groq
             self.client = Groq(api_key=Config.GROQ_API_KEY)
             self.model = Config.GROQ_MODEL
             self.temperature = Config.TEMPERATURE
             self.max_tokens = Config.MAX_TOKENS
+            self.router = router or ModelRouter.default()
+            self.breaker = breaker or CircuitBreaker.default()
         except Exception as e:
             raise Exception(f"Failed to initialize Groq client: {str(e)}")
     
-    def generate_response(self, messages, temperature=None, max_tokens=None):
+    def is_available(self):
+        """Check if the LLM path is usable (circuit not open)"""
+        return not self.breaker.is_open()
+    
+    def generate_response(self, messages, temperature=None, max_tokens=None, route="default", fallback=None):
         """
         Generate response from Groq API
         
         Args:
             messages: List of message dictionaries with 'role' and 'content'
             temperature: Override default temperature
-            max_tokens: Override default max tokens
+            max_tokens: Override the route's max tokens
+            route: Call site name used to pick the model tier (see Config.MODEL_ROUTES)
+            fallback: Response returned instead of an error message when the
+                call fails or the circuit is open
             
         Returns:
             str: Generated response
         """
+        if not self.breaker.allow_request():
+            if fallback is not None:
+                return fallback
+            return self._handle_error(CircuitOpenError("circuit open"))
+        
+        model, route_max_tokens = self.router.select(route)
+        start = time.perf_counter()
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=messages,
                 temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
+                max_tokens=max_tokens or route_max_tokens,
                 top_p=1,
                 stream=False
             )
             
-            return response.choices[0].message.content.strip()
+            content = response.choices[0].message.content.strip()
+            latency = time.perf_counter() - start
+            self.router.record(route, model, latency)
+            self.breaker.record_success(latency)
+            return content
             
         except Exception as e:
+            self.router.record(route, model, time.perf_counter() - start, error=True)
+            self.breaker.record_failure()
+            if fallback is not None:
+                return fallback
             return self._handle_error(e)
     
-    def generate_streaming_response(self, messages, temperature=None):
+    def generate_streaming_response(self, messages, temperature=None, route="default", fallback=None):
         """
         Generate streaming response from Groq API
         
         Args:
             messages: List of message dictionaries
             temperature: Override default temperature
+            route: Call site name used to pick the model tier
+            fallback: Yielded instead of an error message when the call
+                fails or the circuit is open
             
         Yields:
             str: Chunks of generated response
         """
+        if not self.breaker.allow_request():
+            yield fallback if fallback is not None else self._handle_error(CircuitOpenError("circuit open"))
+            return
+        
+        model, max_tokens = self.router.select(route)
+        start = time.perf_counter()
         try:
             stream = self.client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=messages,
                 temperature=temperature or self.temperature,
-                max_tokens=self.max_tokens,
+                max_tokens=max_tokens,
                 stream=True
             )
             
-            for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            try:
+                for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except GeneratorExit:
+                # The caller stopped reading early (it has what it needs)
+                close = getattr(stream, 'close', None)
+                if close:
+                    close()
+                latency = time.perf_counter() - start
+                self.router.record(route, model, latency)
+                self.breaker.record_success(latency)
+                raise
+            
+            latency = time.perf_counter() - start
+            self.router.record(route, model, latency)
+            self.breaker.record_success(latency)
                     
         except Exception as e:
-            yield self._handle_error(e)
+            self.router.record(route, model, time.perf_counter() - start, error=True)
+            self.breaker.record_failure()
+            yield fallback if fallback is not None else self._handle_error(e)
     
-    def quick_generation(self, system_prompt, user_prompt, temperature=0.7):
+    def quick_generation(self, system_prompt, user_prompt, temperature=0.7, route="default"):
         """
         Quick generation for simple tasks
         
@@ -82,6 +140,7 @@ class GroqClient:
             system_prompt: System instruction
             user_prompt: User message
             temperature: Temperature setting
+            route: Call site name used to pick the model tier
             
         Returns:
             str: Generated response
@@ -91,10 +150,13 @@ class GroqClient:
             {"role": "user", "content": user_prompt}
         ]
         
-        return self.generate_response(messages, temperature=temperature)
+        return self.generate_response(messages, temperature=temperature, route=route)
     
     def _handle_error(self, error):
         """Handle API errors gracefully"""
+        if isinstance(error, CircuitOpenError):
+            return "I'm having trouble reaching the AI service right now. Let's continue - please repeat your last message in a moment."
+        
         error_msg = str(error).lower()
         
         if "rate limit" in error_msg:
@@ -123,20 +185,21 @@ class GroqClient:
         
         return True
     
-    def generate_with_retry(self, messages, max_retries=3):
+    def generate_with_retry(self, messages, max_retries=3, route="default"):
         """
         Generate response with retry logic
         
         Args:
             messages: List of message dictionaries
             max_retries: Maximum number of retry attempts
+            route: Call site name used to pick the model tier
             
         Returns:
             str: Generated response
         """
         for attempt in range(max_retries):
             try:
-                response = self.generate_response(messages)
+                response = self.generate_response(messages, route=route)
                 
                 if self.validate_response(response):
                     return response
@@ -159,7 +222,7 @@ class GroqClient:
                 {"role": "user", "content": "Say 'OK' if you can hear me."}
             ]
             
-            response = self.generate_response(test_messages, temperature=0)
+            response = self.generate_response(test_messages, temperature=0, route="connection_test")
             return "OK" in response.upper() or "ok" in response.lower()
             
         except Exception as e:
@@ -0,0 +1,787 @@
+"""
+Interview engine for TalentScout Hiring Assistant
+Framework-independent interview state machine shared by the Streamlit app and the API server
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from config import Config
+from utils.prompt_templates import PromptTemplates
+from utils.fallback_templates import FallbackTemplates
+from utils.answer_scoring import summarize_scores
+from utils.sentiment_analyzer import SentimentAnalyzer
+from utils.sentiment_history import SentimentHistory
+from utils.task_queue import TaskQueue
+from utils.validators import InputValidator
+from utils.data_handler import ConversationExporter
+from utils.preprocessing import analyze_message
+from utils.question_bank import stream_questions, BAND_EXPERIENCE
+from utils.response_cache import NAME_PLACEHOLDER, closing_template
+from utils.timing import StageTimer
+from utils.turn_log import TurnLog
+
+REQUIRED_FIELDS = ['name', 'email', 'phone', 'experience', 'position', 'location', 'tech_stack']
+
+# Info fields in the order they are asked: field -> (next field, re-prompt after an error)
+INFO_FIELDS = {
+    'name': ('email', None),
+    'email': ('phone', "Please try again."),
+    'phone': ('experience', "Please provide a valid phone number."),
+    'experience': ('position', "How many years of experience do you have?"),
+    'position': ('location', "What position are you applying for?"),
+    'location': (None, "Where are you currently located?"),
+}
+
+EXIT_MESSAGE = ("I understand you'd like to end our conversation. Thank you for your time! "
+                "If you'd like to continue your application later, please feel free to return.")
+
+
+class InterviewState:
+    """Everything one interview needs between turns; serializable with to_dict"""
+
+    def __init__(self, session_id=None, language="English"):
+        """
+        Initialize a new interview
+
+        Args:
+            session_id: Identifier of the interview (generated if omitted)
+            language: Candidate language
+        """
+        self.session_id = session_id or uuid.uuid4().hex
+        self.language = language
+        self.stage = 'greeting'
+        self.awaiting_field = None
+        self.candidate_data = {}
+        self.turns = TurnLog()  # Transcript; also the source of the LLM context
+        self.technical_questions = []  # Questions known so far (the rest may still be generating)
+        self.question_count = 0  # Questions announced to the candidate ("Question 1 of N")
+        self.current_question_index = 0
+        self.technical_answers = []
+        self.tech_questions_asked = False
+        self.complete = False
+        self.sentiment_history = SentimentHistory()
+        self.turn_timings = None
+
+    def to_dict(self):
+        """Serialize to JSON-safe data"""
+        return {
+            'session_id': self.session_id,
+            'language': self.language,
+            'stage': self.stage,
+            'awaiting_field': self.awaiting_field,
+            'candidate_data': self.candidate_data,
+            'turns': self.turns.to_list(),
+            'technical_questions': self.technical_questions,
+            'question_count': self.question_count,
+            'current_question_index': self.current_question_index,
+            'technical_answers': self.technical_answers,
+            'tech_questions_asked': self.tech_questions_asked,
+            'complete': self.complete,
+            'sentiment_history': self.sentiment_history.to_dict(),
+            'turn_timings': self.turn_timings
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild state saved with to_dict"""
+        state = cls(data['session_id'], data.get('language', "English"))
+        for key in ('stage', 'awaiting_field', 'candidate_data', 'technical_questions',
+                    'question_count', 'current_question_index', 'technical_answers',
+                    'tech_questions_asked', 'complete', 'turn_timings'):
+            if key in data:
+                setattr(state, key, data[key])
+        if 'question_count' not in data:
+            state.question_count = len(state.technical_questions)
+        if 'turns' in data:
+            state.turns = TurnLog.from_list(data['turns'])
+        elif 'messages' in data:
+            # Snapshot saved before the turn log
+            state.turns = TurnLog.from_messages(data['messages'], data.get('context', ()))
+        if 'sentiment_history' in data:
+            state.sentiment_history = SentimentHistory.from_dict(data['sentiment_history'])
+        return state
+
+
+def plan_question_slots(techs):
+    """
+    Spread the question slots over the candidate's technologies
+
+    Args:
+        techs: Canonical technology names in the order given
+
+    Returns:
+        list: (technology, question count) pairs, one LLM call each
+    """
+    total = max(Config.QUESTION_COUNT_MIN, min(Config.QUESTION_COUNT_MAX, len(techs)))
+    counts = {}
+    for i in range(total):
+        tech = techs[i % len(techs)]
+        counts[tech] = counts.get(tech, 0) + 1
+    return list(counts.items())
+
+
+class InterviewEngine:
+    """
+    Runs interview turns against an InterviewState
+
+    The engine holds no per-interview data, so one instance serves every
+    session of a process; callers serialize turns of the same interview.
+    Technical answers are scored in the background while the next
+    question is shown. Work after the closing message (sentiment summary,
+    remaining scores, saving, index refresh, transcript export) runs as
+    background tasks.
+    """
+
+    def __init__(self, groq_client=None, data_handler=None, executor=None, on_save=None,
+                 task_queue=None, question_bank=None, scorer=None,
+                 response_cache=None, journal=None):
+        """
+        Initialize engine
+
+        Args:
+            groq_client: GroqClient, or None to run on fallback templates only
+            data_handler: DataHandler used to save finished interviews
+            executor: Thread pool for work that overlaps a turn (created if omitted)
+            on_save: Called with the candidate data after a candidate is saved
+            task_queue: TaskQueue for post-interview work (runs inline if omitted)
+            question_bank: QuestionBank serving precomputed technical questions
+            scorer: AnswerScorer grading technical answers (answers stay unscored if omitted)
+            response_cache: ResponseCache serving greeting and closing variants
+            journal: TranscriptJournal recording every turn (transcripts are exported at close if omitted)
+        """
+        self.groq_client = groq_client
+        self.data_handler = data_handler
+        self.on_save = on_save
+        self._executor = executor
+        self._executor_lock = threading.Lock()
+        self._question_executor = None
+        # session id -> futures of questions generated after the first was shown
+        self._pending_questions = OrderedDict()
+        self._pending_lock = threading.Lock()
+        self.scorer = scorer
+        # session id -> {answer index: future} of scores not yet stored
+        self._pending_scores = OrderedDict()
+
+        self.tasks = task_queue or TaskQueue(workers=0)
+        self.tasks.register('aggregate_sentiment', self._aggregate_sentiment_task)
+        self.tasks.register('score_answers', self._score_answers_task)
+        self.tasks.register('persist_candidate', self._persist_candidate_task)
+        self.tasks.register('refresh_indexes', self._refresh_indexes_task)
+        self.tasks.register('export_transcript', self._export_transcript_task)
+        self.tasks.register('refresh_question_bank', self._refresh_question_bank_task)
+
+        self.question_bank = question_bank
+        self.response_cache = response_cache
+        self.journal = journal
+        self._refreshing = set()  # Bank keys with a refresh task queued
+        self.tasks.start()
+
+    @property
+    def executor(self):
+        """Turn worker pool, created on first use"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=Config.TURN_WORKERS, thread_name_prefix="turn"
+                    )
+        return self._executor
+
+    @property
+    def question_executor(self):
+        """Pool for per-technology question calls, created on first use"""
+        if self._question_executor is None:
+            with self._executor_lock:
+                if self._question_executor is None:
+                    self._question_executor = ThreadPoolExecutor(
+                        max_workers=Config.QUESTION_WORKERS, thread_name_prefix="questions"
+                    )
+        return self._question_executor
+
+    def new_state(self, language="English", session_id=None):
+        """Create state for a new interview"""
+        return InterviewState(session_id, language)
+
+    def start(self, state):
+        """
+        Greet the candidate and move to information gathering
+
+        Returns:
+            str: Greeting
+        """
+        greeting = self.generate_greeting(state)
+        state.turns.append('assistant', greeting, in_context=False)
+        if self.journal is not None:
+            self.journal.append(state.session_id, 'assistant', greeting)
+        state.stage = 'info_gathering'
+        state.awaiting_field = 'name'
+        return greeting
+
+    def handle_message(self, state, user_message):
+        """
+        Run one turn: record the message, respond and advance the interview
+
+        Args:
+            state: InterviewState to update
+            user_message: Candidate message
+
+        Returns:
+            str: Assistant response
+        """
+        collected = len(state.candidate_data)
+        user_turn = state.turns.append('user', user_message, in_context=False)
+        response, in_context = self.get_response(state, user_turn)
+        state.turns.append('assistant', response, in_context)
+        if self.journal is not None:
+            self.journal.append(state.session_id, 'user', user_message)
+            self.journal.append(state.session_id, 'assistant', response)
+            if len(state.candidate_data) != collected:
+                self.journal.note_candidate(state.session_id, state.candidate_data)
+        if state.complete:
+            self.submit_post_interview(state)
+        return response
+
+    def get_response(self, state, user_turn):
+        """
+        Generate the response to a candidate message
+
+        Args:
+            state: InterviewState to update
+            user_turn: Turn holding the candidate message
+
+        Returns:
+            tuple: (response, whether the response joins the LLM context)
+        """
+        timer = StageTimer()
+        analyzer = SentimentAnalyzer(history=state.sentiment_history)
+        user_message = user_turn.content
+        sentiment_future = None
+        try:
+            # Tokenize once; the exit check, sentiment and stage validators
+            # all reuse this cached analysis
+            message = timer.timed('preprocess', analyze_message, user_message)
+
+            # Check for exit command
+            if message.exit_intent:
+                return self.handle_exit(state), False
+
+            # Analyze sentiment on a worker while the stage handler runs;
+            # the result is only needed for tone adjustment at the end
+            sentiment_future = self.executor.submit(
+                timer.timed, 'sentiment', analyzer.analyze_sentiment, user_message
+            )
+
+            # Add user message to the LLM context
+            user_turn.in_context = True
+
+            with timer.stage('stage_handler'):
+                response = self.run_stage_handler(state, user_message)
+
+            # Adjust response for sentiment if needed
+            with timer.stage('sentiment_join'):
+                sentiment = sentiment_future.result()
+            if sentiment['needs_support']:
+                response = analyzer.adjust_response_tone(response, sentiment)
+
+            return response, True
+
+        except Exception as e:
+            return f"I apologize, but I encountered an issue. Could you please repeat that? Error: {str(e)}", False
+        finally:
+            # After an error the sentiment worker must not touch the history
+            # once this turn has returned
+            if sentiment_future is not None and not sentiment_future.cancel():
+                wait([sentiment_future])
+            state.turn_timings = {
+                'stages': timer.report(),
+                'overlap_ms': round(timer.overlap('sentiment', 'stage_handler') * 1000, 2)
+            }
+
+    def run_stage_handler(self, state, user_message):
+        """Dispatch the message to the handler for the current stage"""
+        if state.stage == 'greeting':
+            response = self.generate_greeting(state)
+            state.stage = 'info_gathering'
+            state.awaiting_field = 'name'
+
+        elif state.stage == 'info_gathering':
+            response = self.handle_info_gathering(state, user_message)
+
+        elif state.stage == 'tech_stack':
+            response = self.handle_tech_stack(state, user_message)
+
+        elif state.stage == 'technical_questions':
+            response = self.handle_technical_questions(state, user_message)
+
+        elif state.stage == 'closing':
+            response = self.generate_closing(state)
+            state.complete = True
+
+        else:
+            response = "I'm here to help with your application. Let's continue!"
+
+        return response
+
+    def generate_greeting(self, state):
+        """Generate initial greeting"""
+        language = state.language
+        fallback = FallbackTemplates.get_greeting(language)
+        if self.response_cache is not None:
+            cached = self.response_cache.pick('greeting', language)
+            if cached:
+                return cached
+        if self.groq_client is None:
+            return fallback
+        try:
+            messages = self._api_messages(state)
+            greeting_prompt = f"{PromptTemplates.GREETING_PROMPT}\nIMPORTANT: Please generate this greeting in {language} language."
+
+            messages.append({'role': 'user', 'content': greeting_prompt})
+            response = self.groq_client.generate_response(messages, route='greeting', fallback=fallback)
+
+            if not response or response.strip() == "":
+                return fallback
+
+            if self.response_cache is not None and response != fallback:
+                self.response_cache.add('greeting', language, response)
+            return response
+        except Exception:
+            return fallback
+
+    def handle_info_gathering(self, state, user_message):
+        """Handle information gathering stage"""
+        field = state.awaiting_field
+        language = state.language
+
+        if field not in INFO_FIELDS:
+            return "Could you please provide that information again?"
+
+        if field == 'experience':
+            is_valid, value, error = InputValidator.validate_experience(user_message)
+        else:
+            validate = getattr(InputValidator, f"validate_{field}")
+            is_valid, error = validate(user_message)
+            value = user_message.strip()
+
+        if not is_valid:
+            if field == 'name':
+                # If the validator detected a greeting, reply politely but stay on the name step
+                if "greeting" in error.lower():
+                    return PromptTemplates.get_name_greeting_reply(language)
+                # For other errors (too short, numbers, etc.), show the standard error
+                return f"I'm sorry, but {error}. Could you please provide your full name?"
+            return f"{error}. {INFO_FIELDS[field][1]}"
+
+        state.candidate_data[field] = value
+        next_field = INFO_FIELDS[field][0]
+        state.awaiting_field = next_field
+        if next_field is None:
+            state.stage = 'tech_stack'
+        return PromptTemplates.get_info_prompt(field, state.candidate_data, language)
+
+    def handle_tech_stack(self, state, user_message):
+        """Handle tech stack input and generate questions"""
+        is_valid, cleaned_tech, suggestions, error = InputValidator.validate_tech_stack(user_message)
+        language = state.language
+
+        if not is_valid:
+            return f"{error} Please list the technologies you're proficient in."
+
+        state.candidate_data['tech_stack'] = ', '.join(cleaned_tech)
+        slots = plan_question_slots(cleaned_tech)
+        total = sum(count for _, count in slots)
+        band, _ = PromptTemplates.difficulty_band(state.candidate_data['experience'])
+
+        # Precomputed questions first; the LLM only covers what the bank lacks
+        if self.question_bank is not None:
+            questions, missing = self.question_bank.select(slots, band, language)
+        else:
+            questions, missing = [], slots
+
+        # Skip the LLM entirely while the circuit is open
+        generating = missing and self.groq_client is not None and self.groq_client.is_available()
+        if generating:
+            # With bank questions to show, the turn doesn't wait for the LLM at all
+            generated = self.start_question_generation(state, missing, block=not questions)
+            questions.extend(q for q in generated if q not in questions)
+
+        if self.question_bank is not None:
+            # Keys generated above are topped up once their questions are in the bank
+            being_generated = {tech for tech, _ in missing} if generating else set()
+            self.refresh_question_bank([slot for slot in slots if slot[0] not in being_generated], band, language)
+
+        if not questions:
+            # LLM unavailable or output unusable: use the built-in fallback questions
+            questions = FallbackTemplates.get_questions(state.candidate_data['tech_stack'], language)
+            total = len(questions)
+
+        state.technical_questions = questions
+        state.question_count = total
+        state.current_question_index = 0
+        state.stage = 'technical_questions'
+        return f"Great! I can see you work with {state.candidate_data['tech_stack']}. Let me ask you some technical questions to assess your skills.\n\n**Question 1 of {total}:**\n\n{state.technical_questions[0]}"
+
+    def start_question_generation(self, state, slots, block=True):
+        """
+        Generate questions with one concurrent LLM call per technology
+
+        Returns as soon as any call has streamed one complete question (or
+        at once with block=False); the calls keep running and are collected
+        when the candidate answers.
+
+        Args:
+            state: InterviewState
+            slots: (technology, count) pairs to generate
+            block: Wait for the first question
+
+        Returns:
+            list: Questions available now (empty if every call failed, or without waiting)
+        """
+        experience = state.candidate_data['experience']
+        arrived = []
+        ready = threading.Condition()
+
+        def on_question(question):
+            with ready:
+                arrived.append(question)
+                ready.notify_all()
+
+        def on_done(future):
+            with ready:
+                ready.notify_all()
+
+        futures = []
+        for tech, count in slots:
+            future = self.question_executor.submit(
+                self.generate_questions, tech, count, experience, state.language, on_question
+            )
+            future.add_done_callback(on_done)
+            futures.append(future)
+
+        if not block:
+            self._set_pending_questions(state, futures)
+            return []
+
+        with ready:
+            ready.wait_for(lambda: arrived or all(f.done() for f in futures))
+            first = arrived[:1]
+        if first:
+            self._set_pending_questions(state, futures)
+        return first
+
+    def generate_questions(self, technology, count, experience, language, on_question=None):
+        """
+        Ask the LLM for questions about one technology and keep them in the bank
+
+        Args:
+            technology: Canonical technology name
+            count: Questions wanted
+            experience: Candidate years of experience
+            language: Candidate language
+            on_question: Called with each question as soon as it is complete
+
+        Returns:
+            list: Up to count questions (empty if the call failed)
+        """
+        questions = stream_questions(self.groq_client, technology, count, experience, language, on_question)
+        if questions and self.question_bank is not None:
+            band, _ = PromptTemplates.difficulty_band(experience)
+            self.question_bank.add(technology, band, language, questions)
+            self.refresh_question_bank([(technology, count)], band, language)
+        return questions
+
+    def refresh_question_bank(self, slots, band, language):
+        """
+        Queue background top-ups for bank keys below target
+
+        Submitted from the question pool, never the caller's thread: with
+        an inline task queue the refresh would otherwise run (and call the
+        LLM) inside the candidate's turn.
+        """
+        if self.groq_client is None:
+            return
+        for tech, _ in slots:
+            key = self.question_bank.key(tech, band, language)
+            if key in self._refreshing or not self.question_bank.needs_refresh(tech, band, language):
+                continue
+            self._refreshing.add(key)
+            self.question_executor.submit(
+                self.tasks.submit, 'refresh_question_bank',
+                {'technology': tech, 'band': band, 'language': language}
+            )
+
+    def collect_questions(self, state):
+        """
+        Add questions generated since the first was shown
+
+        Waits only until the next question is available; calls still
+        running stay pending. Once none are left, calls that failed (or
+        were lost with a restart) are filled from the local question bank
+        so the announced total still holds.
+        """
+        with self._pending_lock:
+            pending = self._pending_questions.pop(state.session_id, [])
+        while pending:
+            done = [f for f in pending if f.done()]
+            if not done:
+                if len(state.technical_questions) > state.current_question_index:
+                    break
+                wait(pending, return_when=FIRST_COMPLETED)
+                continue
+            for future in done:
+                pending.remove(future)
+                if future.exception() is not None:
+                    print(f"Question generation failed: {future.exception()}")
+                    continue
+                for question in future.result():
+                    if question not in state.technical_questions:
+                        state.technical_questions.append(question)
+
+        if pending:
+            self._set_pending_questions(state, pending)
+            return
+
+        if len(state.technical_questions) < state.question_count:
+            for question in FallbackTemplates.get_questions(state.candidate_data['tech_stack'], state.language):
+                if len(state.technical_questions) >= state.question_count:
+                    break
+                if question not in state.technical_questions:
+                    state.technical_questions.append(question)
+        del state.technical_questions[state.question_count:]
+        state.question_count = len(state.technical_questions)
+
+    def _set_pending_questions(self, state, pending):
+        """Keep question futures for the interview's next turns (bounded across sessions)"""
+        if not pending:
+            return
+        with self._pending_lock:
+            self._pending_questions[state.session_id] = pending
+            while len(self._pending_questions) > Config.PENDING_QUESTION_SESSIONS:
+                self._pending_questions.popitem(last=False)
+
+    def handle_technical_questions(self, state, user_message):
+        """Handle technical question responses"""
+        state.technical_answers.append({
+            'question': state.technical_questions[state.current_question_index],
+            'answer': user_message
+        })
+        self.submit_score(state, len(state.technical_answers) - 1)
+        self.collect_scores(state)
+        state.current_question_index += 1
+        if state.current_question_index >= len(state.technical_questions):
+            self.collect_questions(state)
+        if state.current_question_index < len(state.technical_questions):
+            next_num = state.current_question_index + 1
+            total = state.question_count
+            next_q = state.technical_questions[state.current_question_index]
+            return f"Thank you for your answer!\n\n**Question {next_num} of {total}:**\n\n{next_q}"
+
+        state.candidate_data['technical_responses'] = state.technical_answers
+        state.tech_questions_asked = True
+        state.stage = 'closing'
+        return "Thank you for your detailed responses to all the technical questions! Let me wrap up our interview."
+
+    def submit_score(self, state, index):
+        """Queue one answer for background scoring"""
+        if self.scorer is None:
+            return
+        answer = state.technical_answers[index]
+        future = self.scorer.submit(answer['question'], answer['answer'], state.session_id)
+        with self._pending_lock:
+            self._pending_scores.setdefault(state.session_id, {})[index] = future
+            self._pending_scores.move_to_end(state.session_id)
+            while len(self._pending_scores) > Config.PENDING_SCORE_SESSIONS:
+                self._pending_scores.popitem(last=False)
+
+    def collect_scores(self, state):
+        """Store scores that have finished (never waits)"""
+        with self._pending_lock:
+            pending = self._pending_scores.get(state.session_id)
+            if not pending:
+                return
+            done = {i: f for i, f in pending.items() if f.done()}
+            for index in done:
+                del pending[index]
+        for index, future in done.items():
+            if future.result() is not None:
+                state.technical_answers[index]['score'] = future.result()
+
+    def generate_closing(self, state):
+        """Generate closing message; saving happens in submit_post_interview"""
+        language = state.language
+        candidate_name = state.candidate_data.get('name', 'candidate')
+        fallback = FallbackTemplates.get_closing(candidate_name, language)
+        cached = self.response_cache.pick('closing', language) if self.response_cache is not None else None
+        if cached:
+            closing = cached.replace(NAME_PLACEHOLDER, candidate_name)
+        elif self.groq_client is None:
+            closing = fallback
+        else:
+            prompt = PromptTemplates.get_closing_prompt(candidate_name, language)
+            messages = [
+                {'role': 'system', 'content': PromptTemplates.SYSTEM_PROMPT},
+                {'role': 'user', 'content': prompt}
+            ]
+            closing = self.groq_client.generate_response(messages, route='closing', fallback=fallback)
+            template = closing_template(closing, candidate_name) if closing != fallback else None
+            if template and self.response_cache is not None:
+                self.response_cache.add('closing', language, template)
+        return closing
+
+    def submit_post_interview(self, state):
+        """
+        Queue the work that follows a finished interview
+
+        Runs after the closing message is in the transcript, so the
+        candidate sees it without waiting for any of this.
+        """
+        self.collect_scores(state)
+        candidate = dict(
+            state.candidate_data,
+            interview_id=state.session_id,
+            technical_responses=[dict(answer) for answer in state.technical_answers],
+            conversation_history=state.turns.api_context(Config.MAX_CONTEXT_LENGTH)
+        )
+        if self.journal is not None:
+            # Recorded before the tasks below can add to the candidate
+            self.journal.close(state.session_id, {
+                key: value for key, value in candidate.items() if key != 'conversation_history'
+            })
+        self.tasks.submit('aggregate_sentiment', {
+            'candidate': candidate,
+            'sentiment_history': state.sentiment_history.to_dict()
+        })
+        if self.journal is not None:
+            # Every turn is already journaled; transcripts are rendered from it on demand
+            return
+        self.tasks.submit('export_transcript', {
+            'messages': state.turns.messages(),
+            'candidate': candidate,
+            # Fixed here so a retried export overwrites the same file
+            'filename': "data/transcript_{}_{}.txt".format(
+                candidate.get('name', 'Unknown').replace(' ', '_'),
+                datetime.now().strftime("%Y%m%d_%H%M%S")
+            )
+        })
+
+    # Post-interview tasks (may run more than once; see utils/task_queue.py)
+
+    def _aggregate_sentiment_task(self, payload):
+        """Add the emotion summary, then save the candidate"""
+        history = SentimentHistory.from_dict(payload['sentiment_history'])
+        candidate = payload['candidate']
+        candidate['sentiment_summary'] = SentimentAnalyzer(history=history).get_emotion_summary()
+        return [('score_answers', {'candidate': candidate})]
+
+    def _score_answers_task(self, payload):
+        """
+        Fill in the scores still missing, then save the candidate
+
+        Scores in flight when the interview closed are awaited; answers
+        without one (scoring failed, or the process restarted) are scored
+        here in one batch. Never fails: answers that still can't be scored
+        are saved with score None rather than holding up the candidate.
+        """
+        candidate = payload['candidate']
+        responses = candidate.get('technical_responses') or []
+        with self._pending_lock:
+            pending = self._pending_scores.pop(candidate['interview_id'], {})
+        if pending:
+            wait(pending.values(), timeout=Config.SCORING_WAIT)
+        for index, future in pending.items():
+            if future.done() and future.result() is not None and index < len(responses):
+                responses[index]['score'] = future.result()
+
+        unscored = [r for r in responses if not isinstance(r.get('score'), dict)]
+        if unscored and self.scorer is not None:
+            try:
+                scores = self.scorer.score_batch([(r['question'], r['answer']) for r in unscored])
+            except Exception as e:
+                print(f"Answer scoring failed: {str(e)}")
+                scores = [None] * len(unscored)
+            for response, score in zip(unscored, scores):
+                response['score'] = score
+        for response in responses:
+            response.setdefault('score', None)
+
+        candidate['answer_score'] = summarize_scores(responses)
+        return [('persist_candidate', {'candidate': candidate})]
+
+    def _persist_candidate_task(self, payload):
+        """Save the candidate once per interview"""
+        if self.data_handler is None:
+            return None
+        candidate = payload['candidate']
+        # The store checks for the interview and saves under its writer lock
+        if not self.data_handler.save_candidate(candidate, unique_key='interview_id'):
+            raise IOError(f"Could not save candidate for interview {candidate['interview_id']}")
+        return [('refresh_indexes', {'candidate': candidate})]
+
+    def _refresh_indexes_task(self, payload):
+        """Let caches built from the candidate store pick up the new candidate"""
+        if self.on_save:
+            self.on_save(payload['candidate'])
+
+    def _refresh_question_bank_task(self, payload):
+        """Generate questions for a bank key until it reaches its target"""
+        bank = self.question_bank
+        if bank is None or self.groq_client is None:
+            return None
+        tech, band, language = payload['technology'], payload['band'], payload['language']
+        try:
+            missing = bank.target - bank.size(tech, band, language)
+            if missing <= 0:
+                return None
+            if not self.groq_client.is_available():
+                raise IOError("LLM unavailable")
+            questions = stream_questions(
+                self.groq_client, tech, missing, BAND_EXPERIENCE[band], language
+            )
+            if not bank.add(tech, band, language, questions):
+                raise IOError(f"No new questions for {tech} ({band}, {language})")
+        finally:
+            self._refreshing.discard(bank.key(tech, band, language))
+        return None
+
+    def _export_transcript_task(self, payload):
+        """Write the transcript file"""
+        filename = ConversationExporter.export_conversation(
+            payload['messages'], payload['candidate'], payload['filename']
+        )
+        if filename is None:
+            raise IOError("Could not export transcript")
+
+    def handle_exit(self, state):
+        """Handle exit command"""
+        state.stage = 'closing'
+        return EXIT_MESSAGE
+
+    def progress(self, state):
+        """Interview progress in percent"""
+        required = len(REQUIRED_FIELDS)
+        completed = sum(1 for field in REQUIRED_FIELDS if field in state.candidate_data)
+        if state.tech_questions_asked:
+            completed += 1
+            required += 1
+        return (completed / required) * 100
+
+    def summary(self, state):
+        """Compact view of an interview for clients"""
+        latest = state.sentiment_history.latest()
+        return {
+            'session_id': state.session_id,
+            'stage': state.stage,
+            'awaiting_field': state.awaiting_field,
+            'progress': round(self.progress(state), 1),
+            'complete': state.complete,
+            'mood': latest['sentiment'] if latest else None
+        }
+
+    @staticmethod
+    def _api_messages(state):
+        """System prompt plus the recent LLM context of an interview"""
+        messages = [{'role': 'system', 'content': PromptTemplates.SYSTEM_PROMPT}]
+        messages.extend(state.turns.api_context(Config.MAX_CONTEXT_LENGTH))
+        return messages
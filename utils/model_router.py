@@ -0,0 +1,178 @@
+"""
+Model Router for TalentScout Hiring Assistant
+Maps call sites to model tiers and token budgets with latency-aware fallback
+"""
+import math
+import threading
+from collections import deque
+from config import Config
+
+
+class RouteStats:
+    """Rolling latency and error record for one route/model pair"""
+
+    def __init__(self, window):
+        """
+        Initialize route statistics
+
+        Args:
+            window: Number of latency samples to keep
+        """
+        # Failed calls are kept as infinitely slow samples, so they push p95 up
+        self.latencies = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+
+    def record(self, latency, error=False):
+        """Record a single call"""
+        self.calls += 1
+        if error:
+            self.errors += 1
+        self.latencies.append(math.inf if error else latency)
+
+    def clear(self):
+        """Drop the latency window (call counts are kept)"""
+        self.latencies.clear()
+
+    def percentile(self, pct, last=None, errors=True):
+        """
+        Get latency percentile (seconds) over the window
+
+        Args:
+            pct: Percentile (0-100)
+            last: Only use the newest N samples
+            errors: Include failed calls (as infinitely slow)
+
+        Returns:
+            float: Latency, or None without samples
+        """
+        samples = list(self.latencies)[-last:] if last else self.latencies
+        if not errors:
+            samples = [latency for latency in samples if latency != math.inf]
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self):
+        """Get statistics as a dictionary (latencies of successful calls)"""
+        p50 = self.percentile(50, errors=False)
+        p95 = self.percentile(95, errors=False)
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'error_rate': round(self.errors / self.calls, 3) if self.calls else 0.0,
+            'p50': round(p50, 3) if p50 is not None else None,
+            'p95': round(p95, 3) if p95 is not None else None,
+            'samples': len(self.latencies)
+        }
+
+
+class ModelRouter:
+    """Selects a model and token budget for each call site"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, routes=None, window=None, min_samples=None, probe_interval=None):
+        """
+        Initialize model router
+
+        Args:
+            routes: Route table (defaults to Config.MODEL_ROUTES)
+            window: Latency samples kept per route/model
+            min_samples: Samples required before p95 is used for routing
+            probe_interval: While degraded, send every Nth call to the primary
+        """
+        self.routes = routes or Config.MODEL_ROUTES
+        self.window = window or Config.ROUTE_LATENCY_WINDOW
+        self.min_samples = min_samples or Config.ROUTE_MIN_SAMPLES
+        self.probe_interval = probe_interval or Config.ROUTE_PROBE_INTERVAL
+        self._stats = {}
+        self._degraded_calls = {}  # route -> calls since it degraded
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide router so latency is observed across sessions"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def get_route(self, route):
+        """Get route configuration, falling back to the default route"""
+        return self.routes.get(route) or self.routes['default']
+
+    def select(self, route="default"):
+        """
+        Select model and max tokens for a route
+
+        Args:
+            route: Call site name (key of the route table)
+
+        Returns:
+            tuple: (model, max_tokens)
+        """
+        config = self.get_route(route)
+        model = config['model']
+        fallback = config.get('fallback_model')
+
+        if fallback and self._is_degraded(route, model, config['latency_slo']):
+            with self._lock:
+                count = self._degraded_calls.get(route, 0) + 1
+                self._degraded_calls[route] = count
+            # Periodically probe the primary so it can recover
+            if count % self.probe_interval != 0:
+                model = fallback
+
+        return model, config['max_tokens']
+
+    def record(self, route, model, latency, error=False):
+        """
+        Record the outcome of a call
+
+        Args:
+            route: Call site name
+            model: Model that served the call
+            latency: Wall time in seconds
+            error: Whether the call failed
+        """
+        with self._lock:
+            key = (route, model)
+            if key not in self._stats:
+                self._stats[key] = RouteStats(self.window)
+            self._stats[key].record(latency, error)
+
+    def _is_degraded(self, route, model, slo):
+        """
+        Check if the primary model's p95 latency exceeds the SLO
+
+        The window is cleared when a route degrades, so it then holds only
+        probes; the route recovers as soon as the newest min_samples probes
+        are within the SLO.
+        """
+        with self._lock:
+            stats = self._stats.get((route, model))
+            if route in self._degraded_calls:
+                if stats and len(stats.latencies) >= self.min_samples \
+                        and stats.percentile(95, last=self.min_samples) <= slo:
+                    del self._degraded_calls[route]
+                    return False
+                return True
+            if not stats or len(stats.latencies) < self.min_samples:
+                return False
+            if stats.percentile(95) > slo:
+                self._degraded_calls[route] = 0
+                stats.clear()
+                return True
+            return False
+
+    def get_stats(self):
+        """Get per-route latency and error record"""
+        with self._lock:
+            report = {}
+            for (route, model), stats in self._stats.items():
+                report.setdefault(route, {})[model] = stats.to_dict()
+            return report
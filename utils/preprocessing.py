@@ -0,0 +1,195 @@
+"""
+Message preprocessing for TalentScout Hiring Assistant
+Normalizes and tokenizes each message once for exit detection, sentiment and validation
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from config import Config
+
+_WHITESPACE = re.compile(r'\s+')
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)*")
+
+NUMBER_PATTERN = re.compile(r'\d+\.?\d*')
+EMAIL_CANDIDATE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_CANDIDATE = re.compile(r'\+?\(?\d[\d\s\-().]{5,18}\d')
+
+# Whole-message inputs that carry no sentiment (matched on normalized text)
+STRUCTURED_PATTERNS = (
+    ('email', re.compile(r'^[^@\s]+@[^@\s]+\.[a-z]{2,}$')),
+    ('number', re.compile(r'^[-+]?\d+(?:[.,]\d+)?\s*(?:years?|yrs?|y)?$')),
+    ('phone', re.compile(r'^\+?[\d\s\-().]{7,20}$')),
+)
+
+# Emotion keyword groups: (keywords in priority order, keyword -> emotion, default emotion)
+EMOTION_GROUPS = (
+    (
+        ['great', 'excited', 'happy', 'love', 'awesome', 'perfect',
+         'excellent', 'wonderful', 'fantastic', 'amazing', 'good',
+         'nice', 'thanks', 'appreciate', 'glad', 'pleased'],
+        {'excited': 'excited', 'love': 'excited', 'amazing': 'excited', 'fantastic': 'excited',
+         'thanks': 'grateful', 'appreciate': 'grateful'},
+        'happy'
+    ),
+    (
+        ['confused', 'frustrated', 'angry', 'upset', 'disappointed',
+         'worried', 'nervous', 'anxious', 'difficult', 'hard',
+         'struggle', 'problem', 'issue', 'hate', 'bad', 'terrible'],
+        {'confused': 'confused', 'frustrated': 'frustrated', 'angry': 'frustrated',
+         'upset': 'frustrated', 'worried': 'anxious', 'nervous': 'anxious', 'anxious': 'anxious'},
+        'unhappy'
+    ),
+    (
+        ['maybe', 'perhaps', 'not sure', 'unsure', 'confused',
+         "don't know", 'uncertain', 'unclear', 'guess'],
+        {},
+        'uncertain'
+    ),
+)
+
+
+def _build_emotion_index():
+    """
+    Index emotion keywords by their first token
+
+    Returns:
+        dict: first token -> list of (keyword tokens, [(group, rank, emotion)]),
+            longest keywords first
+    """
+    hits = {}
+    for group, (keywords, mapping, default) in enumerate(EMOTION_GROUPS):
+        for rank, keyword in enumerate(keywords):
+            hits.setdefault(keyword, []).append((group, rank, mapping.get(keyword, default)))
+
+    index = {}
+    for keyword, keyword_hits in hits.items():
+        words = tuple(keyword.split())
+        index.setdefault(words[0], []).append((words, keyword_hits))
+    for entries in index.values():
+        entries.sort(key=lambda entry: len(entry[0]), reverse=True)
+    return index
+
+
+_EMOTION_INDEX = _build_emotion_index()
+
+
+def normalize(text):
+    """Normalize text (case and whitespace insensitive); also the sentiment memo key"""
+    return _WHITESPACE.sub(' ', text.strip().lower())
+
+
+def tokenize(normalized):
+    """Word tokens of normalized text (apostrophes kept inside words)"""
+    return tuple(_TOKEN.findall(normalized.replace('’', "'")))
+
+
+def classify_structured(normalized):
+    """
+    Detect structured inputs such as emails, phone numbers and numbers
+
+    Returns:
+        str: 'email', 'number', 'phone' or None
+    """
+    for kind, pattern in STRUCTURED_PATTERNS:
+        if pattern.match(normalized):
+            return kind
+    return None
+
+
+def match_emotions(tokens):
+    """
+    Match emotion keywords as whole tokens or token sequences
+
+    A phrase hit ("not sure") consumes its tokens, so its words are not
+    matched again individually.
+
+    Returns:
+        tuple: (matched keywords, emotions ordered by group)
+    """
+    matched = []
+    best_hits = {}  # group -> (rank, emotion)
+    i = 0
+    count = len(tokens)
+    while i < count:
+        step = 1
+        for words, keyword_hits in _EMOTION_INDEX.get(tokens[i], ()):
+            if tokens[i:i + len(words)] == words:
+                matched.append(' '.join(words))
+                for group, rank, emotion in keyword_hits:
+                    current = best_hits.get(group)
+                    if current is None or rank < current[0]:
+                        best_hits[group] = (rank, emotion)
+                step = len(words)
+                break
+        i += step
+
+    emotions = []
+    for group in sorted(best_hits):
+        emotion = best_hits[group][1]
+        if emotion not in emotions:
+            emotions.append(emotion)
+    return tuple(matched), tuple(emotions)
+
+
+def detect_exit_intent(normalized, tokens):
+    """Check for an exit keyword as a whole word or phrase ("done", not "abandoned")"""
+    if normalized in Config.EXIT_KEYWORDS:
+        return True
+    padded = f" {' '.join(tokens)} "
+    return any(f" {keyword} " in padded for keyword in Config.EXIT_KEYWORDS)
+
+
+@dataclass(frozen=True)
+class MessageAnalysis:
+    """Everything per-message checks need, computed in one pass"""
+    text: str
+    normalized: str
+    tokens: tuple
+    exit_intent: bool
+    emotion_hits: tuple
+    emotions: tuple
+    numbers: tuple  # ((start, end), value) spans in the stripped text
+    email_candidates: tuple
+    phone_candidates: tuple
+    structured: str = None
+
+
+def preprocess(text):
+    """
+    Analyze a message (uncached)
+
+    Args:
+        text: Raw message
+
+    Returns:
+        MessageAnalysis
+    """
+    text = text or ""
+    stripped = text.strip()
+    normalized = normalize(text)
+    tokens = tokenize(normalized)
+    emotion_hits, emotions = match_emotions(tokens)
+
+    return MessageAnalysis(
+        text=text,
+        normalized=normalized,
+        tokens=tokens,
+        exit_intent=detect_exit_intent(normalized, tokens),
+        emotion_hits=emotion_hits,
+        emotions=emotions,
+        numbers=tuple((m.span(), float(m.group())) for m in NUMBER_PATTERN.finditer(stripped)),
+        email_candidates=tuple(EMAIL_CANDIDATE.findall(stripped)),
+        phone_candidates=tuple(m.group().strip() for m in PHONE_CANDIDATE.finditer(stripped)),
+        structured=classify_structured(normalized)
+    )
+
+
+@lru_cache(maxsize=Config.PREPROCESS_CACHE_SIZE)
+def analyze_message(text):
+    """
+    Analyze a message, sharing the result between all consumers of a turn
+
+    The exit check, sentiment memo, sentiment engine and stage validators
+    all call this with the same text, so the message is scanned once.
+    """
+    return preprocess(text)
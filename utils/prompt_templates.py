@@ -2,6 +2,7 @@
 Prompt templates for TalentScout Hiring Assistant
 This is the core of our prompt engineering strategy
 """
+from utils.template_registry import TemplateRegistry
 
 class PromptTemplates:
     """Collection of carefully engineered prompts"""
@@ -46,100 +47,47 @@ Requirements:
 Generate the greeting now:"""
 
     # Information gathering prompts - NOW MULTILINGUAL
+    # Localized texts live in utils/resources/templates/<language>.json
     @staticmethod
     def get_info_prompt(field_name, candidate_data, language="English"):
         """Generate prompt for gathering specific information in the selected language"""
+        return TemplateRegistry.default().render(
+            f"info.{field_name}", language,
+            default="Please provide the requested information."
+        )
+    
+    @staticmethod
+    def get_name_greeting_reply(language="English"):
+        """Polite reply when the candidate greets us instead of giving a name"""
+        return TemplateRegistry.default().render("info.name_greeting_reply", language)
+    
+    # Difficulty bands by years of experience: (minimum years, band, prompt wording).
+    # The band is also the difficulty index of the question bank.
+    DIFFICULTY_BANDS = (
+        (5, 'advanced', "intermediate to advanced"),
+        (3, 'intermediate', "intermediate"),
+        (0, 'beginner', "beginner to intermediate"),
+    )
+    
+    @staticmethod
+    def difficulty_band(experience_years):
+        """
+        Difficulty for a candidate's experience
         
-        # Translation dictionary for static info-gathering questions
-        # This ensures the bot speaks the correct language even during the data collection phase
-        translations = {
-            "English": {
-                "name": "Great! Now, could you please provide your email address?",
-                "email": "Thank you! What's the best phone number to reach you?",
-                "phone": "Perfect! How many years of professional experience do you have?",
-                "experience": "Excellent! What position(s) are you interested in applying for?",
-                "position": "Great choice! Where are you currently located? (City, State/Country)",
-                "location": """Thank you! Now, let's talk about your technical skills. 
-
-Please list your tech stack - the programming languages, frameworks, databases, and tools you're proficient in. 
-
-For example: "Python, Django, PostgreSQL, Docker, AWS" or "JavaScript, React, Node.js, MongoDB"
-
-What technologies do you work with?"""
-            },
-            "Hindi": {
-                "name": "बहुत बढ़िया! अब, क्या आप कृपया अपना ईमेल पता (email address) बता सकते हैं?",
-                "email": "धन्यवाद! आपसे संपर्क करने के लिए सबसे अच्छा फोन नंबर क्या है?",
-                "phone": "उत्तम! आपके पास कितने वर्षों का पेशेवर अनुभव (experience) है?",
-                "experience": "बढ़िया! आप किस पद (position) के लिए आवेदन करना चाहते हैं?",
-                "position": "बहुत अच्छा! आप वर्तमान में कहाँ स्थित हैं? (शहर, राज्य/देश)",
-                "location": """धन्यवाद! अब, चलिए आपके तकनीकी कौशल (technical skills) के बारे में बात करते हैं।
-
-कृपया अपना टेक स्टैक (tech stack) बताएं - वे प्रोग्रामिंग भाषाएं, फ्रेमवर्क, डेटाबेस और टूल जिनमें आप कुशल हैं।
-
-उदाहरण के लिए: "Python, Django, PostgreSQL, Docker, AWS" या "JavaScript, React, Node.js, MongoDB"
-
-आप किन तकनीकों के साथ काम करते हैं?"""
-            },
-            "Spanish": {
-                "name": "¡Genial! Ahora, ¿podrías proporcionar tu dirección de correo electrónico?",
-                "email": "¡Gracias! ¿Cuál es el mejor número de teléfono para contactarte?",
-                "phone": "¡Perfecto! ¿Cuántos años de experiencia profesional tienes?",
-                "experience": "¡Excelente! ¿A qué puesto(s) te interesa aplicar?",
-                "position": "¡Buena elección! ¿Dónde te encuentras actualmente? (Ciudad, Estado/País)",
-                "location": """¡Gracias! Ahora hablemos de tus habilidades técnicas.
-
-Por favor enumera tu tech stack: los lenguajes de programación, frameworks, bases de datos y herramientas que dominas.
-
-Por ejemplo: "Python, Django, PostgreSQL, Docker, AWS" o "JavaScript, React, Node.js, MongoDB"
-
-¿Con qué tecnologías trabajas?"""
-            },
-            "French": {
-                "name": "Super ! Maintenant, pourriez-vous fournir votre adresse e-mail ?",
-                "email": "Merci ! Quel est le meilleur numéro de téléphone pour vous joindre ?",
-                "phone": "Parfait ! Combien d'années d'expérience professionnelle avez-vous ?",
-                "experience": "Excellent ! Pour quel(s) poste(s) souhaitez-vous postuler ?",
-                "position": "Très bien ! Où êtes-vous actuellement situé ? (Ville, Pays)",
-                "location": """Merci ! Parlons maintenant de vos compétences techniques.
-
-Veuillez énumérer votre stack technique - les langages de programmation, frameworks, bases de données et outils que vous maîtrisez.
-
-Par exemple : "Python, Django, PostgreSQL, Docker, AWS" ou "JavaScript, React, Node.js, MongoDB"
-
-Avec quelles technologies travaillez-vous ?"""
-            },
-            "German": {
-                "name": "Großartig! Könnten Sie bitte Ihre E-Mail-Adresse angeben?",
-                "email": "Danke! Unter welcher Telefonnummer können wir Sie am besten erreichen?",
-                "phone": "Perfekt! Wie viele Jahre Berufserfahrung haben Sie?",
-                "experience": "Ausgezeichnet! Für welche Position(en) möchten Sie sich bewerben?",
-                "position": "Gute Wahl! Wo befinden Sie sich derzeit? (Stadt, Land)",
-                "location": """Danke! Lassen Sie uns nun über Ihre technischen Fähigkeiten sprechen.
-
-Bitte listen Sie Ihren Tech-Stack auf – die Programmiersprachen, Frameworks, Datenbanken und Tools, die Sie beherrschen.
-
-Zum Beispiel: "Python, Django, PostgreSQL, Docker, AWS" oder "JavaScript, React, Node.js, MongoDB"
-
-Mit welchen Technologien arbeiten Sie?"""
-            }
-        }
-
-        # Default to English if language not found
-        lang_dict = translations.get(language, translations["English"])
-        
-        return lang_dict.get(field_name, "Please provide the requested information.")
+        Returns:
+            tuple: (band, prompt wording)
+        """
+        for minimum, band, wording in PromptTemplates.DIFFICULTY_BANDS:
+            if experience_years >= minimum:
+                return band, wording
+        return PromptTemplates.DIFFICULTY_BANDS[-1][1:]
     
     # NEW: Generate individual questions for one-by-one asking
     @staticmethod
     def generate_individual_questions_prompt(tech_stack, experience_years, language="English"):
         """Generate prompt for creating 3-5 individual technical questions"""
         
-        difficulty = "beginner to intermediate"
-        if experience_years >= 5:
-            difficulty = "intermediate to advanced"
-        elif experience_years >= 3:
-            difficulty = "intermediate"
+        _, difficulty = PromptTemplates.difficulty_band(experience_years)
         
         # Added Language Instruction
         prompt = f"""Generate exactly 3 to 5 technical questions for a candidate with {experience_years} years of experience in: {tech_stack}
@@ -165,16 +113,39 @@ Now generate 3-5 questions in {language}:"""
         
         return prompt
     
+    @staticmethod
+    def generate_technology_questions_prompt(technology, count, experience_years, language="English"):
+        """Generate prompt for questions about one technology (one call per technology)"""
+        
+        _, difficulty = PromptTemplates.difficulty_band(experience_years)
+        
+        prompt = f"""Generate exactly {count} technical question(s) about {technology} for a candidate with {experience_years} years of experience.
+
+IMPORTANT: The candidate speaks {language}. You MUST generate the questions in {language}.
+
+REQUIREMENTS:
+- Questions should be {difficulty} level
+- Each question should be clear, specific, and standalone
+- Avoid yes/no questions
+- Each question tests real-world skills with {technology}
+
+FORMAT (IMPORTANT):
+Return ONLY JSON lines: one JSON object per line, each with a single "question" key.
+No numbering, no code fences, no extra text.
+
+Example:
+{{"question": "[Question 1 in {language}]"}}
+
+Now generate {count} question(s) in {language}:"""
+        
+        return prompt
+    
     # Technical question generation prompt (KEEP for backward compatibility)
     @staticmethod
     def generate_tech_questions_prompt(tech_stack, experience_years):
         """Generate prompt for creating technical questions"""
         
-        difficulty = "beginner to intermediate"
-        if experience_years >= 5:
-            difficulty = "intermediate to advanced"
-        elif experience_years >= 3:
-            difficulty = "intermediate"
+        _, difficulty = PromptTemplates.difficulty_band(experience_years)
         
         prompt = f"""You are interviewing a candidate with {experience_years} years of experience who listed the following tech stack:
 {tech_stack}
@@ -207,6 +178,34 @@ Generate the questions now:"""
         
         return prompt
     
+    # Answer scoring (utils/answer_scoring.py)
+    ANSWER_SCORING_SYSTEM_PROMPT = """You are a senior technical interviewer at TalentScout grading screening answers.
+Grade each answer on its own merits against the question asked. Be fair and consistent, and reply only in the requested format."""
+    
+    @staticmethod
+    def get_answer_scoring_prompt(items):
+        """Generate prompt for scoring a batch of (question, answer) pairs"""
+        
+        answers = "\n\n".join(
+            f"[{i}] QUESTION: {question}\nANSWER: {answer}"
+            for i, (question, answer) in enumerate(items, start=1)
+        )
+        
+        return f"""Score each candidate answer below. Answers may be in any language.
+
+RUBRIC (each 0-10):
+- correctness: is the answer technically accurate?
+- depth: does it show real understanding and practical experience?
+- clarity: is it clear and well structured?
+- score: overall 0-10
+
+{answers}
+
+FORMAT (IMPORTANT):
+Return ONLY JSON lines: one JSON object per answer, in order, like
+{{"id": 1, "correctness": 7, "depth": 6, "clarity": 8, "score": 7, "feedback": "One short sentence in English."}}
+No code fences, no extra text."""
+    
     # Fallback handling
     FALLBACK_PROMPT = """The candidate said: "{user_input}"
 
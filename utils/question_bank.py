@@ -0,0 +1,265 @@
+"""
+Question bank for TalentScout Hiring Assistant
+Precomputed technical questions indexed by (technology, difficulty band, language)
+
+The bank is built offline with
+    python -m utils.question_bank --build [--languages English Hindi] [--techs Python Docker]
+and topped up in the background while interviews run: questions the LLM
+generates for uncovered technologies are added, and keys that run low
+are refreshed as background tasks. Interviews draw from an in-memory
+copy, so a covered stack gets its questions without an LLM call.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from utils.prompt_templates import PromptTemplates
+from utils.question_parser import QuestionStreamParser
+from utils.taxonomy import TechTaxonomy
+
+# Experience used when generating questions for a band offline
+BAND_EXPERIENCE = {'beginner': 1, 'intermediate': 3, 'advanced': 6}
+
+
+def stream_questions(groq_client, technology, count, experience, language, on_question=None):
+    """
+    Ask the LLM for questions about one technology, parsing the stream as it arrives
+
+    Args:
+        groq_client: GroqClient
+        technology: Canonical technology name
+        count: Questions wanted
+        experience: Years of experience the questions are aimed at
+        language: Question language
+        on_question: Called with each question as soon as it is complete
+
+    Returns:
+        list: Up to count questions (empty if the call failed)
+    """
+    prompt = PromptTemplates.generate_technology_questions_prompt(technology, count, experience, language)
+    messages = [
+        {'role': 'system', 'content': PromptTemplates.SYSTEM_PROMPT},
+        {'role': 'user', 'content': prompt}
+    ]
+    parser = QuestionStreamParser(limit=count)
+    stream = groq_client.generate_streaming_response(messages, route='tech_questions', fallback="")
+    try:
+        for chunk in stream:
+            for question in parser.feed(chunk):
+                if on_question:
+                    on_question(question)
+            # Stop reading (and paying for tokens) once we have enough
+            if parser.done:
+                break
+        else:
+            for question in parser.close():
+                if on_question:
+                    on_question(question)
+    finally:
+        stream.close()
+    return parser.questions
+
+
+class QuestionBank:
+    """SQLite-backed question bank with an in-memory index for retrieval"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None, target=None):
+        """
+        Initialize bank
+
+        Args:
+            path: Database file (defaults to Config.QUESTION_BANK_PATH)
+            target: Questions wanted per key before it stops being refreshed
+        """
+        self.path = path or Config.QUESTION_BANK_PATH
+        self.target = target or Config.QUESTION_BANK_TARGET
+        self.taxonomy = TechTaxonomy.default()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._index = {}  # (tech key, band, language) -> list of questions
+        self._served = {}  # question -> times handed out by this process
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS questions ("
+                         "tech TEXT, band TEXT, language TEXT, question TEXT, added REAL, "
+                         "PRIMARY KEY (tech, band, language, question))")
+        self.reload()
+
+    @classmethod
+    def default(cls):
+        """Get the shared bank (loaded once per process)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _connection(self):
+        """One connection per thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def key(self, technology, band, language):
+        """Index key: canonical technology (lowercase), band, language"""
+        return self.taxonomy.canonicalize_or_keep(technology).lower(), band, language
+
+    def reload(self):
+        """Load the whole bank into memory (e.g. after an offline build)"""
+        index = {}
+        for tech, band, language, question in self._connection().execute(
+                "SELECT tech, band, language, question FROM questions ORDER BY added"):
+            index.setdefault((tech, band, language), []).append(question)
+        with self._lock:
+            self._index = index
+
+    def add(self, technology, band, language, questions):
+        """
+        Store new questions for a key (duplicates are ignored)
+
+        Returns:
+            int: Questions added
+        """
+        key = self.key(technology, band, language)
+        now = time.time()
+        with self._lock:
+            existing = self._index.setdefault(key, [])
+            new = [q for q in dict.fromkeys(questions) if q not in existing]
+            existing.extend(new)
+        if new:
+            with self._connection() as conn:
+                conn.executemany("INSERT OR IGNORE INTO questions VALUES (?, ?, ?, ?, ?)",
+                                 [key + (q, now) for q in new])
+        return len(new)
+
+    def size(self, technology, band, language):
+        """Questions stored for a key"""
+        return len(self._index.get(self.key(technology, band, language), ()))
+
+    def take(self, technology, band, language, count, exclude=()):
+        """
+        Pick questions for an interview
+
+        Least-served questions go first (random among equals), so
+        consecutive candidates with the same stack see different sets.
+
+        Returns:
+            list: Up to count questions
+        """
+        with self._lock:
+            pool = [q for q in self._index.get(self.key(technology, band, language), ()) if q not in exclude]
+            random.shuffle(pool)
+            pool.sort(key=lambda q: self._served.get(q, 0))
+            chosen = pool[:count]
+            for question in chosen:
+                self._served[question] = self._served.get(question, 0) + 1
+        return chosen
+
+    def select(self, slots, band, language):
+        """
+        Fill question slots from the bank
+
+        Args:
+            slots: (technology, count) pairs (see plan_question_slots)
+            band: Difficulty band
+            language: Candidate language
+
+        Returns:
+            tuple: (questions, [(technology, missing count)] not covered)
+        """
+        questions = []
+        missing = []
+        for tech, count in slots:
+            found = self.take(tech, band, language, count, exclude=questions)
+            questions.extend(found)
+            if len(found) < count:
+                missing.append((tech, count - len(found)))
+        return questions, missing
+
+    def needs_refresh(self, technology, band, language):
+        """True while a key holds fewer questions than the target"""
+        return self.size(technology, band, language) < self.target
+
+    def coverage(self):
+        """
+        Summary of what the bank holds
+
+        Returns:
+            dict: keys, questions and keys below target
+        """
+        with self._lock:
+            sizes = [len(questions) for questions in self._index.values()]
+        return {
+            'keys': len(sizes),
+            'questions': sum(sizes),
+            'below_target': sum(1 for size in sizes if size < self.target)
+        }
+
+
+def build(bank, groq_client, techs=None, languages=None, bands=None, workers=None):
+    """
+    Fill every (technology, band, language) key up to the bank's target
+
+    Keys already at target are skipped, so an interrupted build resumes.
+
+    Returns:
+        dict: Keys generated, questions added and keys that failed
+    """
+    techs = techs or bank.taxonomy.canonical
+    languages = languages or Config.SUPPORTED_LANGUAGES
+    bands = bands or list(BAND_EXPERIENCE)
+    keys = [(tech, band, language) for tech in techs for band in bands for language in languages
+            if bank.needs_refresh(tech, band, language)]
+
+    def fill(key):
+        tech, band, language = key
+        missing = bank.target - bank.size(tech, band, language)
+        questions = stream_questions(groq_client, tech, missing, BAND_EXPERIENCE[band], language)
+        return bank.add(tech, band, language, questions)
+
+    report = {'keys': len(keys), 'added': 0, 'failed': 0}
+    with ThreadPoolExecutor(max_workers=workers or Config.QUESTION_BANK_BUILD_WORKERS) as pool:
+        for added in pool.map(fill, keys):
+            report['added'] += added
+            report['failed'] += 0 if added else 1
+    return report
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Build or inspect the technical question bank")
+    parser.add_argument('--build', action='store_true', help="generate questions for keys below target")
+    parser.add_argument('--techs', nargs='+', help="technologies to build (default: whole taxonomy)")
+    parser.add_argument('--languages', nargs='+', help="languages to build (default: all supported)")
+    parser.add_argument('--bands', nargs='+', choices=list(BAND_EXPERIENCE))
+    parser.add_argument('--workers', type=int, help="concurrent LLM calls")
+    parser.add_argument('--path', help="bank database (default: Config.QUESTION_BANK_PATH)")
+    args = parser.parse_args(argv)
+
+    bank = QuestionBank(args.path)
+    if args.build:
+        from utils.groq_client import GroqClient
+        techs = bank.taxonomy.canonicalize_list(args.techs) if args.techs else None
+        report = build(bank, GroqClient(), techs, args.languages, args.bands, args.workers)
+        print(f"Generated {report['added']} questions for {report['keys']} keys "
+              f"({report['failed']} keys got none)")
+
+    coverage = bank.coverage()
+    print(f"Bank: {coverage['questions']} questions in {coverage['keys']} keys, "
+          f"{coverage['below_target']} below target ({bank.target})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Streaming question parser for TalentScout Hiring Assistant
+Turns JSON-lines question output into questions while the completion is still streaming
+
+The model is asked for one {"question": "..."} object per line. Each line
+is parsed as soon as it is complete; lines that drift from the format
+(code fences, trailing commas, missing closing quotes or braces, single
+quotes, several objects on one line, plain numbered lists) are repaired
+locally rather than re-requested from the LLM.
+"""
+import ast
+import json
+import re
+
+MIN_QUESTION_LENGTH = 15
+MAX_QUESTION_LENGTH = 500
+
+QUESTION_KEYS = ('question', 'q', 'text')
+
+_LIST_ITEM = re.compile(r'^(?:\d+\s*[.):]|[-*•])\s+(.+)$')
+_QUESTION_LABEL = re.compile(r'^(?:\*\*)?(?:question|q)\s*\d*\s*[:.)-]\s*', re.IGNORECASE)
+# The field's text runs to a quote that ends the line (before an optional } or ,)
+_QUESTION_FIELD = re.compile(r'"(?:question|q|text)"\s*:\s*"(.*)"\s*[},]?\s*$', re.DOTALL)
+_TRAILING_COMMA = re.compile(r',\s*}$')
+_SMART_QUOTES = str.maketrans({'“': '"', '”': '"'})
+
+_decoder = json.JSONDecoder()
+
+
+def clean_question(text):
+    """
+    Normalize and validate one question
+
+    Returns:
+        str: The question, or None if it is not usable
+    """
+    if not isinstance(text, str):
+        return None
+    question = ' '.join(text.split()).strip('*_` ')
+    question = _QUESTION_LABEL.sub('', question).strip('*_` ')
+    if question[:1] in '"\'' and question[-1:] == question[:1]:
+        question = question[1:-1].strip()
+    if not MIN_QUESTION_LENGTH <= len(question) <= MAX_QUESTION_LENGTH:
+        return None
+    if not any(c.isalpha() for c in question):
+        return None
+    return question
+
+
+def _question_from_object(obj):
+    """Question text of a decoded JSON value"""
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, dict):
+        for key in QUESTION_KEYS:
+            if isinstance(obj.get(key), str):
+                return obj[key]
+    return None
+
+
+def _decode_objects(line):
+    """
+    Decode one or more JSON values from a line, repairing common damage
+
+    Returns:
+        list: Decoded values (empty if the line could not be repaired)
+    """
+    line = _TRAILING_COMMA.sub('}', line.translate(_SMART_QUOTES).rstrip(','))
+    values = []
+    position = 0
+    while position < len(line):
+        try:
+            value, end = _decoder.raw_decode(line, position)
+        except ValueError:
+            break
+        values.append(value)
+        position = end
+        while position < len(line) and line[position] in ' ,\t':
+            position += 1
+    if values and position >= len(line):
+        return values
+
+    # Truncated or unbalanced object: close it and try again
+    rest = line[position:]
+    for suffix in ('}', '"}', '."}'):
+        try:
+            values.append(json.loads(rest + suffix))
+            return values
+        except ValueError:
+            continue
+
+    # Python-style dict with single quotes (literals only; nothing is executed)
+    try:
+        values.append(ast.literal_eval(rest))
+        return values
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        pass
+
+    # Last resort: unescaped quotes inside the question field. Only taken
+    # when the field's closing quote ends the line, so a line cut short
+    # after an inner quote is rejected rather than truncated there
+    match = _QUESTION_FIELD.search(rest)
+    if match:
+        values.append(match.group(1))
+    return values
+
+
+def parse_line(line):
+    """
+    Extract questions from one line of model output
+
+    Returns:
+        list: Raw question texts (not yet cleaned)
+    """
+    line = line.strip()
+    if not line or line.startswith('```') or line in ('[', ']'):
+        return []
+    line = line.lstrip('[').rstrip(']').strip()
+
+    if line[:1] in '{"':
+        return [q for q in map(_question_from_object, _decode_objects(line)) if q]
+
+    # Format drift: a plain numbered or bulleted list
+    match = _LIST_ITEM.match(line)
+    if match:
+        return [match.group(1)]
+    return []
+
+
+class QuestionStreamParser:
+    """Incremental parser: feed completion chunks, get questions as lines complete"""
+
+    def __init__(self, limit=None):
+        """
+        Initialize parser
+
+        Args:
+            limit: Stop yielding after this many questions
+        """
+        self.limit = limit
+        self.questions = []
+        self.rejected = 0
+        self._buffer = ""
+        self._seen = set()
+
+    @property
+    def done(self):
+        """True once limit questions have been parsed"""
+        return self.limit is not None and len(self.questions) >= self.limit
+
+    def feed(self, chunk):
+        """
+        Add streamed text
+
+        Returns:
+            list: Questions completed by this chunk
+        """
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split('\n')
+        return self._accept(lines)
+
+    def close(self):
+        """
+        Flush the last, unterminated line
+
+        Returns:
+            list: Questions it contained
+        """
+        line, self._buffer = self._buffer, ""
+        return self._accept([line])
+
+    def _accept(self, lines):
+        """Parse, validate and dedupe complete lines"""
+        accepted = []
+        for line in lines:
+            for raw in parse_line(line):
+                if self.done:
+                    return accepted
+                question = clean_question(raw)
+                if question is None:
+                    self.rejected += 1
+                    continue
+                key = question.lower()
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+                self.questions.append(question)
+                accepted.append(question)
+        return accepted
+
+
+def parse_questions(text, limit=None):
+    """
+    Parse complete model output
+
+    Args:
+        text: Completion text
+        limit: Maximum questions returned
+
+    Returns:
+        list: Questions
+    """
+    parser = QuestionStreamParser(limit)
+    parser.feed(text or "")
+    parser.close()
+    return parser.questions
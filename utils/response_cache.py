@@ -0,0 +1,364 @@
+"""
+Response cache for TalentScout Hiring Assistant
+Precomputed greeting and closing variants per language, and the warm-up command that fills them
+
+Greetings don't depend on the candidate and closings only on the name, so
+a few LLM-written variants per language are kept and reused instead of
+calling the LLM for every interview. Closings are stored as templates with
+NAME_PLACEHOLDER in place of the candidate's name.
+
+Warm the cache (and the question bank for the most common stacks) with
+    python -m utils.response_cache --warm [--top 10] [--max-calls 200]
+or at startup by setting WARMUP_ON_BOOT=true.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from utils.prompt_templates import PromptTemplates
+from utils.question_bank import stream_questions, BAND_EXPERIENCE
+from utils.taxonomy import TechTaxonomy
+
+KINDS = ('greeting', 'closing')
+
+NAME_PLACEHOLDER = "{candidate_name}"
+
+
+def greeting_messages(language):
+    """Chat messages that ask for a greeting (as the engine sends them at the start)"""
+    prompt = f"{PromptTemplates.GREETING_PROMPT}\nIMPORTANT: Please generate this greeting in {language} language."
+    return [
+        {'role': 'system', 'content': PromptTemplates.SYSTEM_PROMPT},
+        {'role': 'user', 'content': prompt}
+    ]
+
+
+def closing_messages(candidate_name, language):
+    """Chat messages that ask for a closing message"""
+    return [
+        {'role': 'system', 'content': PromptTemplates.SYSTEM_PROMPT},
+        {'role': 'user', 'content': PromptTemplates.get_closing_prompt(candidate_name, language)}
+    ]
+
+
+def closing_template(closing, candidate_name):
+    """
+    Turn a closing written for one candidate into a reusable template
+
+    Returns:
+        str: Template, or None if the name doesn't appear exactly once
+    """
+    if not candidate_name or closing.count(candidate_name) != 1:
+        return None
+    return closing.replace(candidate_name, NAME_PLACEHOLDER)
+
+
+class ResponseCache:
+    """SQLite-backed store of response variants keyed by (kind, language)"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None, variants=None):
+        """
+        Initialize cache
+
+        Args:
+            path: Database file (defaults to Config.RESPONSE_CACHE_PATH)
+            variants: Variants kept per key
+        """
+        self.path = path or Config.RESPONSE_CACHE_PATH
+        self.variants = variants or Config.RESPONSE_CACHE_VARIANTS
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._index = {}  # (kind, language) -> list of responses
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS responses ("
+                         "kind TEXT, language TEXT, response TEXT, added REAL, "
+                         "PRIMARY KEY (kind, language, response))")
+        self.reload()
+
+    @classmethod
+    def default(cls):
+        """Get the shared cache (loaded once per process)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _connection(self):
+        """One connection per thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def reload(self):
+        """Load the whole cache into memory"""
+        index = {}
+        for kind, language, response in self._connection().execute(
+                "SELECT kind, language, response FROM responses ORDER BY added"):
+            index.setdefault((kind, language), []).append(response)
+        with self._lock:
+            self._index = index
+
+    def pick(self, kind, language):
+        """
+        A cached response, chosen at random among the variants
+
+        Returns:
+            str: Response, or None on a miss
+        """
+        variants = self._index.get((kind, language))
+        return random.choice(variants) if variants else None
+
+    def add(self, kind, language, response):
+        """
+        Store a variant (ignored once the key holds enough)
+
+        Returns:
+            bool: True if it was added
+        """
+        response = (response or "").strip()
+        if not response:
+            return False
+        with self._lock:
+            existing = self._index.setdefault((kind, language), [])
+            if len(existing) >= self.variants or response in existing:
+                return False
+            existing.append(response)
+        with self._connection() as conn:
+            conn.execute("INSERT OR IGNORE INTO responses VALUES (?, ?, ?, ?)",
+                         (kind, language, response, time.time()))
+        return True
+
+    def missing(self, kind, language):
+        """Variants still wanted for a key"""
+        return max(0, self.variants - len(self._index.get((kind, language), ())))
+
+    def size(self):
+        """Responses cached"""
+        return sum(len(variants) for variants in self._index.values())
+
+
+class RateLimiter:
+    """Spaces calls evenly and stops granting them once a budget is spent"""
+
+    def __init__(self, calls_per_minute, max_calls=None):
+        """
+        Initialize limiter
+
+        Args:
+            calls_per_minute: Sustained call rate
+            max_calls: Calls granted in total (unlimited if None)
+        """
+        self.interval = 60.0 / calls_per_minute if calls_per_minute else 0.0
+        self.max_calls = max_calls
+        self.granted = 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Wait for the next call slot
+
+        Returns:
+            bool: False if the budget is spent (the caller must not call)
+        """
+        with self._lock:
+            if self.max_calls is not None and self.granted >= self.max_calls:
+                return False
+            self.granted += 1
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+        return True
+
+
+def hot_question_sets(candidates, limit, taxonomy=None):
+    """
+    Most common (tech stack, difficulty band) pairs among stored candidates
+
+    Stacks are grouped with TechTaxonomy.cache_key, so spelling and order
+    don't split a combination.
+
+    Returns:
+        list: (technologies, band, candidates) tuples, most common first
+    """
+    taxonomy = taxonomy or TechTaxonomy.default()
+    counts = Counter()
+    stacks = {}
+    for candidate in candidates:
+        tech_stack = candidate.get('tech_stack')
+        if not tech_stack:
+            continue
+        key = taxonomy.cache_key(tech_stack)
+        if not key:
+            continue
+        try:
+            experience = float(candidate.get('experience', 0))
+        except (TypeError, ValueError):
+            experience = 0
+        band, _ = PromptTemplates.difficulty_band(experience)
+        counts[key, band] += 1
+        stacks.setdefault(key, taxonomy.canonicalize_list(tech_stack))
+    return [(stacks[key], band, count) for (key, band), count in counts.most_common(limit)]
+
+
+def warm(groq_client, cache, bank=None, candidates=(), languages=None, top=None,
+         workers=None, calls_per_minute=None, max_calls=None):
+    """
+    Fill the response cache and the question bank ahead of traffic
+
+    Greetings and closings for every language come first, then question
+    bank keys for the most common stored stacks. Keys that are already
+    full cost nothing, so a repeated warm-up only tops up. Calls are
+    spread over a bounded pool and a rate limit; once the call budget is
+    spent the remaining work is reported as skipped.
+
+    Args:
+        groq_client: GroqClient
+        cache: ResponseCache
+        bank: QuestionBank (questions are not warmed if None)
+        candidates: Stored candidates whose stacks decide what to warm
+        languages: Languages to warm (default: Config.SUPPORTED_LANGUAGES)
+        top: Stack/band combinations to warm
+        workers: Concurrent LLM calls
+        calls_per_minute: Rate limit
+        max_calls: Call budget
+
+    Returns:
+        dict: Per kind: warmed, already cached, failed and skipped over budget; plus calls and seconds
+    """
+    languages = languages or Config.SUPPORTED_LANGUAGES
+    top = Config.WARMUP_TOP_STACKS if top is None else top
+    limiter = RateLimiter(
+        Config.WARMUP_CALLS_PER_MINUTE if calls_per_minute is None else calls_per_minute,
+        Config.WARMUP_MAX_CALLS if max_calls is None else max_calls
+    )
+    report = {kind: Counter() for kind in KINDS + ('questions',)}
+    started = time.perf_counter()
+
+    # One job per LLM call: (kind, language, detail)
+    jobs = []
+    for kind in KINDS:
+        for language in languages:
+            missing = cache.missing(kind, language)
+            report[kind]['cached'] += cache.variants - missing
+            jobs.extend((kind, language, None) for _ in range(missing))
+    if bank is not None:
+        seen = set()
+        for techs, band, _ in hot_question_sets(candidates, top):
+            for tech in techs:
+                for language in languages:
+                    key = bank.key(tech, band, language)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if bank.needs_refresh(tech, band, language):
+                        jobs.append(('questions', language, (tech, band)))
+                    else:
+                        report['questions']['cached'] += 1
+
+    def run(job):
+        kind, language, detail = job
+        if not limiter.acquire():
+            return kind, 'over_budget'
+        if not groq_client.is_available():
+            return kind, 'failed'
+        if kind == 'greeting':
+            response = groq_client.generate_response(greeting_messages(language), route='greeting', fallback="")
+            added = cache.add(kind, language, response)
+        elif kind == 'closing':
+            response = groq_client.generate_response(
+                closing_messages(NAME_PLACEHOLDER, language), route='closing', fallback=""
+            )
+            added = NAME_PLACEHOLDER in response and cache.add(kind, language, response)
+        else:
+            tech, band = detail
+            missing = bank.target - bank.size(tech, band, language)
+            questions = stream_questions(groq_client, tech, missing, BAND_EXPERIENCE[band], language)
+            added = missing <= 0 or bank.add(tech, band, language, questions) > 0
+        return kind, 'warmed' if added else 'failed'
+
+    with ThreadPoolExecutor(max_workers=workers or Config.WARMUP_WORKERS) as pool:
+        for kind, outcome in pool.map(run, jobs):
+            report[kind][outcome] += 1
+
+    report = {kind: dict(counts) for kind, counts in report.items()}
+    report['calls'] = limiter.granted
+    report['seconds'] = round(time.perf_counter() - started, 1)
+    return report
+
+
+def format_report(report):
+    """One line per kind, for logs and the command line"""
+    lines = []
+    for kind in KINDS + ('questions',):
+        counts = report.get(kind, {})
+        lines.append(f"{kind:10} warmed {counts.get('warmed', 0):4}  cached {counts.get('cached', 0):4}  "
+                     f"failed {counts.get('failed', 0):4}  over budget {counts.get('over_budget', 0):4}")
+    lines.append(f"{report['calls']} LLM calls in {report['seconds']}s")
+    return '\n'.join(lines)
+
+
+def warm_in_background(groq_client, cache, bank=None, data_handler=None):
+    """
+    Start a warm-up on a daemon thread (the on-boot hook)
+
+    Returns:
+        threading.Thread: The warm-up thread
+    """
+    def run():
+        try:
+            candidates = data_handler.load_all_candidates() if data_handler else ()
+            print("Warm-up finished:\n" + format_report(warm(groq_client, cache, bank, candidates)))
+        except Exception as e:
+            print(f"Warm-up failed: {str(e)}")
+
+    thread = threading.Thread(target=run, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Warm the response cache and hot question sets")
+    parser.add_argument('--warm', action='store_true', help="generate missing greetings, closings and questions")
+    parser.add_argument('--languages', nargs='+', help="languages to warm (default: all supported)")
+    parser.add_argument('--top', type=int, help="stack/band combinations to warm questions for")
+    parser.add_argument('--no-questions', action='store_true', help="only warm greetings and closings")
+    parser.add_argument('--workers', type=int, help="concurrent LLM calls")
+    parser.add_argument('--rate', type=float, help="LLM calls per minute")
+    parser.add_argument('--max-calls', type=int, help="LLM call budget")
+    args = parser.parse_args(argv)
+
+    cache = ResponseCache.default()
+    if args.warm:
+        from utils.groq_client import GroqClient
+        from utils.data_handler import DataHandler
+        from utils.question_bank import QuestionBank
+        bank = None if args.no_questions else QuestionBank.default()
+        candidates = DataHandler(Config.DATA_FILE).load_all_candidates()
+        report = warm(GroqClient(), cache, bank, candidates, args.languages, args.top,
+                      args.workers, args.rate, args.max_calls)
+        print(format_report(report))
+
+    print(f"Response cache: {cache.size()} responses ({cache.variants} variants per kind and language)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,33 +2,29 @@
 Sentiment Analysis for TalentScout Hiring Assistant
 Detects candidate emotions to adjust chatbot responses
 """
-from textblob import TextBlob
-import re
+from concurrent.futures import ProcessPoolExecutor
+from config import Config
+from utils.sentiment_engine import get_engine
+from utils.sentiment_history import SentimentHistory
+from utils.sentiment_memo import SentimentMemo
 
 class SentimentAnalyzer:
     """Analyzes sentiment and emotions in candidate messages"""
     
-    def __init__(self):
-        """Initialize sentiment analyzer"""
-        self.sentiment_history = []
-        
-        # Emotion keywords for enhanced detection
-        self.positive_keywords = [
-            'great', 'excited', 'happy', 'love', 'awesome', 'perfect',
-            'excellent', 'wonderful', 'fantastic', 'amazing', 'good',
-            'nice', 'thanks', 'appreciate', 'glad', 'pleased'
-        ]
-        
-        self.negative_keywords = [
-            'confused', 'frustrated', 'angry', 'upset', 'disappointed',
-            'worried', 'nervous', 'anxious', 'difficult', 'hard',
-            'struggle', 'problem', 'issue', 'hate', 'bad', 'terrible'
-        ]
+    def __init__(self, engine=None, history_size=None, memo=None, history=None):
+        """
+        Initialize sentiment analyzer
         
-        self.uncertainty_keywords = [
-            'maybe', 'perhaps', 'not sure', 'unsure', 'confused',
-            'don\'t know', 'uncertain', 'unclear', 'guess'
-        ]
+        Args:
+            engine: Scoring engine (defaults to Config.SENTIMENT_ENGINE)
+            history_size: Entries kept in the bounded history
+            memo: Result memo (defaults to the shared memo for the default engine)
+            history: Existing SentimentHistory to continue (e.g. restored interview state)
+        """
+        self.sentiment_history = history if history is not None else SentimentHistory(history_size)
+        self.engine = engine or get_engine(Config.SENTIMENT_ENGINE)
+        # A custom engine gets its own memo so results never mix across engines
+        self.memo = memo or (SentimentMemo() if engine else SentimentMemo.default())
     
     def analyze_sentiment(self, text):
         """
@@ -43,13 +39,60 @@ class SentimentAnalyzer:
         if not text or len(text.strip()) == 0:
             return self._default_sentiment()
         
-        # TextBlob analysis
-        blob = TextBlob(text.lower())
-        polarity = blob.sentiment.polarity  # -1 to 1
-        subjectivity = blob.sentiment.subjectivity  # 0 to 1
+        # Short, repeated and structured inputs are served from the memo
+        result = self.memo.lookup(text, self._score)
+        
+        # Track sentiment history
+        self.sentiment_history.append(result)
+        
+        return result
+    
+    def analyze_batch(self, texts, chunk_size=None, workers=None, executor=None):
+        """
+        Analyze many texts without touching sentiment history
         
-        # Keyword-based emotion detection
-        emotions = self._detect_emotions(text.lower())
+        Texts are scored in chunks; with more than one worker the chunks are
+        fanned out across a process pool.
+        
+        Args:
+            texts: Sequence of messages
+            chunk_size: Texts per chunk (defaults to Config.SENTIMENT_BATCH_CHUNK_SIZE)
+            workers: Worker processes (defaults to Config.SENTIMENT_BATCH_WORKERS)
+            executor: Existing concurrent.futures executor to reuse
+            
+        Returns:
+            list: Sentiment results in input order
+        """
+        texts = list(texts)
+        chunk_size = chunk_size or Config.SENTIMENT_BATCH_CHUNK_SIZE
+        workers = workers or Config.SENTIMENT_BATCH_WORKERS
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        
+        if executor is None and (workers <= 1 or len(chunks) <= 1):
+            return [result for chunk in chunks for result in self._score_chunk(chunk)]
+        
+        if executor is not None:
+            mapped = executor.map(_score_chunk, [self.engine] * len(chunks), chunks)
+            return [result for chunk_results in mapped for result in chunk_results]
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            mapped = pool.map(_score_chunk, [self.engine] * len(chunks), chunks)
+            return [result for chunk_results in mapped for result in chunk_results]
+    
+    def get_cache_stats(self):
+        """Get memo hit-rate counters"""
+        return self.memo.stats()
+    
+    def _score_chunk(self, texts):
+        """Score a list of texts"""
+        default = self._default_sentiment
+        return [self._score(text) if text and text.strip() else default() for text in texts]
+    
+    def _score(self, text):
+        """Score one non-empty text (pure, no history)"""
+        # Lexicon polarity (-1 to 1), subjectivity (0 to 1) and
+        # keyword emotions in a single pass
+        polarity, subjectivity, emotions = self.engine.analyze(text)
         
         # Classify sentiment
         sentiment_label = self._classify_sentiment(polarity, emotions)
@@ -57,7 +100,7 @@ class SentimentAnalyzer:
         # Confidence level
         confidence = self._calculate_confidence(polarity, subjectivity, emotions)
         
-        result = {
+        return {
             'polarity': round(polarity, 2),
             'subjectivity': round(subjectivity, 2),
             'sentiment': sentiment_label,
@@ -65,11 +108,6 @@ class SentimentAnalyzer:
             'confidence': confidence,
             'needs_support': self._needs_emotional_support(sentiment_label, emotions)
         }
-        
-        # Track sentiment history
-        self.sentiment_history.append(result)
-        
-        return result
     
     def _classify_sentiment(self, polarity, emotions):
         """Classify sentiment into categories"""
@@ -95,39 +133,7 @@ class SentimentAnalyzer:
     
     def _detect_emotions(self, text):
         """Detect specific emotions from keywords"""
-        emotions = []
-        
-        # Check positive emotions
-        for keyword in self.positive_keywords:
-            if keyword in text:
-                if keyword in ['excited', 'love', 'amazing', 'fantastic']:
-                    emotions.append('excited')
-                elif keyword in ['thanks', 'appreciate']:
-                    emotions.append('grateful')
-                else:
-                    emotions.append('happy')
-                break
-        
-        # Check negative emotions
-        for keyword in self.negative_keywords:
-            if keyword in text:
-                if keyword in ['confused', 'unclear']:
-                    emotions.append('confused')
-                elif keyword in ['frustrated', 'angry', 'upset']:
-                    emotions.append('frustrated')
-                elif keyword in ['worried', 'nervous', 'anxious']:
-                    emotions.append('anxious')
-                else:
-                    emotions.append('unhappy')
-                break
-        
-        # Check uncertainty
-        for keyword in self.uncertainty_keywords:
-            if keyword in text:
-                emotions.append('uncertain')
-                break
-        
-        return list(set(emotions))  # Remove duplicates
+        return self.engine.detect_emotions(text)
     
     def _calculate_confidence(self, polarity, subjectivity, emotions):
         """Calculate confidence in sentiment analysis"""
@@ -178,8 +184,7 @@ class SentimentAnalyzer:
         if len(self.sentiment_history) < 2:
             return 'stable'
         
-        recent = self.sentiment_history[-3:]
-        polarities = [s['polarity'] for s in recent]
+        polarities = self.sentiment_history.recent_polarities(2)
         
         # Check if improving or declining
         if len(polarities) >= 2:
@@ -192,17 +197,17 @@ class SentimentAnalyzer:
     
     def get_average_sentiment(self):
         """Get average sentiment from history"""
-        if not self.sentiment_history:
+        history = self.sentiment_history
+        if not history.count:
             return self._default_sentiment()
         
-        avg_polarity = sum(s['polarity'] for s in self.sentiment_history) / len(self.sentiment_history)
-        avg_subjectivity = sum(s['subjectivity'] for s in self.sentiment_history) / len(self.sentiment_history)
+        avg_polarity = history.average_polarity()
         
         return {
             'polarity': round(avg_polarity, 2),
-            'subjectivity': round(avg_subjectivity, 2),
+            'subjectivity': round(history.average_subjectivity(), 2),
             'sentiment': self._classify_sentiment(avg_polarity, []),
-            'message_count': len(self.sentiment_history)
+            'message_count': history.count
         }
     
     def adjust_response_tone(self, response, sentiment_result):
@@ -247,26 +252,19 @@ class SentimentAnalyzer:
     
     def clear_history(self):
         """Clear sentiment history"""
-        self.sentiment_history = []
+        self.sentiment_history.clear()
     
     def get_emotion_summary(self):
         """Get summary of detected emotions"""
-        if not self.sentiment_history:
+        if not self.sentiment_history.count:
             return "No emotions detected yet"
         
-        all_emotions = []
-        for result in self.sentiment_history:
-            all_emotions.extend(result['emotions'])
-        
-        if not all_emotions:
+        most_common, occurrences = self.sentiment_history.most_common_emotion()
+        if most_common is None:
             return "Neutral conversation tone"
         
-        # Count emotions
-        emotion_counts = {}
-        for emotion in all_emotions:
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
-        
-        # Get most common emotion
-        most_common = max(emotion_counts, key=emotion_counts.get)
-        
-        return f"Predominantly {most_common} ({emotion_counts[most_common]} occurrences)"
\ No newline at end of file
+        return f"Predominantly {most_common} ({occurrences} occurrences)"
+
+def _score_chunk(engine, texts):
+    """Process-pool entry point: score one chunk with a stateless analyzer"""
+    return SentimentAnalyzer(engine)._score_chunk(texts)
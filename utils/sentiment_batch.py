@@ -0,0 +1,231 @@
+"""
+Batch sentiment scoring for TalentScout Hiring Assistant
+Scores stored conversations and transcript files and writes per-candidate aggregates
+
+Usage:
+    python -m utils.sentiment_batch --source store
+    python -m utils.sentiment_batch --source transcripts --pattern "data/transcript_*.txt"
+"""
+import argparse
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from config import Config
+from utils.data_handler import DataHandler
+from utils.sentiment_analyzer import SentimentAnalyzer
+
+# Texts collected before a batch is sent to the pool
+DEFAULT_WINDOW = 10000
+
+
+def iter_store_conversations(data_handler):
+    """
+    Stream candidate messages from the candidate store
+
+    Yields:
+        tuple: (candidate_id, list of candidate messages)
+    """
+    for candidate in data_handler.load_all_candidates():
+        messages = [
+            msg['content'] for msg in candidate.get('conversation_history', [])
+            if msg.get('role') == 'user' and msg.get('content')
+        ]
+        if candidate.get('candidate_id') and messages:
+            yield candidate['candidate_id'], messages
+
+
+def parse_transcript(path):
+    """
+    Extract candidate info and messages from an exported transcript
+
+    Returns:
+        tuple: (info dict with upper-case keys, list of candidate messages)
+    """
+    info = {}
+    messages = []
+    section = None
+    role = None
+    buffer = []
+
+    def flush():
+        if role == 'CANDIDATE' and buffer:
+            text = '\n'.join(buffer).strip()
+            if text:
+                messages.append(text)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for raw in f:
+            line = raw.rstrip('\n')
+            if line == "CANDIDATE INFORMATION:":
+                section = 'info'
+                continue
+            if line == "CONVERSATION TRANSCRIPT:":
+                section = 'conversation'
+                continue
+            if section == 'info':
+                key, sep, value = line.partition(': ')
+                if sep and key.isupper():
+                    info[key] = value
+            elif section == 'conversation':
+                if line in ("ASSISTANT:", "CANDIDATE:"):
+                    flush()
+                    role, buffer = line[:-1], []
+                elif line.startswith("=" * 20):
+                    flush()
+                    role, buffer = None, []
+                elif role:
+                    buffer.append(line)
+    flush()
+    return info, messages
+
+
+def iter_transcript_conversations(pattern="data/transcript_*.txt"):
+    """
+    Stream candidate messages from transcript files
+
+    Yields:
+        tuple: (email or name, list of candidate messages)
+    """
+    for path in sorted(glob.glob(pattern)):
+        info, messages = parse_transcript(path)
+        key = info.get('EMAIL') or info.get('NAME') or path
+        if messages:
+            yield key, messages
+
+
+def aggregate(results):
+    """
+    Summarize sentiment results for one candidate
+
+    Args:
+        results: List of sentiment result dicts
+
+    Returns:
+        dict: Aggregate statistics
+    """
+    count = len(results)
+    if not count:
+        return {'message_count': 0}
+
+    labels = {}
+    emotions = {}
+    for result in results:
+        labels[result['sentiment']] = labels.get(result['sentiment'], 0) + 1
+        for emotion in result['emotions']:
+            emotions[emotion] = emotions.get(emotion, 0) + 1
+
+    return {
+        'message_count': count,
+        'avg_polarity': round(sum(r['polarity'] for r in results) / count, 3),
+        'avg_subjectivity': round(sum(r['subjectivity'] for r in results) / count, 3),
+        'sentiment_counts': labels,
+        'emotion_counts': emotions,
+        'dominant_emotion': max(emotions, key=emotions.get) if emotions else None,
+        'needs_support_ratio': round(sum(1 for r in results if r['needs_support']) / count, 3)
+    }
+
+
+def score_conversations(conversations, analyzer=None, window=DEFAULT_WINDOW,
+                        workers=None, chunk_size=None):
+    """
+    Score a stream of conversations in large batches
+
+    Candidates are accumulated until the window is full, so the process pool
+    always receives big batches while memory stays bounded.
+
+    Args:
+        conversations: Iterable of (key, messages)
+        analyzer: SentimentAnalyzer to use (its history is not modified)
+        window: Messages per batch
+        workers: Worker processes
+        chunk_size: Messages per chunk sent to a worker
+
+    Yields:
+        tuple: (key, aggregate dict)
+    """
+    analyzer = analyzer or SentimentAnalyzer()
+    workers = workers or Config.SENTIMENT_BATCH_WORKERS
+    pending = []
+    texts = []
+
+    def drain(executor):
+        # workers is passed through so a single worker stays in-process
+        results = analyzer.analyze_batch(texts, chunk_size=chunk_size, workers=workers, executor=executor)
+        offset = 0
+        for key, count in pending:
+            yield key, aggregate(results[offset:offset + count])
+            offset += count
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for key, messages in conversations:
+            pending.append((key, len(messages)))
+            texts.extend(messages)
+            if len(texts) >= window:
+                yield from drain(executor)
+                pending, texts = [], []
+        if pending:
+            yield from drain(executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def score_store(data_handler, **kwargs):
+    """
+    Score every stored conversation and save aggregates on the candidate records
+
+    Returns:
+        int: Number of candidates updated
+    """
+    updates = {
+        candidate_id: {'sentiment_aggregate': summary}
+        for candidate_id, summary in score_conversations(iter_store_conversations(data_handler), **kwargs)
+    }
+    return data_handler.update_candidates(updates)
+
+
+def score_transcripts(data_handler, pattern="data/transcript_*.txt", **kwargs):
+    """
+    Score transcript files and save aggregates on candidates matched by email
+
+    Returns:
+        tuple: (number of candidates updated, list of unmatched transcript keys)
+    """
+    ids_by_email = {
+        c.get('email', '').lower(): c.get('candidate_id')
+        for c in data_handler.load_all_candidates() if c.get('email')
+    }
+    updates = {}
+    unmatched = []
+    for key, summary in score_conversations(iter_transcript_conversations(pattern), **kwargs):
+        candidate_id = ids_by_email.get(key.lower())
+        if candidate_id:
+            updates[candidate_id] = {'sentiment_aggregate': summary}
+        else:
+            unmatched.append(key)
+    return data_handler.update_candidates(updates), unmatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch sentiment scoring of stored conversations")
+    parser.add_argument('--source', choices=['store', 'transcripts'], default='store')
+    parser.add_argument('--pattern', default="data/transcript_*.txt")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=None)
+    args = parser.parse_args()
+
+    data_handler = DataHandler(Config.DATA_FILE)
+    options = {'workers': args.workers, 'chunk_size': args.chunk_size}
+
+    if args.source == 'store':
+        updated = score_store(data_handler, **options)
+        print(f"Updated sentiment aggregates for {updated} candidates")
+    else:
+        updated, unmatched = score_transcripts(data_handler, args.pattern, **options)
+        print(f"Updated sentiment aggregates for {updated} candidates")
+        for key in unmatched:
+            print(f"No stored candidate for transcript: {key}")
+
+
+if __name__ == "__main__":
+    main()
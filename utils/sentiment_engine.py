@@ -0,0 +1,174 @@
+"""
+Built-in sentiment engine for TalentScout Hiring Assistant
+Scores polarity, subjectivity and emotions from the shared message analysis
+"""
+import os
+import threading
+from utils.preprocessing import analyze_message
+
+LEXICON_PATH = os.path.join(os.path.dirname(__file__), "resources", "sentiment_lexicon.tsv")
+
+# Words that scale the next sentiment word (same factor the pattern lexicon uses)
+INTENSIFIERS = {
+    'very': 1.3, 'really': 1.3, 'extremely': 1.5, 'so': 1.2, 'too': 1.2,
+    'quite': 1.1, 'super': 1.3, 'incredibly': 1.5, 'totally': 1.3, 'highly': 1.3
+}
+
+NEGATIONS = {'not', 'no', 'never', 'nothing', 'neither', 'nor', 'hardly', 'without'}
+
+# Negation flips and dampens polarity, as in TextBlob's PatternAnalyzer
+NEGATION_FACTOR = -0.5
+
+# How many tokens a negation or intensifier reaches forward
+MODIFIER_WINDOW = 2
+
+
+def load_lexicon(path=LEXICON_PATH):
+    """
+    Load the polarity lexicon
+
+    Returns:
+        dict: word -> (polarity, subjectivity)
+    """
+    lexicon = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            word, polarity, subjectivity = line.rstrip('\n').split('\t')
+            lexicon[word] = (float(polarity), float(subjectivity))
+    return lexicon
+
+
+class LexiconSentimentEngine:
+    """Lexicon-based polarity/subjectivity scoring with whole-word emotion matching"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, lexicon_path=LEXICON_PATH):
+        """
+        Initialize engine
+
+        Args:
+            lexicon_path: Path to the tab-separated polarity lexicon
+        """
+        self.lexicon = load_lexicon(lexicon_path)
+
+    @classmethod
+    def default(cls):
+        """Get the shared engine (the lexicon is loaded once per process)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def analyze(self, text):
+        """
+        Score text
+
+        Tokens and emotion keyword hits come from the shared message
+        analysis, so a message already preprocessed this turn is not
+        scanned again.
+
+        Args:
+            text: Message text
+
+        Returns:
+            tuple: (polarity, subjectivity, emotions)
+        """
+        message = analyze_message(text)
+        polarity, subjectivity = self.score_tokens(message.tokens)
+        return polarity, subjectivity, list(message.emotions)
+
+    def score_tokens(self, tokens):
+        """
+        Score polarity and subjectivity of word tokens
+
+        Returns:
+            tuple: (polarity, subjectivity)
+        """
+        lexicon = self.lexicon
+        polarity_sum = 0.0
+        subjectivity_sum = 0.0
+        assessments = 0
+
+        negate_for = 0
+        intensity = 1.0
+        intensity_for = 0
+
+        for word in tokens:
+            if word in NEGATIONS or word.endswith("n't"):
+                negate_for = MODIFIER_WINDOW
+                continue
+            if word in INTENSIFIERS:
+                intensity = INTENSIFIERS[word]
+                intensity_for = MODIFIER_WINDOW
+                continue
+
+            scores = lexicon.get(word)
+            if scores is not None:
+                polarity, subjectivity = scores
+                if intensity_for:
+                    polarity *= intensity
+                    subjectivity *= intensity
+                    intensity_for = 0
+                if negate_for:
+                    polarity *= NEGATION_FACTOR
+                    negate_for = 0
+                polarity_sum += max(-1.0, min(1.0, polarity))
+                subjectivity_sum += max(0.0, min(1.0, subjectivity))
+                assessments += 1
+            else:
+                negate_for = max(0, negate_for - 1)
+                intensity_for = max(0, intensity_for - 1)
+
+        if not assessments:
+            return 0.0, 0.0
+        return polarity_sum / assessments, subjectivity_sum / assessments
+
+    def detect_emotions(self, text):
+        """Detect emotions only"""
+        return list(analyze_message(text).emotions)
+
+
+class TextBlobSentimentEngine:
+    """TextBlob polarity with built-in emotion matching (optional dependency)"""
+
+    def __init__(self):
+        """Initialize engine; textblob itself is imported on first analysis"""
+        self._textblob = None
+        self._emotions = LexiconSentimentEngine.default()
+
+    def _blob(self, text):
+        """Build a TextBlob, importing textblob (and nltk) lazily"""
+        if self._textblob is None:
+            # PatternAnalyzer ships its lexicon inside textblob, so no NLTK
+            # corpora are needed and nothing is ever downloaded here
+            from textblob import TextBlob
+            self._textblob = TextBlob
+        return self._textblob(text)
+
+    def analyze(self, text):
+        """Score text (same return shape as LexiconSentimentEngine.analyze)"""
+        sentiment = self._blob(text.lower()).sentiment
+        return sentiment.polarity, sentiment.subjectivity, self._emotions.detect_emotions(text)
+
+    def detect_emotions(self, text):
+        """Detect emotions only"""
+        return self._emotions.detect_emotions(text)
+
+
+def get_engine(name="lexicon"):
+    """
+    Get a sentiment engine by name
+
+    Args:
+        name: "lexicon" (default, built-in) or "textblob"
+
+    Returns:
+        Engine with analyze(text) and detect_emotions(text)
+    """
+    if name == "textblob":
+        return TextBlobSentimentEngine()
+    return LexiconSentimentEngine.default()
@@ -0,0 +1,115 @@
+"""
+Sentiment history for TalentScout Hiring Assistant
+Bounded ring buffer with running aggregates updated on insert
+"""
+from collections import deque
+from config import Config
+
+# Fields kept per entry, in tuple order
+_FIELDS = ('polarity', 'subjectivity', 'sentiment', 'emotions', 'confidence', 'needs_support')
+
+
+class SentimentHistory:
+    """Fixed-size sentiment history with O(1) average, trend and emotion queries"""
+
+    def __init__(self, max_size=None):
+        """
+        Initialize history
+
+        Args:
+            max_size: Entries kept for trend/latest queries (defaults to Config.SENTIMENT_HISTORY_SIZE)
+        """
+        self._entries = deque(maxlen=max_size or Config.SENTIMENT_HISTORY_SIZE)
+        self.clear()
+
+    def clear(self):
+        """Reset entries and aggregates"""
+        self._entries.clear()
+        self.count = 0
+        self.polarity_total = 0.0
+        self.subjectivity_total = 0.0
+        self.emotion_counts = {}
+
+    def append(self, result):
+        """
+        Add a sentiment result and update running aggregates
+
+        Aggregates cover every message of the session; only the entries
+        themselves are bounded, so memory stays capped.
+        """
+        self._entries.append(tuple(
+            tuple(result[field]) if field == 'emotions' else result[field] for field in _FIELDS
+        ))
+        self.count += 1
+        self.polarity_total += result['polarity']
+        self.subjectivity_total += result['subjectivity']
+        for emotion in result['emotions']:
+            self.emotion_counts[emotion] = self.emotion_counts.get(emotion, 0) + 1
+
+    @staticmethod
+    def _unpack(entry):
+        """Rebuild a result dict from a stored tuple"""
+        result = dict(zip(_FIELDS, entry))
+        result['emotions'] = list(result['emotions'])
+        return result
+
+    def latest(self):
+        """Get the most recent result or None"""
+        return self._unpack(self._entries[-1]) if self._entries else None
+
+    def recent_polarities(self, n):
+        """Get polarities of the last n entries, oldest first"""
+        n = min(n, len(self._entries))
+        return [self._entries[-i][0] for i in range(n, 0, -1)]
+
+    def average_polarity(self):
+        """Mean polarity over the session"""
+        return self.polarity_total / self.count if self.count else 0.0
+
+    def average_subjectivity(self):
+        """Mean subjectivity over the session"""
+        return self.subjectivity_total / self.count if self.count else 0.0
+
+    def most_common_emotion(self):
+        """
+        Get the most frequent emotion
+
+        Returns:
+            tuple: (emotion, count) or (None, 0)
+        """
+        if not self.emotion_counts:
+            return None, 0
+        emotion = max(self.emotion_counts, key=self.emotion_counts.get)
+        return emotion, self.emotion_counts[emotion]
+
+    def to_dict(self):
+        """Serialize entries and aggregates to JSON-safe data"""
+        return {
+            'max_size': self._entries.maxlen,
+            'entries': [list(entry[:3]) + [list(entry[3])] + list(entry[4:]) for entry in self._entries],
+            'count': self.count,
+            'polarity_total': self.polarity_total,
+            'subjectivity_total': self.subjectivity_total,
+            'emotion_counts': dict(self.emotion_counts)
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a history saved with to_dict"""
+        history = cls(data.get('max_size'))
+        for entry in data.get('entries', []):
+            history._entries.append(tuple(entry[:3]) + (tuple(entry[3]),) + tuple(entry[4:]))
+        history.count = data.get('count', len(history._entries))
+        history.polarity_total = data.get('polarity_total', 0.0)
+        history.subjectivity_total = data.get('subjectivity_total', 0.0)
+        history.emotion_counts = dict(data.get('emotion_counts', {}))
+        return history
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return (self._unpack(entry) for entry in self._entries)
+
+    def __getitem__(self, index):
+        return self._unpack(self._entries[index])
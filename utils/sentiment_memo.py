@@ -0,0 +1,110 @@
+"""
+Sentiment memo for TalentScout Hiring Assistant
+LRU cache and structured-input fast path in front of sentiment scoring
+"""
+import threading
+from collections import OrderedDict
+from config import Config
+from utils.preprocessing import analyze_message
+
+NEUTRAL_RESULT = {
+    'polarity': 0.0,
+    'subjectivity': 0.0,
+    'sentiment': 'neutral',
+    'emotions': [],
+    'confidence': 0.5,
+    'needs_support': False
+}
+
+
+def _copy(result):
+    """Copy a result so callers can't mutate cached entries"""
+    copy = dict(result)
+    copy['emotions'] = list(result['emotions'])
+    return copy
+
+
+class SentimentMemo:
+    """Thread-safe LRU memo of sentiment results keyed on normalized text"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, max_size=None):
+        """
+        Initialize memo
+
+        Args:
+            max_size: Maximum cached results (defaults to Config.SENTIMENT_MEMO_SIZE)
+        """
+        self.max_size = max_size or Config.SENTIMENT_MEMO_SIZE
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fast_path = 0
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide memo (results depend only on the text)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def lookup(self, text, compute):
+        """
+        Get a cached result or compute and cache it
+
+        Args:
+            text: Raw message
+            compute: Function scoring the raw message on a cache miss
+
+        Returns:
+            dict: Sentiment result
+        """
+        # Inputs that carry no sentiment (emails, phone numbers, numbers)
+        # skip scoring entirely
+        message = analyze_message(text)
+        key = message.normalized
+
+        if message.structured:
+            with self._lock:
+                self.fast_path += 1
+            return _copy(NEUTRAL_RESULT)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return _copy(cached)
+            self.misses += 1
+
+        result = compute(text)
+
+        with self._lock:
+            self._cache[key] = _copy(result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def stats(self):
+        """Get hit-rate counters"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.fast_path
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'fast_path': self.fast_path,
+                'size': len(self._cache),
+                'hit_rate': round((self.hits + self.fast_path) / lookups, 3) if lookups else 0.0
+            }
+
+    def clear(self):
+        """Drop cached results and reset counters"""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.fast_path = 0
@@ -0,0 +1,425 @@
+"""
+Session store for TalentScout Hiring Assistant
+Persists interview snapshots after each turn so any worker can resume them by token
+
+A session is stored as a compressed base snapshot plus a short log of
+deltas (one per turn); every Config.SESSION_COMPACT_EVERY deltas the log
+is folded into a new base. Backends only implement four primitives
+(_read, _write_base, _append_delta, _remove), so a networked key-value
+store can be added next to the SQLite and file backends.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are only serialized within the process
+    fcntl = None
+
+
+def encode_snapshot(snapshot):
+    """Compact binary form of a snapshot (minified JSON, zlib-compressed)"""
+    return zlib.compress(json.dumps(snapshot, separators=(',', ':')).encode('utf-8'))
+
+
+def decode_snapshot(data):
+    """Inverse of encode_snapshot"""
+    return json.loads(zlib.decompress(data).decode('utf-8'))
+
+
+def encode_delta(ops):
+    """Minified JSON form of delta operations"""
+    return json.dumps(ops, separators=(',', ':'))
+
+
+def diff(old, new, path=()):
+    """
+    Operations turning one snapshot into another
+
+    Lists that only grew at the end, or dropped items at the front and
+    grew (trimmed LLM context, bounded sentiment history), are encoded as
+    a splice instead of being stored again.
+
+    Returns:
+        list: ['set', path, value], ['unset', path] or
+            ['splice', path, dropped from front, appended items]
+    """
+    ops = []
+    for key, value in new.items():
+        key_path = list(path) + [key]
+        if key not in old:
+            ops.append(['set', key_path, value])
+            continue
+        previous = old[key]
+        if previous == value:
+            continue
+        if isinstance(previous, dict) and isinstance(value, dict):
+            ops.extend(diff(previous, value, key_path))
+        elif isinstance(previous, list) and isinstance(value, list):
+            ops.append(_list_op(key_path, previous, value))
+        else:
+            ops.append(['set', key_path, value])
+    for key in old:
+        if key not in new:
+            ops.append(['unset', list(path) + [key]])
+    return ops
+
+
+def _list_op(path, previous, value):
+    """Splice when value is previous minus a prefix plus new items, else set"""
+    for dropped in range(len(previous) + 1):
+        kept = len(previous) - dropped
+        if kept <= len(value) and previous[dropped:] == value[:kept]:
+            if dropped == len(previous) and previous:
+                break
+            return ['splice', path, dropped, value[kept:]]
+    return ['set', path, value]
+
+
+def apply_delta(snapshot, ops):
+    """Apply diff() operations to a snapshot in place"""
+    for op in ops:
+        kind, path = op[0], op[1]
+        target = snapshot
+        for key in path[:-1]:
+            target = target[key]
+        key = path[-1]
+        if kind == 'set':
+            target[key] = op[2]
+        elif kind == 'unset':
+            target.pop(key, None)
+        elif kind == 'splice':
+            items = target[key]
+            del items[:op[2]]
+            items.extend(op[3])
+    return snapshot
+
+
+class SessionStore:
+    """Delta-encoded snapshot storage; subclasses provide the primitives"""
+
+    def __init__(self, compact_every=None, cache_size=None):
+        """
+        Initialize store
+
+        Args:
+            compact_every: Deltas kept before a new base snapshot is written
+            cache_size: Sessions whose last snapshot is kept in memory for diffing
+        """
+        self.compact_every = compact_every or Config.SESSION_COMPACT_EVERY
+        self.cache_size = cache_size or Config.SESSION_CACHE_SIZE
+        # Snapshots are cached encoded: a few KB per session instead of a dict tree
+        self._cache = OrderedDict()  # token -> (version, base version, encoded snapshot)
+        self._lock = threading.Lock()
+
+    # Primitives
+
+    def _read(self, token):
+        """
+        Get stored data for a session
+
+        Returns:
+            tuple: (base bytes, base version, [(seq, delta json)] in order) or None
+        """
+        raise NotImplementedError
+
+    def _write_base(self, token, version, data):
+        """Store a new base snapshot and drop older deltas"""
+        raise NotImplementedError
+
+    def _append_delta(self, token, seq, delta):
+        """Append a delta; return False if seq was already written elsewhere"""
+        raise NotImplementedError
+
+    def _remove(self, token):
+        """Delete a session"""
+        raise NotImplementedError
+
+    # Public API
+
+    def save(self, token, snapshot):
+        """
+        Persist the latest snapshot of a session
+
+        Args:
+            token: Session token
+            snapshot: JSON-safe dict (e.g. InterviewState.to_dict())
+
+        Returns:
+            int: Stored version
+        """
+        encoded = encode_snapshot(snapshot)
+
+        with self._lock:
+            cached = self._cache.get(token)
+        if cached is None:
+            cached = self._load_versioned(token)
+
+        if cached is None:
+            version = base_version = 1
+            self._write_base(token, version, encoded)
+        else:
+            previous_version, base_version, previous = cached
+            if previous == encoded:
+                return previous_version
+            ops = diff(decode_snapshot(previous), snapshot)
+            if not ops:
+                return previous_version
+            version = previous_version + 1
+            if version - base_version >= self.compact_every or \
+                    not self._append_delta(token, version, encode_delta(ops)):
+                base_version = version
+                self._write_base(token, version, encoded)
+
+        self._remember(token, (version, base_version, encoded))
+        return version
+
+    def load(self, token):
+        """
+        Resume a session
+
+        Returns:
+            dict: Latest snapshot, or None if the token is unknown
+        """
+        loaded = self._load_versioned(token)
+        if loaded is None:
+            return None
+        self._remember(token, loaded)
+        return decode_snapshot(loaded[2])
+
+    def delete(self, token):
+        """Forget a session"""
+        with self._lock:
+            self._cache.pop(token, None)
+        self._remove(token)
+
+    def _load_versioned(self, token):
+        """Rebuild (version, base version, encoded snapshot) from storage"""
+        stored = self._read(token)
+        if stored is None:
+            return None
+        data, base_version, deltas = stored
+        snapshot = decode_snapshot(data)
+        version = base_version
+        for seq, delta in deltas:
+            # A torn or out-of-order delta ends the usable log
+            if seq != version + 1:
+                break
+            try:
+                apply_delta(snapshot, json.loads(delta))
+            except (ValueError, KeyError, IndexError, TypeError):
+                break
+            version = seq
+        if version != base_version:
+            data = encode_snapshot(snapshot)
+        return version, base_version, data
+
+    def _remember(self, token, entry):
+        with self._lock:
+            self._cache[token] = entry
+            self._cache.move_to_end(token)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions in one SQLite database (WAL mode; safe across processes on one host)"""
+
+    def __init__(self, path=None, **kwargs):
+        """
+        Initialize store
+
+        Args:
+            path: Database file (defaults to Config.SESSION_STORE_PATH)
+        """
+        super().__init__(**kwargs)
+        self.path = path or Config.SESSION_STORE_PATH
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS sessions ("
+                         "token TEXT PRIMARY KEY, version INTEGER, base BLOB, updated REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS deltas ("
+                         "token TEXT, seq INTEGER, delta TEXT, PRIMARY KEY (token, seq))")
+
+    def _connection(self):
+        """One connection per thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _read(self, token):
+        conn = self._connection()
+        row = conn.execute("SELECT base, version FROM sessions WHERE token = ?", (token,)).fetchone()
+        if row is None:
+            return None
+        deltas = conn.execute(
+            "SELECT seq, delta FROM deltas WHERE token = ? AND seq > ? ORDER BY seq", (token, row[1])
+        ).fetchall()
+        return row[0], row[1], deltas
+
+    def _write_base(self, token, version, data):
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO sessions (token, version, base, updated) VALUES (?, ?, ?, ?)",
+                         (token, version, data, time.time()))
+            conn.execute("DELETE FROM deltas WHERE token = ? AND seq <= ?", (token, version))
+
+    def _append_delta(self, token, seq, delta):
+        try:
+            with self._connection() as conn:
+                conn.execute("INSERT INTO deltas (token, seq, delta) VALUES (?, ?, ?)", (token, seq, delta))
+                conn.execute("UPDATE sessions SET updated = ? WHERE token = ?", (time.time(), token))
+            return True
+        except sqlite3.IntegrityError:
+            return False
+
+    def _remove(self, token):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
+            conn.execute("DELETE FROM deltas WHERE token = ?", (token,))
+
+    def purge(self, max_age):
+        """Delete sessions not updated for max_age seconds; returns how many"""
+        cutoff = time.time() - max_age
+        with self._connection() as conn:
+            tokens = [row[0] for row in conn.execute("SELECT token FROM sessions WHERE updated < ?", (cutoff,))]
+            conn.executemany("DELETE FROM sessions WHERE token = ?", [(t,) for t in tokens])
+            conn.executemany("DELETE FROM deltas WHERE token = ?", [(t,) for t in tokens])
+        return len(tokens)
+
+
+class FileSessionStore(SessionStore):
+    """Sessions as <token>.base snapshots plus append-only <token>.log delta files"""
+
+    def __init__(self, directory=None, **kwargs):
+        """
+        Initialize store
+
+        Args:
+            directory: Storage directory (defaults to Config.SESSION_STORE_DIR)
+        """
+        super().__init__(**kwargs)
+        self.directory = directory or Config.SESSION_STORE_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self._file_lock = threading.Lock()
+
+    def _paths(self, token):
+        if not token or not token.replace('-', '').replace('_', '').isalnum():
+            raise ValueError(f"Invalid session token: {token!r}")
+        base = os.path.join(self.directory, token)
+        return base + '.base', base + '.log'
+
+    def _read(self, token):
+        try:
+            base_path, log_path = self._paths(token)
+        except ValueError:
+            # Tokens come from URLs; one that can't be a file name is unknown
+            return None
+        try:
+            with open(base_path, 'rb') as f:
+                version = int.from_bytes(f.read(8), 'big')
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        deltas = []
+        try:
+            with open(log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    seq, sep, delta = line.rstrip('\n').partition(' ')
+                    if not sep or not seq.isdigit():
+                        break
+                    if int(seq) > version:
+                        deltas.append((int(seq), delta))
+        except FileNotFoundError:
+            pass
+        return data, version, deltas
+
+    def _write_base(self, token, version, data):
+        base_path, log_path = self._paths(token)
+        tmp_path = f"{base_path}.{os.getpid()}.tmp"
+        with self._file_lock:
+            with open(tmp_path, 'wb') as f:
+                f.write(version.to_bytes(8, 'big'))
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, base_path)
+            # Deltas up to this version are folded into the base
+            try:
+                os.remove(log_path)
+            except FileNotFoundError:
+                pass
+
+    def _append_delta(self, token, seq, delta):
+        base_path, log_path = self._paths(token)
+        with self._file_lock:
+            with open(log_path, 'a+', encoding='utf-8') as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                # A writer with a stale cached version would append a
+                # duplicate seq and hide everything after it; refuse, so
+                # save() writes a base instead
+                try:
+                    with open(base_path, 'rb') as base:
+                        last = int.from_bytes(base.read(8), 'big')
+                except FileNotFoundError:
+                    return False
+                f.seek(0)
+                for line in f:
+                    seq_text, sep, _ = line.partition(' ')
+                    if not sep or not seq_text.isdigit() or not line.endswith('\n'):
+                        # Torn entry: anything appended after it would be unreadable
+                        return False
+                    last = max(last, int(seq_text))
+                if seq != last + 1:
+                    return False
+                f.write(f"{seq} {delta}\n")
+                f.flush()
+                os.fsync(f.fileno())
+        return True
+
+    def _remove(self, token):
+        for path in self._paths(token):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def purge(self, max_age):
+        """Delete sessions not updated for max_age seconds; returns how many"""
+        cutoff = time.time() - max_age
+        purged = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.base'):
+                continue
+            token = name[:-5]
+            paths = self._paths(token)
+            updated = max(os.path.getmtime(p) for p in paths if os.path.exists(p))
+            if updated < cutoff:
+                self.delete(token)
+                purged += 1
+        return purged
+
+
+def get_session_store(kind=None):
+    """
+    Create the configured session store
+
+    Args:
+        kind: "sqlite" (default) or "file"; defaults to Config.SESSION_STORE
+    """
+    kind = kind or Config.SESSION_STORE
+    if kind == "file":
+        return FileSessionStore()
+    return SQLiteSessionStore()
@@ -0,0 +1,315 @@
+"""
+Background task queue for TalentScout Hiring Assistant
+Runs post-interview work (persisting, exports, aggregation) off the request path
+
+Tasks are named handlers with JSON payloads. Every submission and outcome
+is appended to a journal, so tasks still pending when the process dies are
+run again on the next start. Delivery is at-least-once: handlers must be
+safe to repeat.
+
+A journal belongs to one process at a time. Processes sharing a journal
+path (the app, the server, several server workers) each lock the first
+free slot: tasks.journal, tasks.1.journal, tasks.2.journal, ... A process
+that starts after a crash takes over a free slot and runs what it holds.
+"""
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class TaskError(Exception):
+    """Raised for unknown task names"""
+
+
+def _try_lock(f):
+    """Take an exclusive, non-blocking lock on an open file"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+class TaskQueue:
+    """
+    Durable in-process task queue with a worker pool and retries
+
+    A handler takes the payload and may return follow-up tasks as a list of
+    (name, payload) pairs; they are journaled before the parent is marked
+    done, so a pipeline survives a crash between its steps.
+    """
+
+    def __init__(self, journal_path=None, workers=None, max_attempts=None, retry_backoff=None):
+        """
+        Initialize queue
+
+        Args:
+            journal_path: Journal file, or the first slot of it when shared (None keeps tasks in memory only)
+            workers: Worker threads; 0 runs every task inline in submit()
+            max_attempts: Attempts before a task is recorded as failed
+            retry_backoff: Seconds before the first retry (doubled after each)
+        """
+        self.journal_base = journal_path
+        self.journal_path = None  # Slot claimed in start()
+        self._slot_lock = None
+        self.workers = Config.TASK_WORKERS if workers is None else workers
+        self.max_attempts = max_attempts or Config.TASK_MAX_ATTEMPTS
+        self.retry_backoff = Config.TASK_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.handlers = {}
+        self.stats = {'submitted': 0, 'done': 0, 'retried': 0, 'failed': 0}
+
+        self._queue = queue.Queue()
+        self._pending = {}  # task id -> task
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._threads = []
+        self._finished_since_compact = 0
+        self._started = False
+
+    def register(self, name, handler):
+        """
+        Register the handler for a task name
+
+        Args:
+            name: Task name stored in the journal
+            handler: Callable taking the payload; may return [(name, payload)]
+        """
+        self.handlers[name] = handler
+
+    def start(self):
+        """Replay unfinished journal tasks and start the workers (idempotent)"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            recovered = self._recover()
+
+        for task in recovered:
+            self._dispatch(task)
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"task-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if recovered:
+            print(f"Resuming {len(recovered)} unfinished background tasks")
+
+    def submit(self, name, payload=None):
+        """
+        Queue a task
+
+        Args:
+            name: Registered task name
+            payload: JSON-safe task data
+
+        Returns:
+            str: Task ID
+        """
+        return self._submit_many([(name, payload)])[0]
+
+    def drain(self, timeout=None):
+        """
+        Wait until no tasks are pending (retries included)
+
+        Returns:
+            bool: True if the queue drained before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def pending(self):
+        """Number of tasks not yet done or failed"""
+        with self._lock:
+            return len(self._pending)
+
+    def stop(self, timeout=None):
+        """Let workers finish their current task and exit; pending tasks stay journaled"""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._started = False
+
+    # Internals
+
+    def _claim_journal(self):
+        """
+        Lock the first journal slot no other process holds (caller holds the lock)
+
+        The lock is held until the process exits.
+        """
+        if not self.journal_base or self.journal_path:
+            return
+        os.makedirs(os.path.dirname(self.journal_base) or '.', exist_ok=True)
+        root, ext = os.path.splitext(self.journal_base)
+        for slot in range(Config.TASK_JOURNAL_SLOTS):
+            path = self.journal_base if slot == 0 else f"{root}.{slot}{ext}"
+            lock_file = open(path + '.lock', 'a+')
+            if _try_lock(lock_file):
+                self.journal_path = path
+                self._slot_lock = lock_file
+                return
+            lock_file.close()
+        raise RuntimeError(f"All {Config.TASK_JOURNAL_SLOTS} task journal slots of {self.journal_base} are in use")
+
+    def _submit_many(self, tasks):
+        """Journal and queue tasks"""
+        created = []
+        for name, payload in tasks:
+            if name not in self.handlers:
+                raise TaskError(f"Unknown task: {name}")
+            created.append({'id': uuid.uuid4().hex, 'name': name, 'payload': payload, 'attempt': 0})
+
+        with self._lock:
+            self._journal([{'op': 'submit', **task} for task in created])
+            for task in created:
+                self._pending[task['id']] = task
+            self.stats['submitted'] += len(created)
+
+        for task in created:
+            self._dispatch(task)
+        return [task['id'] for task in created]
+
+    def _dispatch(self, task):
+        """Hand a task to the workers, or run it now in inline mode"""
+        if self.workers:
+            self._queue.put(task)
+        else:
+            self._run(task)
+
+    def _work(self):
+        """Worker loop"""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            self._run(task)
+
+    def _run(self, task):
+        """Run one attempt of a task"""
+        task['attempt'] += 1
+        try:
+            follow_ups = self.handlers[task['name']](task['payload'])
+        except Exception as e:
+            self._retry_or_fail(task, e)
+            return
+
+        if follow_ups:
+            try:
+                self._submit_many(follow_ups)
+            except Exception as e:
+                self._retry_or_fail(task, e)
+                return
+        self._finish(task, {'op': 'done', 'id': task['id']}, 'done')
+
+    def _retry_or_fail(self, task, error):
+        """Schedule a retry with backoff, or record the task as failed"""
+        if task['attempt'] >= self.max_attempts:
+            print(f"Task {task['name']} failed after {task['attempt']} attempts: {str(error)}")
+            self._finish(task, {'op': 'failed', 'id': task['id'], 'error': str(error)}, 'failed')
+            return
+
+        with self._lock:
+            self._journal([{'op': 'attempt', 'id': task['id'], 'attempt': task['attempt']}])
+            self.stats['retried'] += 1
+        delay = self.retry_backoff * (2 ** (task['attempt'] - 1))
+        if not self.workers or delay <= 0:
+            self._dispatch(task)
+            return
+        timer = threading.Timer(delay, self._queue.put, args=(task,))
+        timer.daemon = True
+        timer.start()
+
+    def _finish(self, task, record, outcome):
+        """Record the final outcome of a task"""
+        with self._lock:
+            self._journal([record])
+            self._pending.pop(task['id'], None)
+            self.stats[outcome] += 1
+            self._finished_since_compact += 1
+            if self._finished_since_compact >= Config.TASK_JOURNAL_COMPACT_EVERY:
+                self._compact()
+            if not self._pending:
+                self._idle.notify_all()
+
+    def _journal(self, records):
+        """Append records to the journal and fsync (caller holds the lock)"""
+        if not self.journal_path:
+            return
+        lines = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self):
+        """Rewrite the journal with only pending tasks (caller holds the lock)"""
+        self._finished_since_compact = 0
+        if not self.journal_path:
+            return
+        tmp_path = f"{self.journal_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for task in self._pending.values():
+                f.write(json.dumps({'op': 'submit', **task}, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+
+    def _recover(self):
+        """
+        Load tasks left unfinished in the journal (caller holds the lock)
+
+        Returns:
+            list: Tasks to run again
+        """
+        self._claim_journal()
+        if not self.journal_path:
+            return []
+
+        tasks = {}
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-write
+                        continue
+                    op = record.pop('op', None)
+                    if op == 'submit':
+                        tasks[record['id']] = record
+                    elif op == 'attempt' and record['id'] in tasks:
+                        tasks[record['id']]['attempt'] = record['attempt']
+                    elif op in ('done', 'failed'):
+                        tasks.pop(record['id'], None)
+        except FileNotFoundError:
+            pass
+
+        recovered = []
+        for task in tasks.values():
+            if task['name'] not in self.handlers:
+                print(f"Dropping journaled task with no handler: {task['name']}")
+                continue
+            self._pending[task['id']] = task
+            recovered.append(task)
+        self._compact()
+        return recovered
@@ -0,0 +1,196 @@
+"""
+Technology taxonomy for TalentScout Hiring Assistant
+Canonical names, aliases and categories loaded into hash maps once per version
+
+Usage:
+    python -m utils.taxonomy --canonicalize-store
+"""
+import argparse
+import hashlib
+import json
+import re
+import threading
+from config import Config
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Characters ignored when comparing spellings ("React.js" == "reactjs" == "react js")
+_PUNCTUATION = re.compile(r'[\s.\-_]+')
+
+
+def normalize(name):
+    """Case and whitespace insensitive lookup key"""
+    return _WHITESPACE.sub(' ', name.strip().lower())
+
+
+def compact(name):
+    """Lookup key that also ignores dots, hyphens and underscores"""
+    return _PUNCTUATION.sub('', name.strip().lower())
+
+
+def taxonomy_version(categories, aliases):
+    """Content hash of a category table and alias table"""
+    payload = json.dumps([categories, aliases], sort_keys=True).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+class TechTaxonomy:
+    """O(1) canonicalization and category lookup for technology names"""
+
+    _default = None
+    _default_lock = threading.Lock()
+    _default_source = (None, None)
+
+    def __init__(self, categories, aliases=None):
+        """
+        Build lookup tables
+
+        Args:
+            categories: Dictionary mapping category to technology names; a
+                technology listed under several categories is kept once,
+                with the first category as its primary one
+            aliases: Dictionary mapping canonical name to alternative spellings
+        """
+        aliases = aliases or {}
+        self.version = taxonomy_version(categories, aliases)
+        self.canonical = []
+        self.categories = {}
+        self.aliases = {}
+        self._lookup = {}
+        self._compact_lookup = {}
+
+        for category, technologies in categories.items():
+            for tech in technologies:
+                if tech not in self.categories:
+                    self.canonical.append(tech)
+                    self.categories[tech] = []
+                    self.aliases[tech] = []
+                    self._add(tech, tech)
+                if category not in self.categories[tech]:
+                    self.categories[tech].append(category)
+
+        for tech, spellings in aliases.items():
+            if tech not in self.categories:
+                print(f"Ignoring aliases for unknown technology: {tech}")
+                continue
+            for spelling in spellings:
+                if self._add(spelling, tech):
+                    self.aliases[tech].append(spelling)
+
+    def _add(self, spelling, tech):
+        """Map a spelling to a canonical name; the first mapping wins"""
+        key = normalize(spelling)
+        if not key or key in self._lookup:
+            return False
+        self._lookup[key] = tech
+        self._compact_lookup.setdefault(compact(spelling), tech)
+        return True
+
+    @classmethod
+    def default(cls):
+        """Get the taxonomy for the current Config tables, rebuilt only when they are replaced"""
+        source = (Config.TECH_CATEGORIES, Config.TECH_ALIASES)
+        taxonomy = cls._default
+        if taxonomy is not None and cls._default_source[0] is source[0] \
+                and cls._default_source[1] is source[1]:
+            return taxonomy
+        with cls._default_lock:
+            if cls._default is None or cls._default_source[0] is not source[0] \
+                    or cls._default_source[1] is not source[1]:
+                cls._default = cls(*source)
+                cls._default_source = source
+            return cls._default
+
+    def canonicalize(self, name):
+        """
+        Resolve a spelling to its canonical name
+
+        Returns:
+            str: Canonical name, or None if the technology is unknown
+        """
+        if not name:
+            return None
+        tech = self._lookup.get(normalize(name))
+        if tech is None:
+            tech = self._compact_lookup.get(compact(name))
+        return tech
+
+    def canonicalize_or_keep(self, name):
+        """Canonical name for known technologies, the trimmed input otherwise"""
+        return self.canonicalize(name) or name.strip()
+
+    def canonicalize_list(self, names):
+        """
+        Canonicalize names, dropping blanks and duplicates
+
+        Args:
+            names: Iterable of technology names or a comma-separated string
+
+        Returns:
+            list: Names in first-seen order
+        """
+        if isinstance(names, str):
+            names = names.split(',')
+        result = []
+        seen = set()
+        for name in names:
+            tech = self.canonicalize_or_keep(name)
+            key = tech.lower()
+            if tech and key not in seen:
+                seen.add(key)
+                result.append(tech)
+        return result
+
+    def category(self, name):
+        """Get the primary category of a technology, or None"""
+        tech = self.canonicalize(name)
+        return self.categories[tech][0] if tech else None
+
+    def all_categories(self, name):
+        """Get every category a technology belongs to"""
+        tech = self.canonicalize(name)
+        return list(self.categories[tech]) if tech else []
+
+    def is_known(self, name):
+        """Check whether a name resolves to a known technology"""
+        return self.canonicalize(name) is not None
+
+    def cache_key(self, names):
+        """
+        Order- and spelling-insensitive key for a tech stack
+
+        "reactjs, Python" and "python, React" share one key.
+        """
+        return '|'.join(sorted(tech.lower() for tech in self.canonicalize_list(names)))
+
+    def match_entries(self):
+        """
+        Spellings for a matching index
+
+        Yields:
+            tuple: (spelling, canonical name) for every name and alias
+        """
+        for tech in self.canonical:
+            yield tech, tech
+            for spelling in self.aliases[tech]:
+                yield spelling, tech
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Technology taxonomy maintenance")
+    parser.add_argument('--canonicalize-store', action='store_true',
+                        help="Rewrite stored tech stacks with canonical names")
+    args = parser.parse_args()
+
+    taxonomy = TechTaxonomy.default()
+    if args.canonicalize_store:
+        from utils.data_handler import DataHandler
+        updated = DataHandler(Config.DATA_FILE).canonicalize_tech_stacks(taxonomy)
+        print(f"Canonicalized tech stacks for {updated} candidates")
+    else:
+        print(f"Taxonomy {taxonomy.version}: {len(taxonomy.canonical)} technologies, "
+              f"{sum(len(a) for a in taxonomy.aliases.values())} aliases")
+
+
+if __name__ == "__main__":
+    main()
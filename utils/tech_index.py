@@ -0,0 +1,209 @@
+"""
+Technology name matching index for TalentScout Hiring Assistant
+Prefix trie, trigram candidate generation and bounded edit distance ranking
+"""
+import threading
+from utils.taxonomy import TechTaxonomy
+
+# Candidates kept from trigram generation before exact distance ranking
+MAX_CANDIDATES = 8
+
+# Trigrams shared by more terms than this carry little signal and are only
+# scanned when the rarer trigrams produce no candidates
+COMMON_GRAM_POSTINGS = 64
+
+# Shortest input that may be completed from a prefix ("kube" -> "Kubernetes")
+MIN_PREFIX_LENGTH = 3
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def trigrams(term):
+    """Padded character trigrams of a lower-case term"""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_distance(term):
+    """Edit budget allowed for a term of this length"""
+    if len(term) <= 3:
+        return 0
+    if len(term) <= 5:
+        return 1
+    return 2
+
+
+def pattern_bits(pattern):
+    """Character -> bitmask of positions, for osa_distance"""
+    bits = {}
+    for i, char in enumerate(pattern):
+        bits[char] = bits.get(char, 0) | (1 << i)
+    return bits
+
+
+def osa_distance(pattern, text, bits=None):
+    """
+    Optimal string alignment distance (transpositions count as one edit)
+
+    Bit-parallel (Hyyro's extension of Myers' algorithm): one pass over
+    text with a handful of integer operations per character.
+
+    Args:
+        pattern: First string
+        text: Second string
+        bits: Precomputed pattern_bits(pattern) when comparing one pattern
+            against many texts
+    """
+    m = len(pattern)
+    if not m:
+        return len(text)
+    if not text:
+        return m
+
+    bits = bits if bits is not None else pattern_bits(pattern)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp, vn, d0, previous_match, score = mask, 0, 0, 0, m
+
+    for char in text:
+        match = bits.get(char, 0)
+        transposition = (((~d0) & match) << 1) & previous_match
+        d0 = ((((match & vp) + vp) ^ vp) | match | vn | transposition) & mask
+        hp = (vn | ~(d0 | vp)) & mask
+        hn = vp & d0
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = (hn | ~(d0 | hp)) & mask
+        vn = hp & d0
+        previous_match = match
+
+    return score
+
+
+class TechMatchIndex:
+    """Typo-tolerant lookup over known technology names"""
+
+    def __init__(self, entries):
+        """
+        Build the index
+
+        Args:
+            entries: Iterable of (match term, display name); aliases may map
+                several terms to the same display name
+        """
+        self.exact = {}
+        self.terms = []
+        self.displays = []
+        self.lengths = []
+        self.trie = {}
+        self.postings = {}
+
+        for term, display in entries:
+            term = term.lower().strip()
+            if not term or term in self.exact:
+                continue
+            term_id = len(self.terms)
+            self.exact[term] = display
+            self.terms.append(term)
+            self.displays.append(display)
+            self.lengths.append(len(term))
+            self._insert_trie(term, term_id)
+            for gram in trigrams(term):
+                self.postings.setdefault(gram, []).append(term_id)
+
+    def _insert_trie(self, term, term_id):
+        """Add a term; every node remembers its shortest completion"""
+        node = self.trie
+        for char in term:
+            node = node.setdefault(char, {})
+            best = node.get('$best')
+            if best is None or len(term) < len(self.terms[best]):
+                node['$best'] = term_id
+
+    def complete(self, prefix):
+        """Get the display name of the shortest known term starting with prefix"""
+        node = self.trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        best = node.get('$best')
+        return self.displays[best] if best is not None else None
+
+    def fuzzy(self, term):
+        """
+        Find the closest known term within the edit budget
+
+        Returns:
+            tuple: (display name, distance) or None
+        """
+        limit = max_distance(term)
+        if limit == 0:
+            return None
+
+        postings = [self.postings[gram] for gram in trigrams(term) if gram in self.postings]
+        rare = [ids for ids in postings if len(ids) <= COMMON_GRAM_POSTINGS]
+
+        shared = {}
+        for ids in (rare or postings):
+            for term_id in ids:
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        # Candidates must be within the edit budget in length
+        lengths = self.lengths
+        size = len(term)
+        candidates = sorted(
+            (term_id for term_id in shared if abs(lengths[term_id] - size) <= limit),
+            key=shared.get, reverse=True
+        )[:MAX_CANDIDATES]
+
+        bits = pattern_bits(term)
+        best = None
+        for term_id in candidates:
+            distance = osa_distance(term, self.terms[term_id], bits)
+            if distance <= limit and (best is None or distance < best[1]):
+                best = (self.displays[term_id], distance)
+                if distance == 1:
+                    break
+        return best
+
+    def suggest(self, text):
+        """
+        Suggest the canonical name for user input
+
+        Returns:
+            str: Display name, or None if the input is already exact or unknown
+        """
+        term = text.lower().strip()
+        if not term or term in self.exact:
+            return None
+
+        if len(term) >= MIN_PREFIX_LENGTH:
+            completion = self.complete(term)
+            if completion:
+                return completion
+
+        match = self.fuzzy(term)
+        return match[0] if match else None
+
+
+def get_index():
+    """Get the index for the current taxonomy, building it once per version"""
+    taxonomy = TechTaxonomy.default()
+    version = taxonomy.version
+    index = _cache.get(version)
+    if index is None:
+        with _cache_lock:
+            index = _cache.get(version)
+            if index is None:
+                # Aliases are indexed too, so "postgres" completes and
+                # "kubernets" corrects to the canonical name
+                index = TechMatchIndex(taxonomy.match_entries())
+                _cache.clear()
+                _cache[version] = index
+    return index
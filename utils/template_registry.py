@@ -0,0 +1,197 @@
+"""
+Template Registry for TalentScout Hiring Assistant
+Loads localized templates once per language and serves precompiled lookups
+"""
+import json
+import os
+import re
+import string
+import threading
+from dataclasses import dataclass
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "resources", "templates")
+DEFAULT_LANGUAGE = "English"
+
+# Placeholders each template key may use; anything else is rejected at load time
+TEMPLATE_SCHEMA = {
+    "info.name": frozenset(),
+    "info.email": frozenset(),
+    "info.phone": frozenset(),
+    "info.experience": frozenset(),
+    "info.position": frozenset(),
+    "info.location": frozenset(),
+    "info.name_greeting_reply": frozenset(),
+    "fallback.greeting": frozenset(),
+    "fallback.closing": frozenset({"name"}),
+    "fallback.question_pattern": frozenset({"tech"}),
+}
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+class TemplateError(ValueError):
+    """Raised when a template resource is missing or malformed"""
+
+
+def estimate_tokens(text):
+    """
+    Estimate LLM token count without a tokenizer
+
+    Words are counted as one token per ~4 characters and every symbol or
+    combining mark as its own token, which tracks BPE tokenizers closely
+    enough for prompt budgeting.
+    """
+    count = 0
+    for piece in _TOKEN_PATTERN.findall(text):
+        count += max(1, (len(piece) + 3) // 4)
+    return count
+
+
+@dataclass(frozen=True)
+class Template:
+    """Immutable, validated template"""
+
+    key: str
+    language: str
+    text: str
+    placeholders: frozenset
+    token_count: int
+
+    def render(self, **values):
+        """
+        Fill placeholders
+
+        Raises:
+            TemplateError: If a placeholder value is missing
+        """
+        if not self.placeholders:
+            return self.text
+        missing = self.placeholders.difference(values)
+        if missing:
+            raise TemplateError(f"Missing values for {self.key}: {', '.join(sorted(missing))}")
+        return self.text.format(**values)
+
+
+def compile_template(key, language, text):
+    """
+    Compile raw text into a Template, validating its placeholders
+
+    Raises:
+        TemplateError: If the key is unknown or the placeholders don't match the schema
+    """
+    schema_key = key.rsplit('.', 1)[0] if key not in TEMPLATE_SCHEMA else key
+    if schema_key not in TEMPLATE_SCHEMA:
+        raise TemplateError(f"Unknown template key '{key}' ({language})")
+
+    try:
+        fields = frozenset(
+            name for _, name, _, _ in string.Formatter().parse(text) if name is not None
+        )
+    except ValueError as e:
+        raise TemplateError(f"Malformed template '{key}' ({language}): {e}")
+
+    if fields != TEMPLATE_SCHEMA[schema_key]:
+        raise TemplateError(
+            f"Template '{key}' ({language}) uses placeholders {sorted(fields)}, "
+            f"expected {sorted(TEMPLATE_SCHEMA[schema_key])}"
+        )
+
+    return Template(key, language, text, fields, estimate_tokens(text))
+
+
+class TemplateRegistry:
+    """Lazily loads per-language template files and serves O(1) lookups"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, template_dir=TEMPLATE_DIR):
+        """
+        Initialize template registry
+
+        Args:
+            template_dir: Directory containing <language>.json resource files
+        """
+        self.template_dir = template_dir
+        self._languages = {}
+        self._groups = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide registry"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _load(self, language):
+        """Load and compile one language file (called once per language)"""
+        path = os.path.join(self.template_dir, f"{language.lower()}.json")
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+
+        templates = {}
+        groups = {}
+        for key, text in raw.get('templates', {}).items():
+            template = compile_template(key, language, text)
+            templates[key] = template
+            prefix, _, suffix = key.rpartition('.')
+            if suffix.isdigit():
+                groups.setdefault(prefix, []).append((int(suffix), template))
+
+        self._groups[language] = {
+            prefix: tuple(t for _, t in sorted(items, key=lambda item: item[0]))
+            for prefix, items in groups.items()
+        }
+        return templates
+
+    def _templates_for(self, language):
+        """Get compiled templates for a language, loading on first use"""
+        templates = self._languages.get(language)
+        if templates is not None:
+            return templates
+
+        with self._lock:
+            if language not in self._languages:
+                self._languages[language] = self._load(language) or {}
+            return self._languages[language]
+
+    def get(self, key, language=DEFAULT_LANGUAGE):
+        """
+        Look up a template, falling back to English
+
+        Returns:
+            Template or None
+        """
+        template = self._templates_for(language).get(key)
+        if template is None and language != DEFAULT_LANGUAGE:
+            template = self._templates_for(DEFAULT_LANGUAGE).get(key)
+        return template
+
+    def render(self, key, language=DEFAULT_LANGUAGE, default=None, **values):
+        """Look up and render a template, returning default if it doesn't exist"""
+        template = self.get(key, language)
+        if template is None:
+            return default
+        return template.render(**values)
+
+    def get_group(self, prefix, language=DEFAULT_LANGUAGE):
+        """Get numbered templates sharing a prefix (e.g. 'fallback.question_pattern')"""
+        self._templates_for(language)
+        group = self._groups.get(language, {}).get(prefix)
+        if not group and language != DEFAULT_LANGUAGE:
+            return self.get_group(prefix, DEFAULT_LANGUAGE)
+        return group or ()
+
+    def token_count(self, key, language=DEFAULT_LANGUAGE):
+        """Get the estimated token count of a template (0 if missing)"""
+        template = self.get(key, language)
+        return template.token_count if template else 0
+
+    def loaded_languages(self):
+        """Get languages loaded so far"""
+        return [language for language, templates in self._languages.items() if templates]
@@ -0,0 +1,118 @@
+"""
+Turn timing for TalentScout Hiring Assistant
+Records per-stage wall times so overlapping work can be inspected,
+and server-side rerun durations per UI interaction
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from config import Config
+
+
+class StageTimer:
+    """Collects (stage, start, end) spans relative to the start of a turn"""
+
+    def __init__(self):
+        """Start the turn clock"""
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block; safe to use from worker threads"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.spans.append((name, start - self.origin, end - self.origin))
+
+    def timed(self, name, fn, *args, **kwargs):
+        """Call fn inside a timed stage and return its result"""
+        with self.stage(name):
+            return fn(*args, **kwargs)
+
+    def get_span(self, name):
+        """Get (start, end) of a stage in seconds, or None"""
+        with self._lock:
+            for stage, start, end in self.spans:
+                if stage == name:
+                    return start, end
+        return None
+
+    def overlap(self, first, second):
+        """Seconds during which two stages ran at the same time"""
+        a = self.get_span(first)
+        b = self.get_span(second)
+        if not a or not b:
+            return 0.0
+        return max(0.0, min(a[1], b[1]) - max(a[0], b[0]))
+
+    def report(self):
+        """
+        Get timings in milliseconds
+
+        Returns:
+            list: Dicts with stage, start_ms, end_ms and duration_ms, in start order
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span[1])
+        return [
+            {
+                'stage': stage,
+                'start_ms': round(start * 1000, 2),
+                'end_ms': round(end * 1000, 2),
+                'duration_ms': round((end - start) * 1000, 2)
+            }
+            for stage, start, end in spans
+        ]
+
+
+class RerunMeter:
+    """Rolling server-side durations of full app reruns and fragment reruns"""
+
+    def __init__(self, window=None):
+        """
+        Initialize meter
+
+        Args:
+            window: Samples kept per kind (defaults to Config.RERUN_METER_WINDOW)
+        """
+        self.window = window or Config.RERUN_METER_WINDOW
+        self._samples = {}
+
+    @contextmanager
+    def measure(self, kind):
+        """Time one rerun of the given kind ('app', 'chat', ...)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(kind, time.perf_counter() - start)
+
+    def record(self, kind, seconds):
+        """Add a sample in seconds"""
+        if kind not in self._samples:
+            self._samples[kind] = deque(maxlen=self.window)
+        self._samples[kind].append(seconds)
+
+    def summary(self):
+        """
+        Get rerun timings in milliseconds
+
+        Returns:
+            dict: kind -> {'count', 'last_ms', 'avg_ms', 'p95_ms'}
+        """
+        summary = {}
+        for kind, samples in self._samples.items():
+            ordered = sorted(samples)
+            summary[kind] = {
+                'count': len(samples),
+                'last_ms': round(samples[-1] * 1000, 1),
+                'avg_ms': round(sum(samples) / len(samples) * 1000, 1),
+                'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1)
+            }
+        return summary
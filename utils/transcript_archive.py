@@ -0,0 +1,420 @@
+"""
+Transcript archive for TalentScout Hiring Assistant
+Dictionary-compressed transcript storage with an index for random access
+
+Transcripts repeat the same banners, assistant prompts and localized
+info-gathering questions, so each one is compressed on its own against a
+dictionary trained on our transcripts (zstd when the zstandard package is
+installed, otherwise zlib with a preset dictionary). Frames are appended
+to one data file; a SQLite index maps every transcript (by candidate name,
+email or interview id) to its frame, so reading one never touches the others.
+
+Move the existing data/transcript_*.txt files into the archive with
+    python -m utils.transcript_archive --migrate [--remove]
+and read them back with --find NAME / --show ID.
+"""
+import argparse
+import glob
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime
+from config import Config
+
+_FILENAME = re.compile(r'transcript_(?P<name>.+)_(?P<stamp>\d{8}_\d{6})\.txt$')
+_HEADER_FIELD = re.compile(r'^(NAME|EMAIL|INTERVIEW_ID): (.*)$', re.MULTILINE)
+
+
+def _zstandard():
+    """The zstandard module, or None when it isn't installed"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def build_line_dictionary(samples, size):
+    """
+    Raw dictionary of the lines that repeat across transcripts
+
+    Lines are ranked by the bytes they would save (length x documents
+    containing them) and the best are placed last, where deflate and zstd
+    reach them with the shortest distances.
+
+    Args:
+        samples: Transcript texts
+        size: Dictionary size in bytes
+
+    Returns:
+        bytes: Dictionary content
+    """
+    documents = Counter()
+    for text in samples:
+        documents.update(set(line for line in text.split('\n') if len(line) > 3))
+    ranked = sorted((line for line, count in documents.items() if count > 1),
+                    key=lambda line: len(line.encode('utf-8')) * documents[line])
+    chosen = []
+    total = 0
+    for line in reversed(ranked):
+        encoded = (line + '\n').encode('utf-8')
+        if total + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        total += len(encoded)
+    return b''.join(reversed(chosen))
+
+
+class Codec:
+    """Compression with one dictionary: 'zstd' or 'zlib' (raw deflate with a preset dictionary)"""
+
+    def __init__(self, name, dictionary, level=None):
+        self.name = name
+        self.dictionary = dictionary
+        if name == 'zstd':
+            zstandard = _zstandard()
+            if zstandard is None:
+                raise RuntimeError("This archive was written with zstd; install the zstandard package to read it")
+            self.level = level or Config.TRANSCRIPT_ARCHIVE_ZSTD_LEVEL
+            data = zstandard.ZstdCompressionDict(dictionary)
+            self._compressor = zstandard.ZstdCompressor(level=self.level, dict_data=data)
+            self._decompressor = zstandard.ZstdDecompressor(dict_data=data)
+        else:
+            self.level = level or Config.TRANSCRIPT_ARCHIVE_ZLIB_LEVEL
+
+    @classmethod
+    def train(cls, samples, size=None, codec=None):
+        """
+        Build a codec with a dictionary trained on sample transcripts
+
+        Args:
+            samples: Transcript texts
+            size: Dictionary size (zlib can use at most 32 KB)
+            codec: 'zstd', 'zlib' or None for zstd when available
+
+        Returns:
+            Codec
+        """
+        zstandard = _zstandard()
+        name = codec or ('zstd' if zstandard is not None else 'zlib')
+        size = size or Config.TRANSCRIPT_DICT_SIZE
+        if name == 'zlib':
+            return cls(name, build_line_dictionary(samples, min(size, 32 * 1024)))
+        try:
+            dictionary = zstandard.train_dictionary(size, [text.encode('utf-8') for text in samples]).as_bytes()
+        except zstandard.ZstdError:
+            # Too few samples to train on; a raw-content dictionary still captures the boilerplate
+            dictionary = build_line_dictionary(samples, size)
+        return cls(name, dictionary)
+
+    def compress(self, data):
+        if self.name == 'zstd':
+            return self._compressor.compress(data)
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=self.dictionary)
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, frame):
+        if self.name == 'zstd':
+            return self._decompressor.decompress(frame)
+        decompressor = zlib.decompressobj(-15, zdict=self.dictionary)
+        return decompressor.decompress(frame) + decompressor.flush()
+
+
+def parse_transcript(text, filename=None):
+    """
+    Index fields of a rendered transcript
+
+    Returns:
+        dict: name, email, interview_id and created (timestamp from the file name, if any)
+    """
+    header = text.split('CONVERSATION TRANSCRIPT:', 1)[0]
+    fields = {key.lower(): value.strip() for key, value in _HEADER_FIELD.findall(header)}
+    created = None
+    match = _FILENAME.search(os.path.basename(filename or ''))
+    if match:
+        created = datetime.strptime(match.group('stamp'), "%Y%m%d_%H%M%S").timestamp()
+        fields.setdefault('name', match.group('name').replace('_', ' '))
+    return {
+        'name': fields.get('name'),
+        'email': fields.get('email'),
+        'interview_id': fields.get('interview_id'),
+        'created': created
+    }
+
+
+class TranscriptArchive:
+    """Append-only frame file plus a SQLite index and dictionary table"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None, index_path=None):
+        """
+        Initialize archive
+
+        Args:
+            path: Frame data file (defaults to Config.TRANSCRIPT_ARCHIVE_PATH)
+            index_path: Index database (defaults to Config.TRANSCRIPT_ARCHIVE_INDEX)
+        """
+        self.path = path or Config.TRANSCRIPT_ARCHIVE_PATH
+        self.index_path = index_path or Config.TRANSCRIPT_ARCHIVE_INDEX
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._codecs = {}  # dictionary id -> Codec
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS dictionaries ("
+                         "id INTEGER PRIMARY KEY, codec TEXT, content BLOB, created REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS transcripts ("
+                         "id INTEGER PRIMARY KEY, name TEXT, email TEXT, interview_id TEXT, "
+                         "source TEXT UNIQUE, created REAL, dictionary INTEGER, "
+                         "offset INTEGER, length INTEGER, size INTEGER)")
+            conn.execute("CREATE INDEX IF NOT EXISTS transcripts_name ON transcripts (name COLLATE NOCASE)")
+            conn.execute("CREATE INDEX IF NOT EXISTS transcripts_email ON transcripts (email COLLATE NOCASE)")
+            conn.execute("CREATE INDEX IF NOT EXISTS transcripts_interview ON transcripts (interview_id)")
+
+    @classmethod
+    def default(cls):
+        """Get the shared archive"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _connection(self):
+        """One connection per thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    # Dictionaries
+
+    def train(self, samples, codec=None):
+        """
+        Train a dictionary on sample transcripts; new transcripts use it
+
+        Transcripts already archived keep the dictionary they were written with.
+
+        Returns:
+            int: Dictionary id
+        """
+        trained = Codec.train(samples, codec=codec)
+        with self._connection() as conn:
+            cursor = conn.execute("INSERT INTO dictionaries (codec, content, created) VALUES (?, ?, ?)",
+                                  (trained.name, trained.dictionary, time.time()))
+        self._codecs[cursor.lastrowid] = trained
+        return cursor.lastrowid
+
+    def current_dictionary(self):
+        """Id of the newest dictionary, or None before the first training"""
+        row = self._connection().execute("SELECT MAX(id) FROM dictionaries").fetchone()
+        return row[0]
+
+    def _codec(self, dictionary_id):
+        codec = self._codecs.get(dictionary_id)
+        if codec is None:
+            row = self._connection().execute(
+                "SELECT codec, content FROM dictionaries WHERE id = ?", (dictionary_id,)).fetchone()
+            codec = self._codecs[dictionary_id] = Codec(row['codec'], row['content'])
+        return codec
+
+    # Writing and reading
+
+    def add(self, text, source=None, name=None, email=None, interview_id=None, created=None):
+        """
+        Archive one transcript
+
+        Args:
+            text: Rendered transcript
+            source: Original file (transcripts are archived once per source)
+            name, email, interview_id: Index fields (read from the header if omitted)
+            created: Timestamp (defaults to now)
+
+        Returns:
+            int: Transcript id (the existing id if the source was archived before)
+        """
+        conn = self._connection()
+        if source is not None:
+            row = conn.execute("SELECT id FROM transcripts WHERE source = ?", (source,)).fetchone()
+            if row:
+                return row['id']
+        fields = parse_transcript(text, source)
+        dictionary_id = self.current_dictionary()
+        if dictionary_id is None:
+            dictionary_id = self.train([text])
+
+        raw = text.encode('utf-8')
+        frame = self._codec(dictionary_id).compress(raw)
+        with self._write_lock:
+            with open(self.path, 'ab') as f:
+                offset = f.tell()
+                f.write(frame)
+                f.flush()
+                os.fsync(f.fileno())
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO transcripts (name, email, interview_id, source, created, dictionary, "
+                    "offset, length, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (name or fields['name'], email or fields['email'], interview_id or fields['interview_id'],
+                     source, created or fields['created'] or time.time(), dictionary_id,
+                     offset, len(frame), len(raw)))
+        return cursor.lastrowid
+
+    def get(self, transcript_id):
+        """
+        Read one transcript
+
+        Returns:
+            str: Transcript text, or None if unknown
+        """
+        row = self._connection().execute(
+            "SELECT dictionary, offset, length FROM transcripts WHERE id = ?", (transcript_id,)).fetchone()
+        if row is None:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(row['offset'])
+            frame = f.read(row['length'])
+        return self._codec(row['dictionary']).decompress(frame).decode('utf-8')
+
+    def find(self, name=None, email=None, interview_id=None):
+        """
+        Look up transcripts by candidate (case-insensitive, exact match)
+
+        Returns:
+            list: Index rows as dicts, newest first
+        """
+        clauses, params = [], []
+        for column, value in (('name', name), ('email', email), ('interview_id', interview_id)):
+            if value:
+                clauses.append(f"{column} = ?" + (" COLLATE NOCASE" if column != 'interview_id' else ""))
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection().execute(
+            f"SELECT id, name, email, interview_id, source, created, size, length FROM transcripts {where} "
+            "ORDER BY created DESC", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self):
+        """
+        Archive size summary
+
+        Returns:
+            dict: transcripts, original and stored bytes (dictionaries included) and ratio
+        """
+        conn = self._connection()
+        count, size, stored = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(length), 0) FROM transcripts").fetchone()
+        dictionaries = conn.execute("SELECT COALESCE(SUM(LENGTH(content)), 0) FROM dictionaries").fetchone()[0]
+        stored += dictionaries
+        return {
+            'transcripts': count,
+            'original_bytes': size,
+            'stored_bytes': stored,
+            'ratio': round(size / stored, 2) if stored else None
+        }
+
+
+def migrate(archive, directory=None, remove=False, sample_size=None):
+    """
+    Move transcript_*.txt files into the archive
+
+    The first migration trains the dictionary on (a sample of) the files
+    being migrated. Each file is read back from the archive and compared
+    before it is removed.
+
+    Args:
+        archive: TranscriptArchive
+        directory: Directory holding the .txt files (defaults to the data directory)
+        remove: Delete each file once it is verified in the archive
+        sample_size: Files used to train the dictionary
+
+    Returns:
+        dict: Files found, archived, already archived, removed and failed
+    """
+    directory = directory or os.path.dirname(Config.DATA_FILE)
+    paths = sorted(glob.glob(os.path.join(directory, 'transcript_*.txt')))
+    report = {'files': len(paths), 'archived': 0, 'skipped': 0, 'removed': 0, 'failed': 0}
+    if not paths:
+        return report
+
+    if archive.current_dictionary() is None:
+        sample = paths[::max(1, len(paths) // (sample_size or Config.TRANSCRIPT_DICT_SAMPLES))]
+        texts = []
+        for path in sample:
+            with open(path, 'r', encoding='utf-8') as f:
+                texts.append(f.read())
+        archive.train(texts)
+
+    known = {row['source'] for row in archive.find()}
+    for path in paths:
+        source = os.path.abspath(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            # Returns the existing id for a file archived by an earlier run
+            transcript_id = archive.add(text, source=source)
+            report['skipped' if source in known else 'archived'] += 1
+            if remove:
+                if archive.get(transcript_id) != text:
+                    raise IOError("archived copy differs")
+                os.remove(path)
+                report['removed'] += 1
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Could not archive {path}: {str(e)}")
+            report['failed'] += 1
+    return report
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Compressed transcript archive")
+    parser.add_argument('--migrate', action='store_true', help="archive data/transcript_*.txt files")
+    parser.add_argument('--directory', help="directory to migrate from (default: data/)")
+    parser.add_argument('--remove', action='store_true', help="delete migrated files after verifying them")
+    parser.add_argument('--retrain', action='store_true', help="train a new dictionary on the archive's newest transcripts")
+    parser.add_argument('--find', metavar='NAME', help="list transcripts of a candidate")
+    parser.add_argument('--email', help="list transcripts for an email address")
+    parser.add_argument('--show', type=int, metavar='ID', help="print one transcript")
+    args = parser.parse_args(argv)
+
+    archive = TranscriptArchive.default()
+    if args.migrate:
+        report = migrate(archive, args.directory, args.remove)
+        print(f"{report['files']} files: {report['archived']} archived, {report['skipped']} already archived, "
+              f"{report['removed']} removed, {report['failed']} failed")
+    if args.retrain:
+        rows = archive.find()[:Config.TRANSCRIPT_DICT_SAMPLES]
+        if rows:
+            dictionary_id = archive.train([archive.get(row['id']) for row in rows])
+            print(f"Trained dictionary {dictionary_id} on {len(rows)} transcripts")
+    if args.find or args.email:
+        for row in archive.find(name=args.find, email=args.email):
+            created = datetime.fromtimestamp(row['created']).strftime('%Y-%m-%d %H:%M')
+            print(f"{row['id']:6}  {created}  {row['name'] or '-':24} {row['email'] or '-'}")
+    if args.show is not None:
+        text = archive.get(args.show)
+        if text is None:
+            print(f"No transcript {args.show}")
+            return 1
+        print(text, end='')
+
+    stats = archive.stats()
+    if stats['transcripts']:
+        print(f"Archive: {stats['transcripts']} transcripts, {stats['original_bytes']} -> "
+              f"{stats['stored_bytes']} bytes ({stats['ratio']}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,405 @@
+"""
+Transcript journal for TalentScout Hiring Assistant
+Write-ahead log of every interview turn, rendered into readable transcripts on demand
+
+Each turn is buffered in memory and appended to data/transcripts/<session>.jsonl
+by a background flusher every TRANSCRIPT_FLUSH_INTERVAL seconds (or sooner
+when a session buffers TRANSCRIPT_FLUSH_RECORDS turns), so nothing is
+written on the turn path and a crash loses at most the last interval.
+Journals of closed or long-idle interviews are merged into segment files
+(one JSON line per interview) so the directory doesn't grow a file per
+session. Readable transcripts are produced only when asked for:
+    python -m utils.transcript_journal --list
+    python -m utils.transcript_journal --render SESSION_ID [--output FILE]
+"""
+import argparse
+import atexit
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from config import Config
+from utils.data_handler import ConversationExporter
+
+JOURNAL_SUFFIX = '.jsonl'
+SEGMENT_PREFIX = 'segment_'
+
+
+class TranscriptJournal:
+    """Per-session turn journals with buffered writes and background merging into segments"""
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, directory=None, flush_interval=None, flush_records=None,
+                 merge_interval=None, merge_idle=None, segment_bytes=None, background=True):
+        """
+        Initialize journal
+
+        Args:
+            directory: Journal directory (defaults to Config.TRANSCRIPT_JOURNAL_DIR)
+            flush_interval: Seconds between background flushes
+            flush_records: Buffered turns per session that trigger a flush
+            merge_interval: Seconds between background merges
+            merge_idle: Seconds without writes after which an unclosed journal is merged
+            segment_bytes: Size at which a new segment file is started
+            background: Start the flusher thread (tests and commands flush explicitly)
+        """
+        self.directory = directory or Config.TRANSCRIPT_JOURNAL_DIR
+        self.segment_dir = os.path.join(self.directory, 'segments')
+        self.flush_interval = flush_interval or Config.TRANSCRIPT_FLUSH_INTERVAL
+        self.flush_records = flush_records or Config.TRANSCRIPT_FLUSH_RECORDS
+        self.merge_interval = merge_interval or Config.TRANSCRIPT_MERGE_INTERVAL
+        self.merge_idle = merge_idle or Config.TRANSCRIPT_MERGE_IDLE
+        self.segment_bytes = segment_bytes or Config.TRANSCRIPT_SEGMENT_BYTES
+        os.makedirs(self.segment_dir, exist_ok=True)
+
+        self._buffers = {}  # session id -> encoded lines not yet written
+        self._buffer_lock = threading.Lock()
+        self._io_lock = threading.RLock()
+        self._segments = {}  # session id -> (segment path, offset, length)
+        self._scanned = {}  # segment path -> bytes already indexed
+        self._opened = set()  # Journals written to by this process
+        self._scan_segments()
+
+        self._wake = threading.Event()
+        self._stopping = False
+        self._flusher = None
+        if background:
+            self._flusher = threading.Thread(target=self._run, name="transcript-flush", daemon=True)
+            self._flusher.start()
+            atexit.register(self.stop, 1)
+
+    @classmethod
+    def default(cls):
+        """Get the shared journal (one flusher per process)"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _path(self, session_id):
+        if not session_id or not session_id.replace('-', '').replace('_', '').isalnum():
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        return os.path.join(self.directory, session_id + JOURNAL_SUFFIX)
+
+    # Writing (turn path: memory only)
+
+    def append(self, session_id, role, content):
+        """Record one message"""
+        self._buffer(session_id, {'r': role, 'c': content, 't': round(time.time(), 3)})
+
+    def note_candidate(self, session_id, candidate_data):
+        """Record the candidate information collected so far (the latest record wins)"""
+        self._buffer(session_id, {'candidate': candidate_data})
+
+    def close(self, session_id, candidate_data=None):
+        """Mark an interview finished; its journal becomes eligible for merging"""
+        if candidate_data is not None:
+            self.note_candidate(session_id, candidate_data)
+        self._buffer(session_id, {'closed': round(time.time(), 3)})
+
+    def _buffer(self, session_id, record):
+        self._path(session_id)
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with self._buffer_lock:
+            lines = self._buffers.setdefault(session_id, [])
+            lines.append(line)
+            full = len(lines) >= self.flush_records
+        if full:
+            self._wake.set()
+
+    def flush(self, session_id=None):
+        """Write buffered records to the journal files (one session, or all)"""
+        # Taken under the I/O lock so concurrent flushes keep each session's lines in order
+        with self._io_lock:
+            with self._buffer_lock:
+                if session_id is None:
+                    buffers, self._buffers = self._buffers, {}
+                else:
+                    buffers = {session_id: self._buffers.pop(session_id)} if session_id in self._buffers else {}
+            for sid, lines in buffers.items():
+                try:
+                    path = self._path(sid)
+                    if sid not in self._opened:
+                        # A journal left by a crash may end in a torn line; don't glue onto it
+                        if self._ends_torn(path):
+                            lines = ['\n'] + lines
+                        self._opened.add(sid)
+                    with open(path, 'a', encoding='utf-8') as f:
+                        f.write(''.join(lines))
+                        f.flush()
+                        os.fsync(f.fileno())
+                except OSError as e:
+                    print(f"Error writing transcript journal {sid}: {str(e)}")
+                    with self._buffer_lock:
+                        self._buffers[sid] = lines + self._buffers.get(sid, [])
+
+    @staticmethod
+    def _ends_torn(path):
+        try:
+            with open(path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b'\n'
+        except FileNotFoundError:
+            return False
+
+    # Reading and rendering (on demand)
+
+    def read(self, session_id):
+        """
+        Everything recorded for an interview
+
+        Returns:
+            dict: candidate, messages (role/content dicts) and closed flag, or None if unknown
+        """
+        try:
+            self._path(session_id)
+        except ValueError:
+            return None
+        self.flush(session_id)
+        with self._io_lock:
+            record = self._load_record(session_id)
+        if record is None:
+            return None
+        return {
+            'session_id': session_id,
+            'candidate': record['candidate'],
+            'messages': [{'role': role, 'content': content} for role, content, _ in record['messages']],
+            'closed': record['closed'] is not None
+        }
+
+    def render(self, session_id):
+        """
+        Readable transcript of an interview (same format as ConversationExporter)
+
+        Returns:
+            str: Transcript text, or None if the interview is unknown
+        """
+        data = self.read(session_id)
+        if data is None:
+            return None
+        return ConversationExporter.render_transcript(data['messages'], data['candidate'])
+
+    def export(self, session_id, filename=None):
+        """
+        Write the readable transcript to a file
+
+        Returns:
+            str: Filename, or None if the interview is unknown or the write failed
+        """
+        data = self.read(session_id)
+        if data is None:
+            return None
+        return ConversationExporter.export_conversation(data['messages'], data['candidate'], filename)
+
+    def sessions(self):
+        """Session ids with a journal or a merged record"""
+        self.flush()
+        self._scan_segments()
+        with self._io_lock:
+            journals = [os.path.basename(p)[:-len(JOURNAL_SUFFIX)]
+                        for p in glob.glob(os.path.join(self.directory, '*' + JOURNAL_SUFFIX))]
+            return sorted(set(journals) | set(self._segments))
+
+    # Segments
+
+    def _segment_paths(self):
+        return sorted(glob.glob(os.path.join(self.segment_dir, SEGMENT_PREFIX + '*' + JOURNAL_SUFFIX)))
+
+    def _scan_segments(self):
+        """
+        Index records appended to the segment files since the last scan
+
+        Other processes sharing the directory merge into the same
+        segments, so this runs again whenever a session isn't indexed.
+        """
+        with self._io_lock:
+            for path in self._segment_paths():
+                offset = self._scanned.get(path, 0)
+                with open(path, 'rb') as f:
+                    f.seek(offset)
+                    for line in f:
+                        if not line.endswith(b'\n'):
+                            # Still being written by another process; read it next time
+                            break
+                        try:
+                            self._segments[json.loads(line)['session']] = (path, offset, len(line))
+                        except (ValueError, KeyError):
+                            # Torn record from a crash mid-merge; its journal was kept
+                            pass
+                        offset += len(line)
+                self._scanned[path] = offset
+
+    def _read_segment(self, session_id):
+        location = self._segments.get(session_id)
+        if location is None:
+            self._scan_segments()
+            location = self._segments.get(session_id)
+        if location is None:
+            return None
+        path, offset, length = location
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def _current_segment(self):
+        paths = self._segment_paths()
+        if paths and os.path.getsize(paths[-1]) < self.segment_bytes:
+            return paths[-1]
+        number = int(os.path.basename(paths[-1])[len(SEGMENT_PREFIX):-len(JOURNAL_SUFFIX)]) + 1 if paths else 1
+        return os.path.join(self.segment_dir, f"{SEGMENT_PREFIX}{number:06d}{JOURNAL_SUFFIX}")
+
+    def merge(self, force=False):
+        """
+        Roll closed (or idle) journals into the current segment file
+
+        A journal is deleted only after its record is durably in a
+        segment; if the process dies in between, the next merge writes the
+        record again and the later copy wins. A journal that another
+        process merges and removes during the pass is skipped.
+
+        Args:
+            force: Merge every journal, closed or not
+
+        Returns:
+            int: Journals merged
+        """
+        self.flush()
+        merged = 0
+        now = time.time()
+        with self._io_lock:
+            with self._buffer_lock:
+                active = set(self._buffers)
+            for path in glob.glob(os.path.join(self.directory, '*' + JOURNAL_SUFFIX)):
+                session_id = os.path.basename(path)[:-len(JOURNAL_SUFFIX)]
+                if session_id in active:
+                    continue
+                try:
+                    idle = now - os.path.getmtime(path) > self.merge_idle
+                except FileNotFoundError:
+                    continue
+                data = self._load_record(session_id)
+                if data is None or not os.path.exists(path):
+                    # Merged by another process meanwhile
+                    continue
+                if not (force or data['closed'] is not None or idle):
+                    continue
+                segment = self._current_segment()
+                line = (json.dumps(data, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+                with open(segment, 'ab') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    # Taken after the write: other processes may append to the same segment
+                    offset = f.tell() - len(line)
+                self._segments[session_id] = (segment, offset, len(line))
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    # Another process merged it too; either copy is complete
+                    pass
+                self._opened.discard(session_id)
+                merged += 1
+        return merged
+
+    def _load_record(self, session_id):
+        """
+        Segment record of a session: its merged part (if any) plus its journal
+
+        Returns:
+            dict: session, candidate, messages as [role, content, time] and closed time, or None if unknown
+        """
+        record = self._read_segment(session_id)
+        try:
+            with open(self._path(session_id), 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return record
+
+        record = record or {'session': session_id, 'candidate': {}, 'messages': [], 'closed': None}
+        messages = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Torn last line from a crash mid-write
+                continue
+            if 'r' in entry:
+                messages.append([entry['r'], entry['c'], entry.get('t')])
+            elif 'candidate' in entry:
+                record['candidate'] = entry['candidate']
+            elif 'closed' in entry:
+                record['closed'] = entry['closed']
+        # The segment already ends with this journal when it was merged but
+        # not yet removed (by another process, or before a crash)
+        if messages and record['messages'][-len(messages):] != messages:
+            record['messages'].extend(messages)
+        return record
+
+    # Background work
+
+    def _run(self):
+        """Flush on an interval (or when a buffer fills) and merge now and then"""
+        next_merge = time.monotonic() + self.merge_interval
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+                if time.monotonic() >= next_merge:
+                    next_merge = time.monotonic() + self.merge_interval
+                    self.merge()
+            except Exception as e:
+                print(f"Transcript journal error: {str(e)}")
+
+    def stop(self, timeout=None):
+        """Stop the flusher after writing everything buffered"""
+        self._stopping = True
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout)
+        self.flush()
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Read and maintain interview transcript journals")
+    parser.add_argument('--list', action='store_true', help="list recorded interviews")
+    parser.add_argument('--render', metavar='SESSION_ID', help="print (or write) a readable transcript")
+    parser.add_argument('--output', help="file to write the rendered transcript to")
+    parser.add_argument('--merge', action='store_true', help="merge all journals into segments now")
+    parser.add_argument('--directory', help="journal directory (default: Config.TRANSCRIPT_JOURNAL_DIR)")
+    args = parser.parse_args(argv)
+
+    journal = TranscriptJournal(args.directory, background=False)
+    if args.merge:
+        print(f"Merged {journal.merge(force=True)} journals")
+    if args.list:
+        for session_id in journal.sessions():
+            data = journal.read(session_id)
+            print(f"{session_id}  {data['candidate'].get('name', '-'):24} "
+                  f"{len(data['messages']):3} messages  {'closed' if data['closed'] else 'open'}")
+    if args.render:
+        if args.output:
+            filename = journal.export(args.render, args.output)
+            if filename is None:
+                print(f"No transcript for {args.render}")
+                return 1
+            print(f"Wrote {filename}")
+        else:
+            text = journal.render(args.render)
+            if text is None:
+                print(f"No transcript for {args.render}")
+                return 1
+            print(text, end='')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
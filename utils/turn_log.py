@@ -0,0 +1,123 @@
+"""
+Turn log for TalentScout Hiring Assistant
+One compact record per message, shared by the transcript, LLM context and snapshots
+"""
+
+
+class Turn:
+    """One message of an interview (readable like the old {'role', 'content'} dicts)"""
+
+    __slots__ = ('role', 'content', 'in_context')
+
+    def __init__(self, role, content, in_context=True):
+        self.role = role
+        self.content = content
+        self.in_context = in_context  # Sent to the LLM as conversation context
+
+    def __getitem__(self, key):
+        if key == 'role':
+            return self.role
+        if key == 'content':
+            return self.content
+        raise KeyError(key)
+
+    def to_dict(self):
+        """Chat-API message dict"""
+        return {'role': self.role, 'content': self.content}
+
+    def __repr__(self):
+        return f"Turn({self.role!r}, {self.content[:30]!r})"
+
+
+class TurnLog:
+    """
+    Append-only list of turns with views for each consumer
+
+    The transcript, the trimmed LLM context and the persisted snapshot
+    used to be separate lists of dicts; they are now views over this log,
+    so each message is held once per session.
+    """
+
+    __slots__ = ('_turns',)
+
+    def __init__(self, turns=None):
+        self._turns = list(turns or [])
+
+    def append(self, role, content, in_context=True):
+        """
+        Record a message
+
+        Args:
+            role: 'user' or 'assistant'
+            content: Message text
+            in_context: Whether the message is part of the LLM context
+
+        Returns:
+            Turn: The new record
+        """
+        turn = Turn(role, content, in_context)
+        self._turns.append(turn)
+        return turn
+
+    # UI view: the log is a read-only sequence of turns
+
+    def __len__(self):
+        return len(self._turns)
+
+    def __iter__(self):
+        return iter(self._turns)
+
+    def __getitem__(self, index):
+        return self._turns[index]
+
+    # LLM view
+
+    def api_context(self, max_length):
+        """
+        Most recent context messages as chat-API dicts, oldest first
+
+        Args:
+            max_length: Messages kept (Config.MAX_CONTEXT_LENGTH)
+        """
+        context = []
+        for turn in reversed(self._turns):
+            if len(context) >= max_length:
+                break
+            if turn.in_context:
+                context.append(turn.to_dict())
+        context.reverse()
+        return context
+
+    # Client and export view
+
+    def messages(self):
+        """Whole transcript as chat-API dicts (built on demand)"""
+        return [turn.to_dict() for turn in self._turns]
+
+    # Persistence view
+
+    def to_list(self):
+        """Serialize to compact JSON-safe rows: [role, content, in_context]"""
+        return [[turn.role, turn.content, int(turn.in_context)] for turn in self._turns]
+
+    @classmethod
+    def from_list(cls, rows):
+        """Rebuild a log saved with to_list"""
+        return cls(Turn(role, content, bool(in_context)) for role, content, in_context in rows)
+
+    @classmethod
+    def from_messages(cls, messages, context=()):
+        """
+        Rebuild a log from a transcript and LLM context saved as separate dict lists
+
+        Messages in the context tail are matched to the end of the transcript.
+        """
+        log = cls(Turn(m['role'], m['content'], False) for m in messages)
+        remaining = [(m['role'], m['content']) for m in context]
+        for turn in reversed(log._turns):
+            if not remaining:
+                break
+            if (turn.role, turn.content) == remaining[-1]:
+                turn.in_context = True
+                remaining.pop()
+        return log
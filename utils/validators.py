@@ -3,7 +3,23 @@ Input Validators for TalentScout Hiring Assistant
 Validates user inputs for data quality
 """
 import re
-from config import Config
+from utils.preprocessing import analyze_message
+from utils.tech_index import get_index
+from utils.taxonomy import TechTaxonomy
+
+# Patterns are compiled once at import; the bulk importer reuses them
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_FORMATTING = re.compile(r'[\s\-\(\)\+]')
+NAME_PATTERN = re.compile(r"^[a-zA-Z\s\-'\.]+$")
+TECH_SEPARATORS = re.compile(r'[,;/\n]+')
+UNSAFE_CHARACTERS = re.compile(r'[<>{}\\]')
+
+# Inputs rejected as names ("Hi", "Hello", ...)
+COMMON_GREETINGS = frozenset({
+    'hi', 'hello', 'hey', 'greetings', 'good morning', 
+    'good afternoon', 'good evening', 'yo', 'sup', 'hola', 
+    'namaste', 'bonjour', 'hallo', 'hii', 'heyy'
+})
 
 class InputValidator:
     """Validates various types of user inputs"""
@@ -25,9 +41,7 @@ class InputValidator:
         email = email.strip()
         
         # Basic email regex pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(pattern, email):
+        if not EMAIL_PATTERN.match(email):
             return False, "Please enter a valid email format (e.g., name@example.com)"
         
         # Additional checks
@@ -56,7 +70,7 @@ class InputValidator:
         phone = phone.strip()
         
         # Remove common formatting characters
-        cleaned = re.sub(r'[\s\-\(\)\+]', '', phone)
+        cleaned = PHONE_FORMATTING.sub('', phone)
         
         # Check if it contains only digits (after removing formatting)
         if not cleaned.isdigit():
@@ -82,16 +96,14 @@ class InputValidator:
         if not experience:
             return False, None, "Years of experience cannot be empty"
         
-        experience_str = str(experience).strip()
-        
-        # Try to extract number from string
-        numbers = re.findall(r'\d+\.?\d*', experience_str)
+        # Numbers were already extracted when the message was preprocessed
+        numbers = analyze_message(str(experience)).numbers
         
         if not numbers:
             return False, None, "Please enter a valid number of years (e.g., 3 or 3.5)"
         
         try:
-            years = float(numbers[0])
+            years = numbers[0][1]
             
             if years < 0:
                 return False, None, "Years of experience cannot be negative"
@@ -122,14 +134,8 @@ class InputValidator:
         
         # --- NEW: Check for common greetings ---
         # This prevents the bot from accepting "Hi", "Hello", etc. as a name
-        common_greetings = {
-            'hi', 'hello', 'hey', 'greetings', 'good morning', 
-            'good afternoon', 'good evening', 'yo', 'sup', 'hola', 
-            'namaste', 'bonjour', 'hallo', 'hii', 'heyy'
-        }
-        
         # Check if the input is JUST a greeting (case insensitive)
-        if name.lower() in common_greetings:
+        if name.lower() in COMMON_GREETINGS:
             return False, "Please provide your full name, not just a greeting."
         
         # Also check if it looks like "Hi I am..." but is too short to be a full sentence
@@ -144,7 +150,7 @@ class InputValidator:
             return False, "Name is too long"
         
         # Check for reasonable characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r"^[a-zA-Z\s\-'\.]+$", name):
+        if not NAME_PATTERN.match(name):
             return False, "Name should contain only letters, spaces, hyphens, and apostrophes"
         
         return True, None
@@ -158,26 +164,32 @@ class InputValidator:
             tech_stack: Tech stack string
             
         Returns:
-            tuple: (is_valid, cleaned_list, suggestions, error_message)
+            tuple: (is_valid, cleaned_list, suggestions, error_message);
+                known technologies in cleaned_list use their canonical names
         """
         if not tech_stack or len(tech_stack.strip()) == 0:
             return False, [], [], "Tech stack cannot be empty. Please list your technologies."
         
         # Split by common separators
-        technologies = re.split(r'[,;/\n]+', tech_stack)
+        technologies = TECH_SEPARATORS.split(tech_stack)
         
         # Clean and filter
-        cleaned = []
+        raw = []
         for tech in technologies:
             tech = tech.strip()
             if tech and len(tech) > 1:
-                cleaned.append(tech)
+                raw.append(tech)
         
-        if not cleaned:
+        if not raw:
             return False, [], [], "Please enter at least one technology"
         
-        # Get suggestions for typos or matches
-        suggestions = InputValidator._get_tech_suggestions(cleaned)
+        # Resolve aliases ("reactjs" -> "React") and drop duplicates
+        taxonomy = TechTaxonomy.default()
+        cleaned = taxonomy.canonicalize_list(raw)
+        
+        # Get suggestions for typos in names the taxonomy doesn't know
+        unknown = [tech for tech in cleaned if not taxonomy.is_known(tech)]
+        suggestions = InputValidator._get_tech_suggestions(unknown)
         
         return True, cleaned, suggestions, None
     
@@ -186,23 +198,17 @@ class InputValidator:
         """Get suggestions for technology names"""
         suggestions = []
         
-        # Flatten all tech categories
-        all_known_tech = []
-        for category in Config.TECH_CATEGORIES.values():
-            all_known_tech.extend([t.lower() for t in category])
+        # Prebuilt once per taxonomy version: prefix trie, trigram
+        # candidates and bounded edit distance for typos ("Pyhton")
+        index = get_index()
         
         for tech in tech_list:
-            tech_lower = tech.lower()
-            
-            # Check for close matches
-            for known_tech in all_known_tech:
-                if known_tech in tech_lower or tech_lower in known_tech:
-                    if tech.lower() != known_tech:
-                        suggestions.append({
-                            'input': tech,
-                            'suggestion': known_tech.title()
-                        })
-                    break
+            suggestion = index.suggest(tech)
+            if suggestion:
+                suggestions.append({
+                    'input': tech,
+                    'suggestion': suggestion
+                })
         
         return suggestions
     
@@ -268,10 +274,8 @@ class InputValidator:
         if not text:
             return False
         
-        text_lower = text.lower().strip()
-        
-        return text_lower in Config.EXIT_KEYWORDS or \
-               any(keyword in text_lower for keyword in Config.EXIT_KEYWORDS)
+        # Whole words only: "done" exits, "abandoned" doesn't
+        return analyze_message(text).exit_intent
     
     @staticmethod
     def sanitize_input(text):
@@ -291,6 +295,6 @@ class InputValidator:
         text = ' '.join(text.split())
         
         # Remove potentially harmful characters (basic sanitization)
-        text = re.sub(r'[<>{}\\]', '', text)
+        text = UNSAFE_CHARACTERS.sub('', text)
         
         return text.strip()
\ No newline at end of file